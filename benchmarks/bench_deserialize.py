@@ -0,0 +1,116 @@
+"""Measure per-element deserialization cost of from_xml.
+
+Usage:
+    python benchmarks/bench_deserialize.py [--tracks N] [--notes N] [--points N] [--repeat N]
+
+Reports the cost of ``Project.from_xml`` per XML element of a synthetic
+project, and the per-call cost of ``from_xml`` for the model classes with
+the most child elements. The XML trees are built once up front, so only
+the deserialization itself is timed.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+def best_of(repeat, func):
+    """Return the fastest of ``repeat`` runs of ``func()``, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def sample_elements():
+    """One representative XML element per model class, keyed by class."""
+    from dawproject import (
+        Utility, Clip, Notes, Note, Send, Equalizer, EqBand, Compressor,
+        Transport, RealParameter, TimeSignatureParameter, Channel, Track,
+        ContentType, MixerRole, SendType, DeviceRole, EqBandType, Unit,
+    )
+
+    master = Utility.create_track("Master", set(), MixerRole.MASTER, 1.0, 0.5)
+    track = Utility.create_track("Synth", {ContentType.NOTES}, MixerRole.REGULAR, 0.8, 0.5)
+    channel = track.channel
+    channel.destination = master.channel
+    channel.sends.append(Send(volume=RealParameter(value=0.5), pan=RealParameter(value=0.5),
+                              destination=master.channel, type=SendType.POST))
+    channel.devices.append(Equalizer(
+        bands=[EqBand(freq=1000.0, gain=3.0, q=1.0, enabled=True, band_type=EqBandType.BELL)],
+        input_gain=0.0, output_gain=0.0, device_name="EQ", device_role=DeviceRole.AUDIO_FX,
+    ))
+    compressor = Compressor(threshold=-20.0, ratio=4.0, attack=0.01, release=0.1,
+                            input_gain=0.0, output_gain=0.0, auto_makeup=True,
+                            device_name="Compressor", device_role=DeviceRole.AUDIO_FX)
+    channel.devices.append(compressor)
+    clip = Clip(time=0.0, duration=4.0, content=Notes(notes=[
+        Note(time=i * 0.5, duration=0.5, key=60 + i, vel=0.8) for i in range(8)
+    ]))
+    transport = Transport(tempo=RealParameter(value=120.0, unit=Unit.BPM),
+                          time_signature=TimeSignatureParameter(numerator=4, denominator=4))
+    return {
+        Track: track.to_xml(),
+        Channel: channel.to_xml(),
+        Compressor: compressor.to_xml(),
+        Clip: clip.to_xml(),
+        Transport: transport.to_xml(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tracks", type=int, default=16)
+    parser.add_argument("--notes", type=int, default=2000)
+    parser.add_argument("--points", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from synthetic import create_large_project
+    from dawproject import Project, Referenceable
+
+    root = create_large_project(args.tracks, args.notes, args.points).to_xml()
+    elements = sum(1 for _ in root.iter())
+    Referenceable.reset_id()
+    elapsed = best_of(args.repeat, lambda: Project.from_xml(root))
+    print(f"Project.from_xml: {elements} elements, {elapsed:.3f} s, "
+          f"{elapsed / elements * 1e6:.2f} us/element")
+    Referenceable.reset_id()
+    elapsed = best_of(args.repeat, lambda: Project.from_xml(root, lazy=True))
+    print(f"Project.from_xml(lazy=True): {elapsed:.3f} s (timeline content left unparsed)")
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        from dawproject import ArrayReader, registry
+
+        Referenceable.reset_id()
+        elapsed = best_of(args.repeat, lambda: Project.from_xml(root, columnar=True))
+        print(f"Project.from_xml(columnar=True): {elapsed:.3f} s (notes in NoteArrays)")
+        dense = [element for element in root.iter("Notes", "Points", "Warps")]
+        Referenceable.reset_id()
+        elapsed = best_of(args.repeat, lambda: [registry.resolve_timeline(e.tag).from_xml(e) for e in dense])
+        print(f"Notes/Points/Warps from_xml: {elapsed:.3f} s")
+        elapsed = best_of(args.repeat, lambda: [ArrayReader.read(e) for e in dense])
+        print(f"Notes/Points/Warps ArrayReader.read: {elapsed:.3f} s (typed columns, no objects)")
+
+    calls = 2000
+    print(f"{'class':<12} {'us/call':>10}")
+    for cls, element in sample_elements().items():
+        Referenceable.reset_id()
+
+        def run():
+            for _ in range(calls):
+                cls.from_xml(element)
+
+        print(f"{cls.__name__:<12} {best_of(args.repeat, run) / calls * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
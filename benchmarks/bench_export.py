@@ -0,0 +1,79 @@
+"""Measure .dawproject export time with policy-driven, parallel compression.
+
+Usage:
+    python benchmarks/bench_export.py [--tracks N] [--notes N] [--points N]
+                                      [--stems N] [--stem-mb N] [--states N]
+
+The synthetic project is saved together with ``--stems`` WAV files of noise
+and ``--states`` compressible plugin-state blobs.  Modes:
+
+    deflate-all   every entry deflated on one thread (the previous behaviour
+                  with a deflating ZipFile)
+    policy-1      CompressionPolicy (audio stored), one worker
+    policy-N      CompressionPolicy, one worker per CPU
+
+Wall time of the parallel mode scales with the number of cores available
+for the compressed entries (XML and plugin state).
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from zipfile import ZIP_DEFLATED
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import create_large_project  # noqa: E402
+from dawproject import DawProject, CompressionPolicy, MetaData  # noqa: E402
+
+
+def create_sources(directory, stems, stem_mb, states):
+    embedded = {}
+    for i in range(stems):
+        path = os.path.join(directory, f"stem{i}.wav")
+        with open(path, "wb") as f:
+            f.write(b"RIFF\x00\x00\x00\x00WAVEfmt ")
+            for _ in range(stem_mb):
+                f.write(os.urandom(1024 * 1024))
+        embedded[path] = f"audio/stem{i}.wav"
+    for i in range(states):
+        state = (f"<preset id='{i}'>" + "<param value='0.5'/>" * 200_000 + "</preset>").encode()
+        embedded[state] = f"plugins/state{i}.vstpreset"
+    return embedded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tracks", type=int, default=16)
+    parser.add_argument("--notes", type=int, default=5000)
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--stems", type=int, default=8)
+    parser.add_argument("--stem-mb", type=int, default=16)
+    parser.add_argument("--states", type=int, default=8)
+    args = parser.parse_args()
+
+    project = create_large_project(args.tracks, args.notes, args.points)
+    metadata = MetaData(title="Benchmark")
+    cpus = os.cpu_count() or 1
+    deflate_all = CompressionPolicy(store_media=False, default_method=ZIP_DEFLATED)
+    modes = [
+        ("deflate-all", deflate_all, 1),
+        ("policy-1", CompressionPolicy(), 1),
+        (f"policy-{cpus}", CompressionPolicy(), cpus),
+    ]
+
+    print(f"{'mode':<12} {'time (s)':>10} {'archive (MB)':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        embedded = create_sources(tmp, args.stems, args.stem_mb, args.states)
+        for name, policy, workers in modes:
+            path = os.path.join(tmp, f"{name}.dawproject")
+            start = time.perf_counter()
+            DawProject.save(project, metadata, embedded, path, compression=policy, workers=workers)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<12} {elapsed:>10.3f} {os.path.getsize(path) / 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
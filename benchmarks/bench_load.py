@@ -0,0 +1,69 @@
+"""Compare peak memory and wall time of the full, streaming and parallel
+project loaders and of DawProject.summarize.
+
+Usage:
+    python benchmarks/bench_load.py [--tracks N] [--notes N] [--points N]
+
+Each loader runs in a fresh subprocess so that its peak resident set size
+is measured in isolation.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+def run_child(path, mode):
+    from synthetic import memory_kb
+    from dawproject import DawProject
+
+    baseline = memory_kb("VmRSS")
+    start = time.perf_counter()
+    if mode == "summary":
+        result = DawProject.summarize(path)
+    elif mode == "parallel":
+        result = DawProject.load_project(path, parallel=True)
+    else:
+        result = DawProject.load_project(path, streaming=(mode == "streaming"))
+    elapsed = time.perf_counter() - start
+    peak = memory_kb("VmHWM")
+    assert result is not None
+    print(f"{elapsed:.3f} {(peak - baseline) / 1024:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tracks", type=int, default=16)
+    parser.add_argument("--notes", type=int, default=5000)
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--child", nargs=2, metavar=("PATH", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    from synthetic import create_large_project
+    from dawproject import DawProject, MetaData
+
+    project = create_large_project(args.tracks, args.notes, args.points)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.dawproject")
+        DawProject.save(project, MetaData(title="Benchmark"), {}, path)
+        print(f"archive: {os.path.getsize(path) / 1e6:.1f} MB")
+        print(f"{'mode':<10} {'time (s)':>10} {'peak RSS delta (MB)':>22}")
+        for mode in ("full", "streaming", "parallel", "summary"):
+            output = subprocess.check_output(
+                [sys.executable, __file__, "--child", path, mode], text=True
+            )
+            elapsed, peak = output.split()
+            print(f"{mode:<10} {float(elapsed):>10.3f} {float(peak):>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Measure the memory held by the model objects of a large project.
+
+Usage:
+    python benchmarks/bench_memory.py [--tracks N] [--notes N] [--points N]
+
+Reports the bytes allocated per instance of the high-cardinality leaf
+classes (Note, the point classes, Warp, Marker, FileReference), and the
+memory held by a synthetic project built in memory and by the same project
+loaded back from XML, as traced by tracemalloc.
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+def traced_bytes(build):
+    """Return ``(result, bytes)`` for the memory still held by ``build()``'s result."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+def leaf_factories():
+    """A factory for one typical instance of each leaf class, keyed by class name."""
+    from dawproject import (
+        Note, RealPoint, BoolPoint, IntegerPoint, EnumPoint, TimeSignaturePoint,
+        Warp, Marker, FileReference, Interpolation,
+    )
+
+    return {
+        "Note": lambda i: Note(time=i * 0.25, duration=0.25, key=60, vel=0.8, rel=0.5),
+        "RealPoint": lambda i: RealPoint(time=i * 0.25, value=0.5, interpolation=Interpolation.LINEAR),
+        "BoolPoint": lambda i: BoolPoint(time=i * 0.25, value=True),
+        "IntegerPoint": lambda i: IntegerPoint(time=i * 0.25, value=3),
+        "EnumPoint": lambda i: EnumPoint(time=i * 0.25, value=2),
+        "TimeSignaturePoint": lambda i: TimeSignaturePoint(time=i * 0.25, numerator=4, denominator=4),
+        "Warp": lambda i: Warp(time=i * 0.25, content_time=i * 0.5),
+        "Marker": lambda i: Marker(time=i * 0.25, name="Marker"),
+        "FileReference": lambda i: FileReference(path="audio/file.wav"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tracks", type=int, default=16)
+    parser.add_argument("--notes", type=int, default=5000)
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--instances", type=int, default=100000)
+    args = parser.parse_args()
+
+    from synthetic import create_large_project
+    from dawproject import Project, Referenceable
+
+    count = args.instances
+    print(f"{'class':<20} {'bytes/instance':>15}")
+    for name, factory in leaf_factories().items():
+        _, size = traced_bytes(lambda: [factory(i) for i in range(count)])
+        # The list itself holds one pointer per instance
+        print(f"{name:<20} {size / count - 8:>15.1f}")
+
+    project, size = traced_bytes(lambda: create_large_project(args.tracks, args.notes, args.points))
+    print(f"built project:  {size / 1e6:.1f} MB")
+    root = project.to_xml()
+    del project
+    Referenceable.reset_id()
+    _, size = traced_bytes(lambda: Project.from_xml(root))
+    print(f"loaded project: {size / 1e6:.1f} MB (excluding the XML tree)")
+
+
+if __name__ == "__main__":
+    main()
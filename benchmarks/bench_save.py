@@ -0,0 +1,83 @@
+"""Compare the tree-building and streaming serializers used by DawProject.save.
+
+Usage:
+    python benchmarks/bench_save.py [--tracks N] [--notes N] [--points N]
+
+Modes:
+    tree      the previous implementation: project.to_xml() + ET.tostring
+    pretty    StreamingWriter with indentation (the DawProject.save default)
+    compact   StreamingWriter without indentation
+
+Each mode runs in a fresh subprocess that builds the synthetic project and
+then saves it; the reported memory is the peak growth during the save only.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from zipfile import ZipFile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+def save_tree(project, metadata, path):
+    from lxml import etree as ET
+
+    project_xml = ET.tostring(project.to_xml(), pretty_print=True, xml_declaration=True, encoding="UTF-8")
+    metadata_xml = ET.tostring(metadata.to_xml(), pretty_print=True, xml_declaration=True, encoding="UTF-8")
+    with ZipFile(path, "w") as zos:
+        zos.writestr("metadata.xml", metadata_xml)
+        zos.writestr("project.xml", project_xml)
+
+
+def run_child(args, path, mode):
+    from synthetic import create_large_project, memory_kb
+    from dawproject import DawProject, MetaData
+
+    project = create_large_project(args.tracks, args.notes, args.points)
+    metadata = MetaData(title="Benchmark")
+
+    baseline = memory_kb("VmRSS")
+    start = time.perf_counter()
+    if mode == "tree":
+        save_tree(project, metadata, path)
+    else:
+        DawProject.save(project, metadata, {}, path, pretty_print=(mode == "pretty"))
+    elapsed = time.perf_counter() - start
+    peak = memory_kb("VmHWM")
+
+    with ZipFile(path) as archive:
+        xml_size = archive.getinfo("project.xml").file_size
+    print(f"{elapsed:.3f} {(peak - baseline) / 1024:.1f} {xml_size / 1e6:.1f} {os.path.getsize(path) / 1e6:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tracks", type=int, default=16)
+    parser.add_argument("--notes", type=int, default=5000)
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--child", nargs=2, metavar=("PATH", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args, *args.child)
+        return
+
+    print(f"{'mode':<10} {'time (s)':>10} {'peak RSS delta (MB)':>22} {'project.xml (MB)':>18} {'archive (MB)':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("tree", "pretty", "compact"):
+            path = os.path.join(tmp, f"{mode}.dawproject")
+            output = subprocess.check_output(
+                [sys.executable, __file__, "--tracks", str(args.tracks), "--notes", str(args.notes),
+                 "--points", str(args.points), "--child", path, mode],
+                text=True,
+            )
+            elapsed, peak, xml_size, archive_size = output.split()
+            print(f"{mode:<10} {float(elapsed):>10.3f} {float(peak):>22.1f} {float(xml_size):>18.1f} {float(archive_size):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
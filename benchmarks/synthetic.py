@@ -0,0 +1,73 @@
+"""Helpers shared by the benchmark scripts: a synthetic large project and memory probes."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from dawproject import (  # noqa: E402
+    Project, Application, Transport, Arrangement, Lanes, Clips, Clip,
+    Notes, Note, Points, RealPoint, RealParameter, AutomationTarget,
+    Utility, ContentType, MixerRole, TimeUnit, Unit, Interpolation,
+    Referenceable,
+)
+
+
+def create_large_project(tracks=16, notes_per_track=5000, points_per_track=5000):
+    """Build a project with dense note and automation lanes.
+
+    Args:
+        tracks: Number of instrument tracks.
+        notes_per_track: Number of notes in each track's single clip.
+        points_per_track: Number of volume automation points per track.
+
+    Returns:
+        A Project instance.
+    """
+    Referenceable.reset_id()
+    project = Project(application=Application(name="Benchmark", version="1.0"))
+    project.transport = Transport(tempo=RealParameter(value=120.0, unit=Unit.BPM))
+
+    master = Utility.create_track("Master", set(), MixerRole.MASTER, 1.0, 0.5)
+    project.structure.append(master)
+
+    project.arrangement = Arrangement(lanes=Lanes(time_unit=TimeUnit.BEATS))
+    for t in range(tracks):
+        track = Utility.create_track(
+            f"Track {t}", {ContentType.NOTES}, MixerRole.REGULAR, 0.8, 0.5
+        )
+        track.channel.destination = master.channel
+        project.structure.append(track)
+
+        notes = Notes(notes=[
+            Note(time=i * 0.25, duration=0.25, key=36 + i % 48, vel=0.8, rel=0.5)
+            for i in range(notes_per_track)
+        ])
+        clip = Clip(time=0.0, duration=notes_per_track * 0.25, content=notes)
+
+        automation = Points(
+            target=AutomationTarget(parameter=track.channel.volume),
+            unit=Unit.LINEAR,
+            points=[
+                RealPoint(time=i * 0.25, value=(i % 100) / 100.0,
+                          interpolation=Interpolation.LINEAR)
+                for i in range(points_per_track)
+            ],
+        )
+        lane = Lanes(track=track, lanes=[Clips(clips=[clip]), automation])
+        project.arrangement.lanes.lanes.append(lane)
+
+    return project
+
+
+def memory_kb(field):
+    """Read a memory counter (VmRSS, VmHWM) of this process from /proc, in kB.
+
+    ru_maxrss is not used because Linux carries it over from the parent
+    process across fork/exec.
+    """
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    raise RuntimeError(f"{field} not available")
@@ -8,6 +8,19 @@ DAWProject format.
 
 # Main entry point
 from .dawProject import DawProject
+from .dawProjectArchive import DawProjectArchive
+from .streamingLoader import StreamingLoader
+from .loadFilter import LoadFilter
+from .parallelLoader import ParallelLoader
+from .idScope import IdScope
+from .referenceTable import ReferenceTable
+from .lazySubtree import LazySubtree
+from .streamingWriter import StreamingWriter
+from .embeddedStream import EmbeddedStream
+from .archiveWriter import ArchiveWriter, SaveReport
+from .compressionPolicy import CompressionPolicy
+from .schemaValidator import SchemaValidator, ArchiveValidationResult
+from .projectSummary import ProjectSummary
 
 # Project model
 from .project import Project
@@ -31,9 +44,12 @@ from .clip import Clip
 from .clipSlot import ClipSlot
 from .notes import Notes
 from .note import Note
+from .noteArray import NoteArray, NoteView
+from .arrayReader import ArrayReader
 from .markers import Markers
 from .marker import Marker
 from .points import Points
+from .pointArray import PointArray
 from .warps import Warps
 from .warp import Warp
 from .audio import Audio
@@ -90,6 +106,21 @@ from .point import Point
 __all__ = [
     # Main
     "DawProject",
+    "DawProjectArchive",
+    "StreamingLoader",
+    "LoadFilter",
+    "ParallelLoader",
+    "IdScope",
+    "ReferenceTable",
+    "LazySubtree",
+    "StreamingWriter",
+    "EmbeddedStream",
+    "ArchiveWriter",
+    "SaveReport",
+    "CompressionPolicy",
+    "SchemaValidator",
+    "ArchiveValidationResult",
+    "ProjectSummary",
     # Project model
     "Project",
     "Application",
@@ -110,9 +141,13 @@ __all__ = [
     "ClipSlot",
     "Notes",
     "Note",
+    "NoteArray",
+    "NoteView",
+    "ArrayReader",
     "Markers",
     "Marker",
     "Points",
+    "PointArray",
     "Warps",
     "Warp",
     "Audio",
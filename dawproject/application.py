@@ -1,9 +1,9 @@
 """Application model -- identifies the application that created the project."""
 
-from lxml import etree as ET
+from .fieldSpec import XmlModel, Attribute
 
 
-class Application:
+class Application(XmlModel):
     """Identifies the application that created this DAWproject file.
 
     Attributes:
@@ -11,22 +11,15 @@ class Application:
         version: Application version string.
     """
 
+    _xml_default_when_missing = True
+
     def __init__(self, name=None, version=None):
         self.name = name
         self.version = version
 
-    def to_xml(self):
-        application_elem = ET.Element("Application")
-        if self.name:
-            application_elem.set("name", self.name)
-        if self.version:
-            application_elem.set("version", self.version)
-        return application_elem
-
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return cls()
-        name = element.get("name")
-        version = element.get("version")
-        return cls(name, version)
+    def _xml_fields(cls):
+        return (
+            Attribute("name", "name"),
+            Attribute("version", "version"),
+        )
@@ -0,0 +1,521 @@
+"""ArchiveWriter -- writes .dawproject archives with per-entry compression on a worker pool.
+
+Compressed entries (XML and other non-media files) are serialized and
+compressed concurrently on a thread pool -- zlib and bz2 release the GIL
+while they work -- into spooled temporary buffers, then copied into the
+archive as pre-compressed data.  Stored entries (audio, video) are copied
+straight from their source.  Entries always appear in the archive in the
+order they were added, whatever order the workers finish in.
+"""
+
+import bz2
+import contextvars
+import hashlib
+import os
+import shutil
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+from zipfile import ZipFile, ZipInfo, ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2, ZIP64_LIMIT
+
+from .compressionPolicy import CompressionPolicy, SNIFF_SIZE
+from .embeddedStream import local_data_offset
+from .streamingWriter import StreamingWriter
+
+
+# Embedded files are copied into the archive in chunks of this many bytes
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Compressed entries are buffered in memory up to this size, then on disk
+SPOOL_MEMORY_LIMIT = 16 * 1024 * 1024
+
+# General purpose flag: sizes and CRC follow the data in a data descriptor
+_FLAG_DATA_DESCRIPTOR = 0x08
+_ZIP64_EXTRA_ID = 0x0001
+_EXTRA_HEADER = struct.Struct("<HH")
+
+
+def _strip_zip64_extra(extra):
+    """Remove ZIP64 extended information fields from an extra field block.
+
+    ZipInfo.FileHeader() appends a fresh ZIP64 field when one is needed, so
+    a copied entry must not carry the field over from its old header.
+    """
+    kept = []
+    position = 0
+    while position + _EXTRA_HEADER.size <= len(extra):
+        field_id, size = _EXTRA_HEADER.unpack_from(extra, position)
+        end = position + _EXTRA_HEADER.size + size
+        if field_id != _ZIP64_EXTRA_ID:
+            kept.append(extra[position:end])
+        position = end
+    return b"".join(kept)
+
+
+class SaveReport:
+    """Summary of the entries written by an ArchiveWriter.
+
+    Attributes:
+        duplicates: Dict mapping the path of each embedded file that was not
+            written, because its content duplicates an earlier entry, to the
+            path of that entry.
+        bytes_saved: Total (uncompressed) size of the duplicates not written.
+    """
+
+    def __init__(self):
+        self.duplicates = {}
+        self.bytes_saved = 0
+
+    def __repr__(self):
+        return f"SaveReport(duplicates={len(self.duplicates)}, bytes_saved={self.bytes_saved})"
+
+
+def _content_hash(data=b""):
+    return hashlib.sha256(data)
+
+
+class _HashingReader:
+    """Wraps a binary stream, hashing and counting the bytes read through it."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.hash = _content_hash()
+        self.size = 0
+
+    def read(self, size=-1):
+        data = self._stream.read(size)
+        self.hash.update(data)
+        self.size += len(data)
+        return data
+
+
+class _CompressedEntry:
+    """Compresses written data into a spooled buffer, tracking CRC and sizes."""
+
+    def __init__(self, compress_type, level, hashed=False):
+        if compress_type == ZIP_DEFLATED:
+            level = zlib.Z_DEFAULT_COMPRESSION if level is None else level
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        elif compress_type == ZIP_BZIP2:
+            self._compressor = bz2.BZ2Compressor(9 if level is None else level)
+        else:
+            raise ValueError(f"Unsupported compression method: {compress_type}")
+        self.buffer = SpooledTemporaryFile(max_size=SPOOL_MEMORY_LIMIT)
+        self.crc = 0
+        self.file_size = 0
+        self.compress_size = 0
+        self.hash = _content_hash() if hashed else None
+
+    def write(self, data):
+        if self.hash is not None:
+            self.hash.update(data)
+        self.crc = zlib.crc32(data, self.crc)
+        self.file_size += len(data)
+        self.buffer.write(self._compressor.compress(data))
+        return len(data)
+
+    def finish(self):
+        self.buffer.write(self._compressor.flush())
+        self.compress_size = self.buffer.tell()
+        self.buffer.seek(0)
+        return self
+
+
+class ArchiveWriter:
+    """Writes entries into a new zip archive, compressing them in parallel.
+
+    Example::
+
+        with ArchiveWriter("song.dawproject", workers=4) as writer:
+            writer.add_xml("metadata.xml", metadata)
+            writer.add_xml("project.xml", project)
+            writer.add("audio/drums.wav", "/path/to/drums.wav")
+
+    With ``deduplicate=True`` embedded files added with :meth:`add` are
+    hashed (SHA-256) as they stream through the writer, and a file whose
+    content equals an earlier one is not written; the ``report`` records
+    which path it duplicates. When the archive is written to a stream that
+    cannot seek, stored entries read from file objects or paths are first
+    spooled to a temporary buffer, since a duplicate cannot be truncated
+    away afterwards.
+
+    With ``mode="a"`` the entries are appended to an existing archive: an
+    added entry replaces any existing entry of the same name, whose data is
+    left behind as unreferenced space, and only the central directory is
+    rewritten when the writer is closed. If writing fails, the archive's
+    original central directory is restored, so that it lists the original
+    entries again.
+
+    Attributes:
+        policy: The CompressionPolicy choosing each entry's compression.
+        workers: Number of compression threads. With 1, entries are
+            compressed on the calling thread.
+        deduplicate: Whether to store identical embedded files only once.
+        report: A SaveReport, filled in as entries are written.
+    """
+
+    def __init__(self, file, policy=None, workers=None, mode="w", deduplicate=False):
+        if mode not in ("w", "a"):
+            raise ValueError(f"ArchiveWriter mode must be 'w' or 'a', not {mode!r}")
+        self.policy = policy if policy is not None else CompressionPolicy()
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self._zip_file = ZipFile(file, mode)
+        # The central directory of an archive appended to, restored if writing fails
+        zos = self._zip_file
+        self._original = (list(zos.filelist), dict(zos.NameToInfo), zos.start_dir) if mode == "a" else None
+        self._executor = ThreadPoolExecutor(self.workers) if self.workers > 1 else None
+        self.deduplicate = deduplicate
+        self.report = SaveReport()
+        # (size, digest) of each embedded file written so far -> its path
+        self._contents = {}
+        # Added but not yet written entries, in archive order
+        self._pending = deque()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._abort()
+
+    @property
+    def zip_file(self):
+        """The underlying ZipFile."""
+        return self._zip_file
+
+    def add_xml(self, path, obj, pretty_print=True):
+        """Add a model object (Project, MetaData, ...) serialized as an XML entry."""
+        compress_type, level = self.policy.choose(path)
+        if compress_type == ZIP_STORED:
+            self._enqueue(lambda: self._write_xml(path, obj, pretty_print))
+        else:
+            self._enqueue_compressed(
+                path, compress_type, level,
+                lambda sink: StreamingWriter.serialize(obj, sink, pretty_print),
+            )
+
+    def add(self, path, source):
+        """Add an embedded file.
+
+        Args:
+            path: Path of the entry within the archive.
+            source: The file content as bytes, a filesystem path (str or
+                os.PathLike), or a readable binary file object. Paths and
+                file objects are read in COPY_CHUNK_SIZE chunks. A file
+                object is read completely before ``add`` returns, so the
+                caller may close it afterwards.
+        """
+        compress_type, level = self.policy.choose(path)
+        if compress_type != ZIP_STORED and self.policy.sniff:
+            compress_type, level = self.policy.choose(path, self._head(source))
+        if compress_type == ZIP_STORED:
+            self._enqueue(lambda: self._write_stored(path, source))
+        else:
+            self._enqueue_compressed(
+                path, compress_type, level, lambda sink: self._copy_source(source, sink),
+                hashed=self.deduplicate,
+            )
+        if not isinstance(source, (bytes, bytearray, memoryview, str, os.PathLike)):
+            # Write the entry (and those before it) while the file object is open
+            self.flush()
+
+    def copy_entry(self, source, info):
+        """Copy an entry of another archive as raw compressed bytes.
+
+        The entry data is neither decompressed nor recompressed; only the
+        local file header is rebuilt.
+
+        Args:
+            source: Path of the archive to copy from.
+            info: The ZipInfo of the entry within ``source``.
+        """
+        self._enqueue(lambda: self._copy_raw(source, info))
+
+    def remove(self, path):
+        """Drop an entry from the archive being appended to (``mode="a"``).
+
+        Its data stays in the file but is no longer referenced by the
+        central directory.
+        """
+        self.flush()
+        self._forget(path)
+
+    def flush(self):
+        """Write all pending entries into the archive."""
+        while self._pending:
+            self._write_next()
+
+    def close(self):
+        """Write all pending entries and finish the archive."""
+        try:
+            self.flush()
+        except BaseException:
+            self._abort()
+            raise
+        if self._executor is not None:
+            self._executor.shutdown()
+        self._zip_file.close()
+
+    def _abort(self):
+        if self._executor is not None:
+            for _, job in self._pending:
+                if job is not None:
+                    job.cancel()
+            self._executor.shutdown()
+        self._pending.clear()
+        if self._original is not None:
+            # New entries were written over the old central directory; write it
+            # again at its old offset (closing truncates the appended data)
+            zos = self._zip_file
+            filelist, name_to_info, start_dir = self._original
+            zos.filelist[:] = filelist
+            zos.NameToInfo.clear()
+            zos.NameToInfo.update(name_to_info)
+            zos.start_dir = start_dir
+            zos._didModify = True
+        self._zip_file.close()
+
+    # -- scheduling ---------------------------------------------------------
+
+    def _enqueue(self, write):
+        self._pending.append((write, None))
+        self._drain()
+
+    def _enqueue_compressed(self, path, compress_type, level, produce, hashed=False):
+        def compress():
+            entry = _CompressedEntry(compress_type, level, hashed)
+            try:
+                produce(entry)
+                return entry.finish()
+            except BaseException:
+                entry.buffer.close()
+                raise
+
+        zinfo = self._new_info(path, compress_type)
+        if self._executor is not None:
+            # In the caller's context, so that IDs allocated while serializing
+            # come from the caller's IdScope
+            job = self._executor.submit(contextvars.copy_context().run, compress)
+            self._pending.append((lambda: self._write_compressed(zinfo, job.result()), job))
+        else:
+            self._pending.append((lambda: self._write_compressed(zinfo, compress()), None))
+        self._drain()
+
+    def _drain(self):
+        """Write finished entries from the head of the queue, bounding the work in flight."""
+        limit = 2 * self.workers
+        while self._pending and (len(self._pending) > limit or self._is_ready(self._pending[0])):
+            self._write_next()
+
+    @staticmethod
+    def _is_ready(pending):
+        _, job = pending
+        # Entries without a job (stored, copied) are written on the calling thread
+        return job is None or job.done()
+
+    def _write_next(self):
+        write, _ = self._pending.popleft()
+        write()
+
+    # -- writing --------------------------------------------------------------
+
+    def _forget(self, path):
+        """Unlist an existing entry so that a new one can take its name."""
+        zos = self._zip_file
+        info = zos.NameToInfo.pop(path, None)
+        if info is not None:
+            zos.filelist.remove(info)
+            zos._didModify = True
+
+    def _new_info(self, path, compress_type):
+        zinfo = ZipInfo(path, date_time=time.localtime(time.time())[:6])
+        zinfo.compress_type = compress_type
+        zinfo.external_attr = 0o600 << 16
+        return zinfo
+
+    def _write_xml(self, path, obj, pretty_print):
+        self._forget(path)
+        with self._zip_file.open(self._new_info(path, ZIP_STORED), "w") as entry:
+            StreamingWriter.serialize(obj, entry, pretty_print)
+
+    def _is_duplicate(self, path, size, digest):
+        """Record an embedded file's content; True if it was already written."""
+        key = (size, digest)
+        original = self._contents.get(key)
+        if original is None:
+            self._contents[key] = path
+            return False
+        self.report.duplicates[path] = original
+        self.report.bytes_saved += size
+        return True
+
+    def _write_stored(self, path, source):
+        self._forget(path)
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            data = bytes(source)
+            if self.deduplicate and self._is_duplicate(path, len(data), _content_hash(data).digest()):
+                return
+            self._zip_file.writestr(self._new_info(path, ZIP_STORED), data)
+        elif isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as stream:
+                self._copy_stream_to_zip(path, stream)
+        else:
+            self._copy_stream_to_zip(path, source)
+
+    def _copy_stream_to_zip(self, path, stream):
+        """Copy the remainder of a binary stream into a new stored entry in chunks.
+
+        When the size of the stream cannot be determined up front, the entry
+        is written with ZIP64 extensions so it may exceed 4 GB.
+        """
+        if self.deduplicate and not self._zip_file._seekable:
+            # A duplicate cannot be truncated away from an unseekable sink,
+            # so the stream is hashed into a spooled buffer first.
+            reader = _HashingReader(stream)
+            with SpooledTemporaryFile(max_size=SPOOL_MEMORY_LIMIT) as spool:
+                shutil.copyfileobj(reader, spool, COPY_CHUNK_SIZE)
+                if not self._is_duplicate(path, reader.size, reader.hash.digest()):
+                    spool.seek(0)
+                    self._write_stream(self._new_info(path, ZIP_STORED), spool, reader.size)
+            return
+
+        zinfo = self._new_info(path, ZIP_STORED)
+        size = self._remaining_size(stream)
+        # A stored entry is hashed while it is copied, so a duplicate can
+        # only be dropped afterwards by truncating the archive again.
+        hashing = self.deduplicate
+        if hashing:
+            stream = _HashingReader(stream)
+        self._write_stream(zinfo, stream, size)
+
+        if hashing and self._is_duplicate(path, stream.size, stream.hash.digest()):
+            self._discard_last(zinfo)
+
+    def _write_stream(self, zinfo, stream, size):
+        """Copy a binary stream into a new stored entry; ``size`` may be None."""
+        if size is not None:
+            zinfo.file_size = size
+        force_zip64 = size is None or size > ZIP64_LIMIT
+        with self._zip_file.open(zinfo, "w", force_zip64=force_zip64) as entry:
+            shutil.copyfileobj(stream, entry, COPY_CHUNK_SIZE)
+
+    def _discard_last(self, zinfo):
+        """Remove the entry just written from the end of the archive."""
+        zos = self._zip_file
+        with zos._lock:
+            zos.filelist.remove(zinfo)
+            del zos.NameToInfo[zinfo.filename]
+            zos.fp.seek(zinfo.header_offset)
+            zos.fp.truncate()
+            zos.start_dir = zinfo.header_offset
+
+    def _write_compressed(self, zinfo, entry):
+        """Append an entry whose data has already been compressed."""
+        with entry.buffer:
+            if entry.hash is not None and self._is_duplicate(
+                zinfo.filename, entry.file_size, entry.hash.digest()
+            ):
+                return
+            zinfo.CRC = entry.crc
+            zinfo.file_size = entry.file_size
+            zinfo.compress_size = entry.compress_size
+            self.write_raw(zinfo, entry.buffer)
+
+    def write_raw(self, zinfo, stream):
+        """Append an entry from already-compressed data.
+
+        ``zinfo`` must carry the final compress_type, CRC, file_size and
+        compress_size; ``stream`` yields exactly compress_size bytes of
+        compressed data, which are copied into the archive unchanged.
+        """
+        zos = self._zip_file
+        self._forget(zinfo.filename)
+        zos._writecheck(zinfo)
+        zos._didModify = True
+        zip64 = zinfo.file_size > ZIP64_LIMIT or zinfo.compress_size > ZIP64_LIMIT
+        with zos._lock:
+            if zos._seekable:
+                zos.fp.seek(zos.start_dir)
+            zinfo.header_offset = zos.fp.tell()
+            zos.fp.write(zinfo.FileHeader(zip64))
+            remaining = zinfo.compress_size
+            while remaining:
+                chunk = stream.read(min(remaining, COPY_CHUNK_SIZE))
+                if not chunk:
+                    raise IOError(f"Unexpected end of data for entry {zinfo.filename!r}")
+                zos.fp.write(chunk)
+                remaining -= len(chunk)
+            zos.start_dir = zos.fp.tell()
+            zos.filelist.append(zinfo)
+            zos.NameToInfo[zinfo.filename] = zinfo
+
+    def _copy_raw(self, source, info):
+        zinfo = ZipInfo(info.filename, info.date_time)
+        zinfo.compress_type = info.compress_type
+        zinfo.comment = info.comment
+        zinfo.extra = _strip_zip64_extra(info.extra)
+        zinfo.create_system = info.create_system
+        zinfo.create_version = info.create_version
+        zinfo.extract_version = info.extract_version
+        zinfo.internal_attr = info.internal_attr
+        zinfo.external_attr = info.external_attr
+        # Sizes and CRC are known, so they go in the local header instead
+        zinfo.flag_bits = info.flag_bits & ~_FLAG_DATA_DESCRIPTOR
+        zinfo.CRC = info.CRC
+        zinfo.file_size = info.file_size
+        zinfo.compress_size = info.compress_size
+        with open(source, "rb") as fp:
+            fp.seek(local_data_offset(fp, info))
+            self.write_raw(zinfo, fp)
+
+    # -- sources --------------------------------------------------------------
+
+    @staticmethod
+    def _copy_source(source, sink):
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            sink.write(source)
+        elif isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as stream:
+                shutil.copyfileobj(stream, sink, COPY_CHUNK_SIZE)
+        else:
+            shutil.copyfileobj(source, sink, COPY_CHUNK_SIZE)
+
+    @staticmethod
+    def _head(source):
+        """Return the first bytes of a source without consuming it, if possible."""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return bytes(source[:SNIFF_SIZE])
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as stream:
+                return stream.read(SNIFF_SIZE)
+        try:
+            if source.seekable():
+                position = source.tell()
+                head = source.read(SNIFF_SIZE)
+                source.seek(position)
+                return head
+        except (AttributeError, OSError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _remaining_size(stream):
+        """Return the number of bytes left in a stream, or None if unknown."""
+        try:
+            return os.fstat(stream.fileno()).st_size - stream.tell()
+        except (AttributeError, OSError, ValueError):
+            pass
+        try:
+            if stream.seekable():
+                position = stream.tell()
+                end = stream.seek(0, os.SEEK_END)
+                stream.seek(position)
+                return end - position
+        except (AttributeError, OSError, ValueError):
+            pass
+        return None
@@ -1,6 +1,7 @@
 """Arrangement model -- the main timeline arrangement."""
 
 from .referenceable import Referenceable
+from .fieldSpec import Child
 
 
 class Arrangement(Referenceable):
@@ -29,54 +30,14 @@ class Arrangement(Referenceable):
         self.markers = markers
         self.lanes = lanes
 
-    def to_xml(self):
-        arrangement_elem = super().to_xml()
-
-        # XSD sequence order: Lanes, Markers, TempoAutomation, TimeSignatureAutomation
-        if self.lanes is not None:
-            arrangement_elem.append(self.lanes.to_xml())
-
-        if self.markers is not None:
-            arrangement_elem.append(self.markers.to_xml())
-
-        if self.tempo_automation is not None:
-            tempo_elem = self.tempo_automation.to_xml()
-            tempo_elem.tag = "TempoAutomation"
-            arrangement_elem.append(tempo_elem)
-
-        if self.time_signature_automation is not None:
-            ts_elem = self.time_signature_automation.to_xml()
-            ts_elem.tag = "TimeSignatureAutomation"
-            arrangement_elem.append(ts_elem)
-
-        return arrangement_elem
-
     @classmethod
-    def from_xml(cls, element):
+    def _xml_fields(cls):
         from .points import Points
         from .markers import Markers
         from .lanes import Lanes
-
-        instance = super().from_xml(element)
-
-        ts_automation_elem = element.find("TimeSignatureAutomation")
-        instance.time_signature_automation = (
-            Points.from_xml(ts_automation_elem)
-            if ts_automation_elem is not None
-            else None
-        )
-
-        tempo_automation_elem = element.find("TempoAutomation")
-        instance.tempo_automation = (
-            Points.from_xml(tempo_automation_elem)
-            if tempo_automation_elem is not None
-            else None
+        return (
+            Child("Lanes", "lanes", Lanes),
+            Child("Markers", "markers", Markers),
+            Child("TempoAutomation", "tempo_automation", Points),
+            Child("TimeSignatureAutomation", "time_signature_automation", Points),
         )
-
-        markers_elem = element.find("Markers")
-        instance.markers = Markers.from_xml(markers_elem) if markers_elem is not None else None
-
-        lanes_elem = element.find("Lanes")
-        instance.lanes = Lanes.from_xml(lanes_elem) if lanes_elem is not None else None
-
-        return instance
@@ -0,0 +1,169 @@
+"""ArrayReader -- typed NumPy columns read straight from dense timeline XML."""
+
+from operator import attrgetter
+
+from lxml import etree as ET
+
+from .interpolation import Interpolation
+from .streamingLoader import LARGE_FILE_PARSER_OPTIONS
+
+
+# Interpolation codes of the RealPoint "interpolation" column; -1 marks a missing value
+INTERPOLATION_CODES = {member.value: code for code, member in enumerate(Interpolation)}
+
+# The columns read for each element tag: (XML attribute, dtype, text used when
+# the attribute is missing). "interpolation" columns hold INTERPOLATION_CODES.
+LAYOUTS = {
+    "Note": (
+        ("time", "float64", "nan"),
+        ("duration", "float64", "nan"),
+        ("key", "int32", "0"),
+        ("channel", "int32", "0"),
+        ("vel", "float64", "nan"),
+        ("rel", "float64", "nan"),
+    ),
+    "RealPoint": (("time", "float64", "nan"), ("value", "float64", "nan"), ("interpolation", "interpolation", None)),
+    "BoolPoint": (("time", "float64", "nan"), ("value", "bool", None)),
+    "IntegerPoint": (("time", "float64", "nan"), ("value", "int64", "0")),
+    "EnumPoint": (("time", "float64", "nan"), ("value", "int64", "0")),
+    "TimeSignaturePoint": (("time", "float64", "nan"), ("numerator", "int32", "0"), ("denominator", "int32", "0")),
+    "Warp": (("time", "float64", "0"), ("contentTime", "float64", "0")),
+}
+
+# The timelines whose children ArrayReader reads
+DENSE_TIMELINES = ("Notes", "Points", "Warps")
+
+_MISSING = (None, "", "null")
+_attrib = attrgetter("attrib")
+
+
+class ArrayReader:
+    """Reads the children of Notes, Points and Warps elements into typed NumPy arrays.
+
+    No model object is created per element: each attribute is extracted
+    for all elements of a tag at once and converted to a typed column by
+    NumPy (see LAYOUTS for the columns and dtypes of each tag). Callers
+    that only analyze note or automation data can skip the object model
+    entirely::
+
+        with open("project.xml", "rb") as stream:
+            for element, columns in ArrayReader.iterparse(stream):
+                if "Note" in columns:
+                    keys = columns["Note"]["key"]
+
+    Missing float values read as NaN, missing integers as 0, a missing
+    RealPoint interpolation as -1. Per-note content and unknown XML are
+    not read; NoteArray and PointArray build on this reader and keep them.
+
+    NumPy is an optional dependency (``pip install dawproject[columnar]``).
+    """
+
+    @staticmethod
+    def read_columns(elements, tag):
+        """Read elements of one tag into columns.
+
+        Args:
+            elements: The elements (all with tag ``tag``).
+            tag: A key of LAYOUTS.
+
+        Returns:
+            ``(columns, irregular)``: a dict mapping each XML attribute of
+            the layout to its array, and the indexes of the elements that
+            have child elements or attributes outside the layout.
+        """
+        import numpy as np
+
+        layout = LAYOUTS[tag]
+        names = tuple(name for name, _, _ in layout)
+        elements = list(elements)
+        size = len(elements)
+        # One pass over the elements, then one text tuple per attribute
+        rows = [tuple(map(element.get, names)) for element in elements]
+        texts = list(zip(*rows)) if rows else [()] * len(names)
+        columns = {}
+        # Number of the layout's attributes present on each element
+        present = np.full(size, len(layout))
+        for (name, dtype, missing), column in zip(layout, texts):
+            if None in column:
+                present -= np.array([text is None for text in column], dtype=bool)
+            columns[name] = _column(column, dtype, missing)
+        # Every element has at least its present layout attributes, so equal
+        # totals mean that no element has others; the per-element check is
+        # only needed when there are extra attributes or child elements.
+        irregular = []
+        if any(map(len, elements)) or sum(map(len, map(_attrib, elements))) != present.sum():
+            # An element with children counts as -1 attributes, so that it is irregular too
+            counts = np.array([-1 if len(element) else len(element.attrib) for element in elements], dtype=int)
+            irregular = np.flatnonzero(counts != present).tolist()
+        return columns, irregular
+
+    @classmethod
+    def read(cls, element):
+        """Read the children of a Notes, Points or Warps element.
+
+        Returns:
+            A dict mapping each child tag present (e.g. "Note" or
+            "RealPoint") to its columns, as returned by ``read_columns``.
+        """
+        result = {}
+        for tag in LAYOUTS:
+            children = list(element.iterchildren(tag))
+            if children:
+                result[tag] = cls.read_columns(children, tag)[0]
+        return result
+
+    @classmethod
+    def iterparse(cls, source, tags=DENSE_TIMELINES, parser_options=None):
+        """Read the dense timelines of a project.xml document as it is parsed.
+
+        Each timeline element is yielded with its columns when it closes,
+        and cleared afterwards. Everything parsed before it (its preceding
+        siblings and those of its ancestors) is then freed too, so that
+        memory use is bounded by the largest timeline rather than the
+        document; a timeline nested in another one (the expression Points
+        of a note) is freed with the outer timeline.
+
+        Args:
+            source: Path to an XML file, or a readable binary stream.
+            tags: The timeline tags to read.
+            parser_options: Keyword arguments overriding
+                LARGE_FILE_PARSER_OPTIONS.
+
+        Yields:
+            ``(element, columns)``: the timeline element (with its
+            attributes, such as ``id`` and ``track``) and ``read(element)``.
+        """
+        options = dict(LARGE_FILE_PARSER_OPTIONS)
+        if parser_options:
+            options.update(parser_options)
+        tags = (tags,) if isinstance(tags, str) else tuple(tags)
+        for _, element in ET.iterparse(source, events=("end",), tag=tags, **options):
+            yield element, cls.read(element)
+            element.clear(keep_tail=False)
+            ancestors = list(element.iterancestors())
+            if any(ancestor.tag in tags for ancestor in ancestors):
+                continue
+            for node in [element] + ancestors:
+                while node.getprevious() is not None:
+                    del node.getparent()[0]
+
+
+def _column(texts, dtype, missing):
+    """Convert attribute texts (None where missing) to a typed array."""
+    import numpy as np
+
+    if dtype == "interpolation":
+        codes = []
+        for text in texts:
+            code = INTERPOLATION_CODES.get(text, -1)
+            if code < 0 and text not in _MISSING:
+                raise ValueError(f"{text!r} is not a valid Interpolation")
+            codes.append(code)
+        return np.array(codes, dtype="int8")
+    if dtype == "bool":
+        return np.array([text is not None and text.lower() == "true" for text in texts], dtype=bool)
+    if None in texts or "" in texts or "null" in texts:
+        texts = [missing if text in _MISSING else text for text in texts]
+    if not texts:
+        return np.empty(0, dtype=dtype)
+    return np.array(texts, dtype=dtype)
@@ -2,6 +2,7 @@
 
 from .mediaFile import MediaFile
 from .timeUnit import TimeUnit
+from .fieldSpec import Attribute, INTEGER, enum_codec
 
 
 class Audio(MediaFile):
@@ -32,27 +33,12 @@ class Audio(MediaFile):
         if self.time_unit is None:
             self.time_unit = TimeUnit.SECONDS
 
-    def to_xml(self):
-        elem = super().to_xml()  # MediaFile -> Timeline -> Referenceable -> Nameable
-        elem.set("sampleRate", str(self.sample_rate))
-        elem.set("channels", str(self.channels))
-        if self.algorithm:
-            elem.set("algorithm", self.algorithm)
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return None
-
-        instance = super().from_xml(element)  # MediaFile.from_xml handles file, duration, etc.
-
-        instance.sample_rate = int(element.get("sampleRate", 44100))
-        instance.channels = int(element.get("channels", 2))
-        instance.algorithm = element.get("algorithm")
-
-        # Default time_unit for Audio is SECONDS
-        if instance.time_unit is None:
-            instance.time_unit = TimeUnit.SECONDS
-
-        return instance
+    def _xml_fields(cls):
+        return (
+            # Default time_unit for Audio is SECONDS
+            Attribute("timeUnit", "time_unit", enum_codec(TimeUnit, invalid="none"), default=TimeUnit.SECONDS),
+            Attribute("sampleRate", "sample_rate", INTEGER, default=44100),
+            Attribute("channels", "channels", INTEGER, default=2),
+            Attribute("algorithm", "algorithm"),
+        )
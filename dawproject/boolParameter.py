@@ -1,6 +1,7 @@
 """BoolParameter model -- a boolean-valued parameter."""
 
 from .parameter import Parameter
+from .fieldSpec import Attribute, BOOLEAN
 
 
 class BoolParameter(Parameter):
@@ -16,18 +17,6 @@ class BoolParameter(Parameter):
         super().__init__(parameter_id, name, color, comment)
         self.value = value
 
-    def to_xml(self):
-        bool_param_elem = super().to_xml()
-        bool_param_elem.tag = "BoolParameter"
-        if self.value is not None:
-            bool_param_elem.set("value", str(self.value).lower())
-        return bool_param_elem
-
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return None
-        instance = super().from_xml(element)
-        value = element.get("value")
-        instance.value = value.lower() == "true" if value else None
-        return instance
+    def _xml_fields(cls):
+        return (Attribute("value", "value", BOOLEAN),)
@@ -1,6 +1,7 @@
 """BoolPoint model -- a boolean automation point."""
 
 from .point import Point
+from .fieldSpec import Attribute, BOOLEAN
 
 
 class BoolPoint(Point):
@@ -11,20 +12,12 @@ class BoolPoint(Point):
         value: Boolean value of this point.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, time=None, value=None):
         super().__init__(time)
         self.value = value
 
-    def to_xml(self):
-        elem = super().to_xml()
-        elem.tag = "BoolPoint"
-        if self.value is not None:
-            elem.set("value", str(self.value).lower())
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
-        instance = super().from_xml(element)
-        value = element.get("value")
-        instance.value = value.lower() == "true" if value is not None else None
-        return instance
+    def _xml_fields(cls):
+        return (Attribute("value", "value", BOOLEAN),)
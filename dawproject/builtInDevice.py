@@ -10,7 +10,16 @@ class BuiltinDevice(Device):
     builtinDevice is an empty extension of device). Concrete devices like
     Equalizer and Compressor extend this class and add their own elements.
     """
-    pass
+
+    def _set_parameters(self, kind, **values):
+        """Set parameter attributes, wrapping plain values in ``kind``.
+
+        A None value leaves the attribute unset, so that its empty parameter
+        is only created if it is accessed (see OnDemand).
+        """
+        for attribute, value in values.items():
+            if value is not None:
+                setattr(self, attribute, value if isinstance(value, kind) else kind(value))
 
 
 # Backward-compatible alias
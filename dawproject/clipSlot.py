@@ -2,6 +2,7 @@
 
 from .timeline import Timeline
 from .clip import Clip
+from .fieldSpec import Attribute, Child, BOOLEAN
 
 
 class ClipSlot(Timeline):
@@ -19,25 +20,9 @@ class ClipSlot(Timeline):
         self.has_stop = has_stop
         self.clip = clip
 
-    def to_xml(self):
-        elem = super().to_xml()
-        if self.has_stop is not None:
-            elem.set("hasStop", str(self.has_stop).lower())
-        if self.clip is not None:
-            elem.append(self.clip.to_xml())
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return None
-
-        instance = super().from_xml(element)
-
-        has_stop = element.get("hasStop")
-        instance.has_stop = has_stop.lower() == "true" if has_stop is not None else None
-
-        clip_elem = element.find("Clip")
-        instance.clip = Clip.from_xml(clip_elem) if clip_elem is not None else None
-
-        return instance
+    def _xml_fields(cls):
+        return (
+            Attribute("hasStop", "has_stop", BOOLEAN),
+            Child("Clip", "clip", Clip),
+        )
@@ -2,6 +2,7 @@
 
 from .timeline import Timeline
 from .clip import Clip
+from .fieldSpec import Children
 
 
 class Clips(Timeline):
@@ -23,19 +24,6 @@ class Clips(Timeline):
         super().__init__(track, time_unit, name, color, comment)
         self.clips = clips if clips else []
 
-    def to_xml(self):
-        elem = super().to_xml()
-        for clip in self.clips:
-            elem.append(clip.to_xml())
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
-        instance = super().from_xml(element)
-
-        clips = []
-        for clip_elem in element.findall("Clip"):
-            clips.append(Clip.from_xml(clip_elem))
-        instance.clips = clips
-
-        return instance
+    def _xml_fields(cls):
+        return (Children("Clip", "clips", Clip),)
@@ -0,0 +1,259 @@
+"""ColumnStore -- typed NumPy columns holding one XML element per row."""
+
+from lxml import etree as ET
+
+from .arrayReader import ArrayReader, LAYOUTS, INTERPOLATION_CODES
+
+
+# NumPy dtype of the ArrayReader pseudo dtypes
+_DTYPES = {"interpolation": "int8", "bool": "bool"}
+# Interpolation value by code
+_INTERPOLATIONS = tuple(INTERPOLATION_CODES)
+
+
+class ColumnStore:
+    """Base class of the columnar stores (NoteArray, PointArray).
+
+    A store holds elements of one tag as parallel NumPy arrays, one column
+    per XML attribute of the tag's ArrayReader layout, in XML order. A
+    missing value is NaN in a float column and -1 in an interpolation
+    column; neither is written. Rare per-row values (such as the unknown
+    XML kept from a loaded element) live in sparse dicts keyed by row,
+    named in ``_sparse``, and follow their row when the store is sorted or
+    indexed.
+
+    Columns are read as attributes (``store.time``) and returned as array
+    views, so in-place operations write through; assigning to a column
+    attribute writes the values into the column. Indexing with a slice
+    returns a store whose columns are views into this one; a boolean mask
+    or an index array returns a copy. Appending grows the columns
+    geometrically (and first copies columns that are views).
+
+    The whole store is written with ``append_to`` or ``write_to``, which
+    generate the XML text of all rows and parse it in one call rather than
+    building the elements one by one.
+
+    Attributes:
+        tag: The element tag of the rows.
+        unknown: Dict mapping a row to the UnknownContent of its element.
+    """
+
+    # Names of the dicts mapping a row to a rare per-row value
+    _sparse = ("unknown",)
+
+    def _init_columns(self, tag, given):
+        """Set up the columns of ``tag`` from ``given`` (column name -> array-like or None)."""
+        import numpy as np
+
+        layout = LAYOUTS[tag]
+        first = given.get(layout[0][0])
+        size = len(first) if first is not None else 0
+        data = {}
+        for name, dtype, _ in layout:
+            dtype = _DTYPES.get(dtype, dtype)
+            values = given.get(name)
+            if values is None:
+                values = np.full(size, _fill(dtype, name), dtype=dtype)
+            else:
+                values = np.asarray(values, dtype=dtype)
+            if values.shape != (size,):
+                raise ValueError(f"{type(self).__name__} column {name!r} has {len(values)} values, expected {size}")
+            data[name] = values
+        self._set_state(tag, data, size, [{} for _ in self._sparse])
+
+    def _set_state(self, tag, data, size, tables):
+        set = object.__setattr__
+        set(self, "tag", tag)
+        set(self, "_data", data)
+        set(self, "_size", size)
+        for name, table in zip(self._sparse, tables):
+            set(self, name, table)
+
+    def _new(self, data, size, tables):
+        store = self.__class__.__new__(self.__class__)
+        store._set_state(self.tag, data, size, tables)
+        return store
+
+    @classmethod
+    def _read_elements(cls, elements, tag, parse):
+        """Return a store of ``elements``, read in bulk by ArrayReader.
+
+        Elements with children or unknown attributes are also parsed in
+        full by ``parse`` (the ``from_xml`` of the row class), to fill the
+        sparse tables.
+        """
+        elements = list(elements)
+        data, irregular = ArrayReader.read_columns(elements, tag)
+        store = cls.__new__(cls)
+        store._set_state(tag, data, len(elements), [{} for _ in cls._sparse])
+        for row in irregular:
+            store._keep(row, parse(elements[row]))
+        return store
+
+    def _keep(self, row, obj):
+        """Keep the sparse values of ``obj``, the model object of an irregular row."""
+        if obj._xml_unknown is not None:
+            self.unknown[row] = obj._xml_unknown
+
+    def column(self, name):
+        """Return the column ``name`` as an array view (writes go through)."""
+        return self._data[name][:self._size]
+
+    @property
+    def columns(self):
+        """The column names, in XML order."""
+        return tuple(self._data)
+
+    def __getattr__(self, name):
+        data = self.__dict__.get("_data")
+        if data is not None and name in data:
+            return data[name][:self._size]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name, value):
+        data = self.__dict__.get("_data")
+        if data is not None and name in data:
+            data[name][:self._size] = value
+        else:
+            object.__setattr__(self, name, value)
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._size} {self.tag} rows)"
+
+    def _select(self, index):
+        """Return a store of the rows selected by a slice, a boolean mask or an index array."""
+        import numpy as np
+
+        if isinstance(index, slice):
+            rows = range(self._size)[index]
+            data = {name: self.column(name)[index] for name in self._data}
+        else:
+            rows = np.arange(self._size)[index]
+            if rows.ndim != 1:
+                raise IndexError(f"{type(self).__name__} supports one-dimensional indexing only")
+            data = {name: self.column(name)[rows] for name in self._data}
+            rows = rows.tolist()
+        return self._new(data, len(rows), self._sparse_rows(rows))
+
+    def _row(self, index):
+        """Return the row number of an integer index (negative ones count from the end)."""
+        row = int(index)
+        if row < 0:
+            row += self._size
+        if not 0 <= row < self._size:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return row
+
+    def _sparse_rows(self, rows):
+        """Return the sparse tables re-keyed for the selected ``rows``."""
+        tables = []
+        for name in self._sparse:
+            table = getattr(self, name)
+            selected = {}
+            if table:
+                for new, old in enumerate(rows):
+                    value = table.get(old)
+                    if value is not None:
+                        selected[new] = value
+            tables.append(selected)
+        return tables
+
+    def _reorder(self, order):
+        """Put the rows in the order of the index array ``order``, in place."""
+        data = self._data
+        for name in data:
+            data[name] = self.column(name)[order]
+        for name, table in zip(self._sparse, self._sparse_rows(order.tolist())):
+            object.__setattr__(self, name, table)
+
+    def _reserve(self, size):
+        import numpy as np
+
+        capacity = len(self._data[self.columns[0]])
+        if size <= capacity:
+            return
+        # Grow geometrically (this also copies columns that are views into another array)
+        capacity = max(size, 2 * capacity, 16)
+        for name, values in self._data.items():
+            grown = np.empty(capacity, dtype=values.dtype)
+            grown[:self._size] = values[:self._size]
+            self._data[name] = grown
+
+    def _extend_rows(self, other):
+        """Append the rows of a store with the same columns."""
+        start, count = self._size, len(other)
+        self._reserve(start + count)
+        for name in self._data:
+            self._data[name][start:start + count] = other.column(name)
+        object.__setattr__(self, "_size", start + count)
+        for name in self._sparse:
+            getattr(self, name).update((start + row, value) for row, value in getattr(other, name).items())
+
+    def _fragment(self, tag):
+        """Return an element holding an element per row.
+
+        The elements are not built one by one: their XML text is generated
+        from the columns (numbers need no escaping) and parsed in one call,
+        which is much faster for dense data.
+        """
+        import numpy as np
+
+        columns = []
+        for name, dtype, _ in LAYOUTS[self.tag]:
+            values = self.column(name)
+            if dtype == "interpolation":
+                texts = [f' {name}="{value}"' for value in _INTERPOLATIONS] + [""]
+                # Code -1 picks the trailing ""
+                column = [texts[code] for code in values.tolist()]
+            elif dtype == "bool":
+                true, false = f' {name}="true"', f' {name}="false"'
+                column = [true if value else false for value in values.tolist()]
+            else:
+                # "%s" writes a float as str() does, like the DOUBLE codec
+                text = f' {name}="%s"'
+                column = [text % value for value in values.tolist()]
+                if dtype.startswith("float"):
+                    for row in np.flatnonzero(np.isnan(values)).tolist():
+                        column[row] = ""
+            columns.append(column)
+        row = f"<{tag}{'%s' * len(columns)}/>"
+        text = "".join([row % values for values in zip(*columns)])
+        fragment = ET.fromstring(f"<_>{text}</_>", ET.XMLParser(huge_tree=True))
+        if any(getattr(self, name) for name in self._sparse):
+            self._decorate(list(fragment))
+        return fragment
+
+    def _decorate(self, elements):
+        """Add the sparse values to the row elements."""
+        for row, kept in self.unknown.items():
+            element = elements[row]
+            for name, value in kept.attrib.items():
+                if name not in element.attrib:
+                    element.set(name, value)
+        self._append_children(elements)
+        for row, kept in self.unknown.items():
+            kept.append_to(elements[row])
+
+    def _append_children(self, elements):
+        """Append declared child elements to the row elements (before unknown ones)."""
+
+    def append_to(self, parent, tag=None):
+        """Append an element per row to ``parent``, straight from the columns."""
+        parent.extend(list(self._fragment(tag or self.tag)))
+
+    def write_to(self, writer, tag=None):
+        """Write an element per row to a StreamingWriter."""
+        for element in self._fragment(tag or self.tag):
+            writer.write(element)
+
+
+def _fill(dtype, name):
+    """The value of a missing entry in a column of ``dtype``."""
+    if dtype.startswith("float"):
+        return float("nan")
+    if name == "interpolation":
+        return -1
+    return False if dtype == "bool" else 0
@@ -0,0 +1,113 @@
+"""CompressionPolicy -- per-entry choice of zip compression for .dawproject archives."""
+
+import os
+from zipfile import ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2
+
+
+# Media formats that are already compressed (or, like PCM audio, gain almost
+# nothing from deflate) and are therefore stored as-is.
+AUDIO_EXTENSIONS = frozenset({
+    ".wav", ".wave", ".bwf", ".w64", ".rf64", ".aif", ".aiff", ".aifc", ".caf",
+    ".flac", ".mp3", ".ogg", ".oga", ".opus", ".m4a", ".aac", ".wma", ".wv",
+})
+VIDEO_EXTENSIONS = frozenset({".mp4", ".m4v", ".mov", ".mkv", ".webm", ".avi"})
+
+# Number of leading bytes needed by sniff_media()
+SNIFF_SIZE = 12
+
+SUPPORTED_METHODS = (ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2)
+
+
+def sniff_media(head):
+    """Return True if ``head`` (the first bytes of a file) looks like audio or video.
+
+    Recognizes RIFF/WAVE, RF64, Wave64, AIFF/AIFC, CAF, FLAC, Ogg, WavPack,
+    MP3 (ID3 tag or MPEG frame sync) and ISO media (MP4/M4A/MOV) headers.
+    """
+    head = bytes(head[:SNIFF_SIZE])
+    if head[:4] in (b"RIFF", b"RF64", b"BW64") and head[8:12] in (b"WAVE", b"AVI "):
+        return True
+    if head[:4] == b"FORM" and head[8:12] in (b"AIFF", b"AIFC"):
+        return True
+    if head[:4] in (b"fLaC", b"OggS", b"caff", b"wvpk", b"riff") or head[:3] == b"ID3":
+        return True
+    if head[4:8] == b"ftyp" or head[:4] == b"\x1aE\xdf\xa3":  # ISO media, Matroska/WebM
+        return True
+    # MPEG audio frame sync (11 set bits)
+    return len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0
+
+
+class CompressionPolicy:
+    """Decides how each entry of a .dawproject archive is compressed.
+
+    Audio and video are detected by file extension or, failing that, by
+    sniffing the first bytes of the content, and stored uncompressed:
+    deflating PCM or already-compressed media costs CPU for almost no gain
+    and stored entries can be read back without copying (see
+    EmbeddedStream).  XML entries are deflated with a tunable level, as is
+    everything else (plugin state, images, ...).
+
+    Attributes:
+        xml_method: Compression method for ``.xml`` entries.
+        xml_level: Compression level for ``.xml`` entries (0-9 for deflate).
+        default_method: Compression method for other non-media entries.
+        default_level: Compression level for other non-media entries.
+        store_media: Whether audio and video entries are stored.
+        sniff: Whether to inspect content when the extension is not a
+            known media extension.
+    """
+
+    def __init__(
+        self,
+        xml_method=ZIP_DEFLATED,
+        xml_level=6,
+        default_method=ZIP_DEFLATED,
+        default_level=6,
+        store_media=True,
+        sniff=True,
+    ):
+        for method in (xml_method, default_method):
+            if method not in SUPPORTED_METHODS:
+                raise ValueError(f"Unsupported compression method: {method}")
+        self.xml_method = xml_method
+        self.xml_level = xml_level
+        self.default_method = default_method
+        self.default_level = default_level
+        self.store_media = store_media
+        self.sniff = sniff
+
+    @classmethod
+    def stored(cls):
+        """A policy that stores every entry uncompressed."""
+        return cls(xml_method=ZIP_STORED, default_method=ZIP_STORED)
+
+    def is_media(self, path, head=None):
+        """Return True if an entry is audio or video, by extension or content."""
+        extension = os.path.splitext(path)[1].lower()
+        if extension in AUDIO_EXTENSIONS or extension in VIDEO_EXTENSIONS:
+            return True
+        return bool(self.sniff and head and sniff_media(head))
+
+    def choose(self, path, head=None):
+        """Choose the compression for an entry.
+
+        Args:
+            path: Path of the entry within the archive.
+            head: The first bytes of the content (at least SNIFF_SIZE), if
+                available, used to recognize media with unknown extensions.
+
+        Returns:
+            A ``(compress_type, compress_level)`` tuple.
+        """
+        if path.lower().endswith(".xml"):
+            return self.xml_method, self.xml_level
+        if self.store_media and self.is_media(path, head):
+            return ZIP_STORED, None
+        return self.default_method, self.default_level
+
+    def __repr__(self):
+        return (
+            f"CompressionPolicy(xml_method={self.xml_method}, xml_level={self.xml_level}, "
+            f"default_method={self.default_method}, default_level={self.default_level}, "
+            f"store_media={self.store_media}, sniff={self.sniff})"
+        )
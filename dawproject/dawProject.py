@@ -1,9 +1,13 @@
 """Core DawProject class for loading, saving, and validating DAWproject files."""
 
-from pathlib import Path
-from lxml import etree as ET
+import os
+import shutil
+import tempfile
 from zipfile import ZipFile
-from io import BytesIO
+
+from .archiveWriter import ArchiveWriter, COPY_CHUNK_SIZE  # noqa: F401 (re-exported)
+from .schemaValidator import SchemaValidator
+from .streamingWriter import StreamingWriter
 
 
 FORMAT_NAME = "DAWproject exchange format"
@@ -19,6 +23,10 @@ class DawProject:
     Provides static methods for saving and loading .dawproject files
     (ZIP archives containing project.xml, metadata.xml, and embedded audio),
     as well as standalone XML export and schema validation.
+
+    Each load method opens the archive for a single read; to read several
+    parts of the same file, use :meth:`open` (a DawProjectArchive), which
+    parses the zip directory only once.
     """
 
     FORMAT_NAME = "DAWproject exchange format"
@@ -27,101 +35,298 @@ class DawProject:
     METADATA_FILE = "metadata.xml"
 
     @staticmethod
-    def save_xml(project, file):
+    def save_xml(project, file, pretty_print=True, renumber_ids=False):
         """Save a Project as a standalone XML file.
 
+        The document is streamed to the file as it is serialized (see
+        StreamingWriter), so the complete tree is never held in memory.
+
         Args:
             project: A Project instance to serialize.
             file: Path to the output XML file.
+            pretty_print: Whether to indent the output. Pass False for
+                compact output, which is much smaller for dense lanes.
+            renumber_ids: Renumber the IDs of the project's objects densely
+                from "id0" before saving (see traversal.renumber_ids).
         """
-        from .project import Project
+        if renumber_ids:
+            from .traversal import renumber_ids as renumber
 
-        root = project.to_xml()
-        tree = ET.ElementTree(root)
+            renumber(project)
         with open(file, "wb") as file_out:
-            tree.write(file_out, pretty_print=True, xml_declaration=True, encoding="UTF-8")
+            StreamingWriter.serialize(project, file_out, pretty_print)
 
     @staticmethod
-    def save(project, metadata, embedded_files, file):
+    def save(
+        project, metadata, embedded_files, file, pretty_print=True, compression=None,
+        workers=None, deduplicate=False, validate=False, renumber_ids=False,
+    ):
         """Save a full .dawproject archive (ZIP with project.xml, metadata.xml, and embedded files).
 
+        Each entry is compressed according to a CompressionPolicy: audio and
+        video are stored, XML and other files are deflated. Compressed
+        entries are serialized and compressed on a pool of worker threads
+        and written into the archive in order (see ArchiveWriter).
+
         Args:
             project: A Project instance to serialize.
             metadata: A MetaData instance to serialize.
-            embedded_files: Dict mapping file content (bytes) to path-in-zip (str).
+            embedded_files: Dict mapping each embedded file's source to its
+                path-in-zip (str). A source is either a filesystem path
+                (str or os.PathLike), a readable binary file object, or the
+                file content as bytes. Paths and file objects are copied in
+                fixed-size chunks, so memory use does not grow with the
+                amount of embedded media.
             file: Path to the output .dawproject file.
+            pretty_print: Whether to indent the XML entries.
+            compression: A CompressionPolicy. Defaults to CompressionPolicy();
+                use CompressionPolicy.stored() for an uncompressed archive.
+            workers: Number of compression threads (default: CPU count).
+            deduplicate: Store embedded files with identical content only
+                once. Every internal FileReference in ``project`` that points
+                at a dropped duplicate is rewritten to the surviving path,
+                and the embedded files are then written before the XML.
+            validate: Validate project and metadata against the schemas
+                before writing. Each is serialized to an element tree once;
+                that same tree is validated and written to the archive.
+            renumber_ids: Renumber the IDs of the project's objects densely
+                from "id0" before saving (see traversal.renumber_ids).
+
+        Returns:
+            A SaveReport listing the duplicates dropped and the bytes saved.
+        """
+        if renumber_ids:
+            from .traversal import renumber_ids as renumber
+
+            renumber(project)
+        if validate and not deduplicate:
+            project, metadata = DawProject._validated_trees(project, metadata)
+
+        with ArchiveWriter(file, compression, workers, deduplicate=deduplicate) as writer:
+            if deduplicate:
+                for source, path_in_zip in embedded_files.items():
+                    writer.add(path_in_zip, source)
+                writer.flush()
+                DawProject._redirect_file_references(project, writer.report.duplicates)
+                if validate:
+                    project, metadata = DawProject._validated_trees(project, metadata)
+
+            writer.add_xml(DawProject.METADATA_FILE, metadata, pretty_print)
+            writer.add_xml(DawProject.PROJECT_FILE, project, pretty_print)
+            if not deduplicate:
+                for source, path_in_zip in embedded_files.items():
+                    writer.add(path_in_zip, source)
+        return writer.report
+
+    @staticmethod
+    def validate_archive(file):
+        """Validate a .dawproject file on disk without loading it into the model.
+
+        project.xml and metadata.xml are streamed from the zip straight into
+        schema validation, and every internal FileReference is checked to
+        resolve to an entry of the archive.
+
+        Args:
+            file: Path to the .dawproject file.
+
+        Returns:
+            An ArchiveValidationResult; it is truthy if the archive is valid.
         """
-        # Serialize project
-        project_root = project.to_xml()
-        project_xml = ET.tostring(project_root, pretty_print=True, xml_declaration=True, encoding="UTF-8")
+        return SchemaValidator().validate_archive(file)
+
+    @staticmethod
+    def _validated_trees(project, metadata):
+        """Serialize project and metadata to element trees once and validate them."""
+        project_root, metadata_root = project.to_xml(), metadata.to_xml()
+        DawProject.validate(project_root)
+        DawProject.validate_metadata(metadata_root)
+        return project_root, metadata_root
 
-        # Serialize metadata
-        metadata_root = metadata.to_xml()
-        metadata_xml = ET.tostring(metadata_root, pretty_print=True, xml_declaration=True, encoding="UTF-8")
+    @staticmethod
+    def _redirect_file_references(project, duplicates):
+        """Point internal FileReferences at duplicates to the entries they duplicate."""
+        from .traversal import iter_file_references
 
-        with ZipFile(file, "w") as zos:
-            DawProject._add_to_zip(zos, DawProject.METADATA_FILE, metadata_xml)
-            DawProject._add_to_zip(zos, DawProject.PROJECT_FILE, project_xml)
-            for data, path_in_zip in embedded_files.items():
-                DawProject._add_to_zip(zos, path_in_zip, data)
+        if not duplicates:
+            return
+        for reference in iter_file_references(project):
+            if not reference.external and reference.path in duplicates:
+                reference.path = duplicates[reference.path]
 
     @staticmethod
-    def _add_to_zip(zos, path, data):
-        """Write data to a path within a ZipFile."""
-        with zos.open(path, "w") as entry:
-            entry.write(data)
+    def save_incremental(
+        project, metadata, embedded_files, file, pretty_print=True, compression=None,
+        workers=None, append=False, remove=(),
+    ):
+        """Re-save an existing .dawproject archive, rewriting only what changed.
+
+        project.xml (and metadata.xml, unless ``metadata`` is None) are
+        serialized anew and the given embedded files are added or replaced;
+        every other entry is carried over as its raw compressed bytes, without
+        being decompressed or recompressed.
+
+        By default a new archive is written next to ``file`` and then moved
+        over it, so an interrupted save leaves the original intact. With
+        ``append=True`` the new entries are instead appended to ``file`` and
+        only the central directory is rewritten, which touches no embedded
+        data at all; the space of replaced entries is not reclaimed until the
+        next non-append save.
+
+        Args:
+            project: A Project instance to serialize.
+            metadata: A MetaData instance to serialize, or None to keep the
+                archive's metadata.xml.
+            embedded_files: Dict mapping the source of each new or changed
+                embedded file to its path-in-zip (see :meth:`save`).
+            file: Path to the existing .dawproject file.
+            pretty_print: Whether to indent the XML entries.
+            compression: A CompressionPolicy for the rewritten entries.
+            workers: Number of compression threads (default: CPU count).
+            append: Append to the archive in place instead of rewriting it.
+            remove: Paths of embedded files to drop from the archive.
+
+        Returns:
+            The SaveReport of the entries written.
+        """
+        if append:
+            with ArchiveWriter(file, compression, workers, mode="a") as writer:
+                for path in remove:
+                    writer.remove(path)
+                if metadata is not None:
+                    writer.add_xml(DawProject.METADATA_FILE, metadata, pretty_print)
+                writer.add_xml(DawProject.PROJECT_FILE, project, pretty_print)
+                for source, path_in_zip in embedded_files.items():
+                    writer.add(path_in_zip, source)
+            return writer.report
+
+        replaced = set(embedded_files.values()) | set(remove)
+        replaced.add(DawProject.PROJECT_FILE)
+        if metadata is not None:
+            replaced.add(DawProject.METADATA_FILE)
+
+        fd, temp_path = tempfile.mkstemp(
+            prefix=".", suffix=".tmp", dir=os.path.dirname(os.path.abspath(file))
+        )
+        os.close(fd)
+        try:
+            shutil.copymode(file, temp_path)
+            with ZipFile(file) as existing, ArchiveWriter(temp_path, compression, workers) as writer:
+                if metadata is not None:
+                    writer.add_xml(DawProject.METADATA_FILE, metadata, pretty_print)
+                elif DawProject.METADATA_FILE in existing.NameToInfo:
+                    writer.copy_entry(file, existing.getinfo(DawProject.METADATA_FILE))
+                writer.add_xml(DawProject.PROJECT_FILE, project, pretty_print)
+                for info in existing.infolist():
+                    if info.filename not in replaced and info.filename != DawProject.METADATA_FILE:
+                        writer.copy_entry(file, info)
+                for source, path_in_zip in embedded_files.items():
+                    writer.add(path_in_zip, source)
+            os.replace(temp_path, file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return writer.report
 
     @staticmethod
     def validate(project):
         """Validate a Project against the DAWproject XML schema.
 
+        The schema is compiled once per process (see SchemaValidator) and the
+        project's element tree is validated directly.
+
         Args:
-            project: A Project instance to validate.
+            project: A Project instance, or its element tree from ``to_xml()``.
 
         Raises:
             IOError: If validation fails or the schema cannot be loaded.
         """
         try:
-            root = project.to_xml()
-            project_xml = ET.tostring(root, pretty_print=True, xml_declaration=True, encoding="UTF-8")
+            SchemaValidator().validate_project(project)
+        except IOError:
+            raise
+        except Exception as e:
+            raise IOError(f"Unexpected error: {e}")
 
-            # Resolve schema path relative to this package
-            schema_path = Path(__file__).parent.parent / "Project.xsd"
-            with open(schema_path, "r") as schema_file:
-                schema_doc = ET.parse(schema_file)
-                schema = ET.XMLSchema(schema_doc)
+    @staticmethod
+    def validate_metadata(metadata):
+        """Validate MetaData against the DAWproject metadata schema.
 
-            xml_doc = ET.parse(BytesIO(project_xml))
-            schema.assertValid(xml_doc)
+        Args:
+            metadata: A MetaData instance, or its element tree.
 
-        except ET.XMLSchemaError as e:
-            raise IOError(f"Schema validation error: {e}")
+        Raises:
+            IOError: If validation fails or the schema cannot be loaded.
+        """
+        try:
+            SchemaValidator().validate_metadata(metadata)
+        except IOError:
+            raise
         except Exception as e:
             raise IOError(f"Unexpected error: {e}")
 
     @staticmethod
-    def load_project(file):
+    def load_project(file, streaming=False, load_filter=None, parallel=False, workers=None, lazy=False,
+                     columnar=False):
         """Load a Project from a .dawproject file.
 
         Args:
             file: Path to the .dawproject file.
+            streaming: If True, parse project.xml incrementally from the zip
+                entry stream (see StreamingLoader) instead of reading it into
+                memory and building the complete XML tree first.
+            load_filter: A LoadFilter selecting the tracks and timeline kinds
+                to load. Everything else is skipped while parsing (this
+                implies ``streaming``).
+            parallel: If True, deserialize the tracks and arrangement lanes
+                on a pool of worker processes (see ParallelLoader). Worth it
+                for large projects only.
+            workers: Number of worker processes (default: CPU count).
+            lazy: If True, clip content, lanes and notes are parsed only
+                when first accessed (see LazySubtree); untouched ones are
+                saved as the original XML. Not combinable with the options
+                above.
+            columnar: If True, the notes of each Notes timeline are loaded
+                into a NoteArray (NumPy columns) instead of Note objects,
+                and automation points of one kind into a PointArray.
+                Not combinable with ``parallel``.
 
         Returns:
             A Project instance populated from the file.
         """
-        from .project import Project
+        from .dawProjectArchive import DawProjectArchive
 
-        with ZipFile(file, "r") as zip_file:
-            data = zip_file.read(DawProject.PROJECT_FILE)
-            # Strip BOM if present
-            if data[:3] == b'\xef\xbb\xbf':
-                data = data[3:]
-            root = ET.fromstring(data)
-            return Project.from_xml(root)
+        if parallel:
+            workers = workers or os.cpu_count() or 1
+        else:
+            workers = None
+        with DawProjectArchive(
+            file, streaming=streaming, load_filter=load_filter, workers=workers, lazy=lazy, columnar=columnar
+        ) as archive:
+            return archive.load_project()
 
     # Alias for convenience
     load = load_project
 
+    @staticmethod
+    def open(file, streaming=False, load_filter=None, lazy=False, columnar=False):
+        """Open a .dawproject file as a persistent DawProjectArchive.
+
+        Args:
+            file: Path to the .dawproject file.
+            streaming: Load project.xml with the StreamingLoader.
+            load_filter: An optional LoadFilter for a partial load.
+            lazy: Parse timeline content on first access.
+            columnar: Load notes into NoteArrays and points into PointArrays.
+
+        Returns:
+            A DawProjectArchive; use it as a context manager.
+        """
+        from .dawProjectArchive import DawProjectArchive
+
+        return DawProjectArchive(
+            file, streaming=streaming, load_filter=load_filter, lazy=lazy, columnar=columnar
+        )
+
     @staticmethod
     def load_metadata(file):
         """Load MetaData from a .dawproject file.
@@ -132,27 +337,55 @@ class DawProject:
         Returns:
             A MetaData instance populated from the file.
         """
-        from .metaData import MetaData
+        from .dawProjectArchive import DawProjectArchive
 
-        with ZipFile(file, "r") as zip_file:
-            entry = zip_file.open(DawProject.METADATA_FILE)
-            data = entry.read()
-            # Strip BOM if present
-            if data[:3] == b'\xef\xbb\xbf':
-                data = data[3:]
-            root = ET.fromstring(data)
-            return MetaData.from_xml(root)
+        with DawProjectArchive(file) as archive:
+            return archive.load_metadata()
+
+    @staticmethod
+    def summarize(file):
+        """Collect the track names, tempo, clip count, arrangement length and
+        plug-ins of a .dawproject file without loading it.
+
+        project.xml is read in a single streaming pass and no model objects
+        are built, so this is much cheaper than :meth:`load_project`.
+
+        Args:
+            file: Path to the .dawproject file.
+
+        Returns:
+            A ProjectSummary.
+        """
+        from .dawProjectArchive import DawProjectArchive
+
+        with DawProjectArchive(file) as archive:
+            return archive.summarize()
 
     @staticmethod
     def stream_embedded(file, embedded_path):
-        """Read an embedded file from a .dawproject archive.
+        """Open an embedded file from a .dawproject archive for streaming reads.
+
+        The entry is not read into memory. Uncompressed (STORED) entries are
+        served by offset reads from the archive file (see EmbeddedStream),
+        so seeking to and reading a few frames of a long recording only
+        touches those bytes; compressed entries are decompressed on demand.
 
         Args:
             file: Path to the .dawproject file.
             embedded_path: Path of the embedded file within the archive.
 
         Returns:
-            A file-like BytesIO object for reading the embedded file.
+            A seekable, read-only binary file-like object: an
+            EmbeddedStream for STORED entries, a ``zipfile.ZipExtFile``
+            otherwise. Close it when done (or use it in a ``with`` block).
+
+        Note:
+            This used to return an ``io.BytesIO`` holding the whole entry.
+            The returned streams have no ``getvalue()``; call ``read()``
+            instead, and close the stream, which keeps the archive file
+            open until then.
         """
-        with ZipFile(file, "r") as zip_file:
-            return BytesIO(zip_file.read(embedded_path))
+        from .dawProjectArchive import DawProjectArchive
+
+        with DawProjectArchive(file) as archive:
+            return archive.open(embedded_path)
@@ -0,0 +1,201 @@
+"""DawProjectArchive -- a persistent handle on an open .dawproject file."""
+
+from zipfile import ZipFile
+
+from lxml import etree as ET
+
+from .dawProject import PROJECT_FILE, METADATA_FILE
+from .embeddedStream import EmbeddedStream
+from .fieldSpec import columnar_loading
+from .idScope import IdScope
+from .referenceTable import ReferenceTable
+
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+class DawProjectArchive:
+    """An open .dawproject archive.
+
+    The zip central directory is parsed once when the archive is opened and
+    the entry listing is cached, so the project, the metadata and any number
+    of embedded files can be read without reopening the file.  The project
+    and metadata are loaded lazily on first access and then cached.
+
+    Example::
+
+        with DawProjectArchive("song.dawproject") as archive:
+            project = archive.project
+            for reference, info in archive.file_references():
+                if info is not None:
+                    with archive.open(reference) as audio:
+                        ...
+
+    Attributes:
+        file: The path or file object the archive was opened from.
+        streaming: Whether the project is loaded with the StreamingLoader.
+        load_filter: An optional LoadFilter; the project is then loaded
+            partially, with the StreamingLoader.
+        workers: If set, the project is loaded by a ParallelLoader with
+            this many worker processes.
+        lazy: Whether timeline content is parsed on first access (see
+            LazySubtree). It needs the whole XML tree, so it cannot be
+            combined with ``streaming``, ``load_filter`` or ``workers``.
+        columnar: Whether notes and points are loaded into NoteArrays and PointArrays (see
+            ``Project.from_xml``). Not combinable with ``workers``.
+        references: The ReferenceTable of the project load, with the
+            numbers of resolved and dangling ID references (None until the
+            project is loaded).
+    """
+
+    def __init__(self, file, streaming=False, load_filter=None, workers=None, lazy=False, columnar=False):
+        if lazy and (streaming or load_filter is not None or workers is not None):
+            raise ValueError("lazy loading cannot be combined with streaming, load_filter or workers")
+        if columnar and workers is not None:
+            raise ValueError("columnar loading cannot be combined with workers")
+        self.file = file
+        self.streaming = streaming
+        self.load_filter = load_filter
+        self.workers = workers
+        self.lazy = lazy
+        self.columnar = columnar
+        self.references = None
+        self._zip_file = ZipFile(file, "r")
+        self._entries = {info.filename: info for info in self._zip_file.infolist()}
+        self._project = None
+        self._metadata = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying zip file. Streams already opened stay readable."""
+        self._zip_file.close()
+
+    @property
+    def zip_file(self):
+        """The underlying open ZipFile."""
+        return self._zip_file
+
+    @property
+    def entries(self):
+        """Dict mapping each entry name to its ZipInfo, in archive order."""
+        return dict(self._entries)
+
+    @property
+    def embedded_files(self):
+        """Names of all entries other than project.xml and metadata.xml."""
+        return [
+            name for name, info in self._entries.items()
+            if name not in (PROJECT_FILE, METADATA_FILE) and not info.is_dir()
+        ]
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    @property
+    def project(self):
+        """The Project stored in project.xml, loaded on first access."""
+        if self._project is None:
+            self._project = self.load_project()
+        return self._project
+
+    @property
+    def metadata(self):
+        """The MetaData stored in metadata.xml, loaded on first access."""
+        if self._metadata is None:
+            self._metadata = self.load_metadata()
+        return self._metadata
+
+    def load_project(self):
+        """Deserialize project.xml (uncached; prefer the ``project`` property).
+
+        IDs are resolved in a private IdScope, so that a concurrent load in
+        another thread cannot interfere; the loaded objects are then merged
+        into the caller's scope.
+        """
+        caller = IdScope.current()
+        with IdScope(caller.next_id) as scope, ReferenceTable.collect(scope) as references:
+            self.references = references
+            with columnar_loading(self.columnar):
+                project = self._deserialize_project()
+        caller.merge(scope)
+        return project
+
+    def _deserialize_project(self):
+        from .project import Project
+        from .streamingLoader import StreamingLoader
+
+        if self.workers is not None and self.load_filter is None:
+            from .parallelLoader import ParallelLoader
+
+            with self._zip_file.open(self._entries[PROJECT_FILE]) as entry:
+                return ParallelLoader(self.workers).load(entry)
+        if self.streaming or self.load_filter is not None:
+            with self._zip_file.open(self._entries[PROJECT_FILE]) as entry:
+                return StreamingLoader(load_filter=self.load_filter).load(entry)
+        return Project.from_xml(self._read_xml(PROJECT_FILE), lazy=self.lazy)
+
+    def load_metadata(self):
+        """Deserialize metadata.xml (uncached; prefer the ``metadata`` property)."""
+        from .metaData import MetaData
+
+        return MetaData.from_xml(self._read_xml(METADATA_FILE))
+
+    def summarize(self):
+        """Summarize project.xml in one streaming pass (see ProjectSummary)."""
+        from .projectSummary import ProjectSummary
+
+        with self._zip_file.open(self._entries[PROJECT_FILE]) as entry:
+            return ProjectSummary.from_xml_stream(entry)
+
+    def _read_xml(self, name):
+        data = self._zip_file.read(self._entries[name])
+        # Strip BOM if present
+        if data[:3] == _UTF8_BOM:
+            data = data[3:]
+        return ET.fromstring(data)
+
+    def resolve(self, file_reference):
+        """Return the ZipInfo a FileReference points to.
+
+        Args:
+            file_reference: A FileReference (or a plain path string).
+
+        Returns:
+            The matching ZipInfo, or None for external references and paths
+            that are not present in the archive.
+        """
+        if isinstance(file_reference, str):
+            return self._entries.get(file_reference)
+        if file_reference.external:
+            return None
+        return self._entries.get(file_reference.path)
+
+    def file_references(self):
+        """Yield (FileReference, ZipInfo or None) for every file the project references."""
+        from .traversal import iter_file_references
+
+        for reference in iter_file_references(self.project):
+            yield reference, self.resolve(reference)
+
+    def open(self, embedded):
+        """Open an embedded file for streaming, seekable reading.
+
+        Args:
+            embedded: Path within the archive, or an internal FileReference.
+
+        Returns:
+            A read-only binary stream (see EmbeddedStream.open).
+
+        Raises:
+            KeyError: If the entry does not exist or the reference is external.
+        """
+        info = self.resolve(embedded)
+        if info is None:
+            path = embedded if isinstance(embedded, str) else embedded.path
+            raise KeyError(f"There is no embedded file named {path!r} in the archive")
+        return EmbeddedStream.open(self._zip_file, info.filename)
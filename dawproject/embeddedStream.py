@@ -0,0 +1,153 @@
+"""EmbeddedStream -- seekable, copy-free reads of files embedded in a .dawproject archive."""
+
+import io
+import mmap
+import os
+import struct
+from zipfile import ZIP_STORED
+
+# Fixed-size part of a zip local file header (see zipfile.structFileHeader)
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\003\004"
+
+
+def local_data_offset(fp, info):
+    """Return the offset of an entry's data by reading its local file header.
+
+    Args:
+        fp: The archive file, opened for binary reading.
+        info: The entry's ZipInfo.
+    """
+    fp.seek(info.header_offset)
+    header = fp.read(_LOCAL_HEADER.size)
+    if len(header) != _LOCAL_HEADER.size:
+        raise IOError(f"Truncated local file header for embedded file {info.filename!r}")
+    fields = _LOCAL_HEADER.unpack(header)
+    if fields[0] != _LOCAL_HEADER_SIGNATURE:
+        raise IOError(f"Bad local file header for embedded file {info.filename!r}")
+    filename_length, extra_length = fields[-2:]
+    return info.header_offset + _LOCAL_HEADER.size + filename_length + extra_length
+
+
+class EmbeddedStream(io.RawIOBase):
+    """A read-only, seekable view of an uncompressed (STORED) zip entry.
+
+    Reads are served straight from the archive file at the entry's data
+    offset: ``readinto`` fills the caller's buffer directly and
+    :meth:`getbuffer` exposes the entry as a memoryview over an ``mmap`` of
+    the archive, so no intermediate copy of the entry is ever made.  Use
+    :meth:`open` to obtain a reader for any entry; compressed entries fall
+    back to the seekable stream returned by ``ZipFile.open``.
+
+    Attributes:
+        name: Path of the entry within the archive.
+        size: Size of the entry in bytes.
+    """
+
+    def __init__(self, archive_path, offset, size, name=None):
+        super().__init__()
+        self.name = name
+        self.size = size
+        self._offset = offset
+        self._position = 0
+        self._file = open(archive_path, "rb", buffering=0)
+        self._mmap = None
+
+    @classmethod
+    def open(cls, zip_file, embedded_path):
+        """Open an embedded file for streaming, seekable reading.
+
+        Args:
+            zip_file: An open ZipFile.
+            embedded_path: Path of the embedded file within the archive.
+
+        Returns:
+            An EmbeddedStream for STORED entries of an archive on disk,
+            otherwise the ZipExtFile returned by ``zip_file.open``. Either
+            remains readable after ``zip_file`` is closed.
+        """
+        info = zip_file.getinfo(embedded_path)
+        if (
+            info.compress_type != ZIP_STORED
+            or info.flag_bits & 0x1  # encrypted
+            or not isinstance(zip_file.filename, (str, os.PathLike))
+            or not os.path.isfile(zip_file.filename)
+        ):
+            return zip_file.open(info)
+
+        stream = cls(zip_file.filename, 0, info.file_size, embedded_path)
+        try:
+            stream._offset = local_data_offset(stream._file, info)
+        except Exception:
+            stream.close()
+            raise
+        return stream
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        remaining = self.size - self._position
+        if remaining <= 0:
+            return 0
+        view = memoryview(buffer).cast("B")
+        if len(view) > remaining:
+            view = view[:remaining]
+        self._file.seek(self._offset + self._position)
+        count = self._file.readinto(view)
+        self._position += count
+        return count
+
+    def readall(self):
+        data = bytearray(max(self.size - self._position, 0))
+        count = self.readinto(data)
+        del data[count:]
+        return bytes(data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def tell(self):
+        return self._position
+
+    def getbuffer(self):
+        """Return a read-only memoryview of the whole entry, backed by mmap."""
+        if self.size == 0:
+            return memoryview(b"")
+        if self._mmap is None:
+            start = self._offset - self._offset % mmap.ALLOCATIONGRANULARITY
+            self._mmap = mmap.mmap(
+                self._file.fileno(),
+                self._offset - start + self.size,
+                access=mmap.ACCESS_READ,
+                offset=start,
+            )
+        skip = self._offset % mmap.ALLOCATIONGRANULARITY
+        return memoryview(self._mmap)[skip:skip + self.size]
+
+    def close(self):
+        if not self.closed:
+            if self._mmap is not None:
+                try:
+                    self._mmap.close()
+                except BufferError:
+                    # A view returned by getbuffer() is still alive; the
+                    # mapping is released once it is garbage collected.
+                    pass
+                self._mmap = None
+            self._file.close()
+        super().close()
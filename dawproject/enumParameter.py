@@ -1,6 +1,7 @@
 """EnumParameter model -- an enumerated parameter."""
 
 from .parameter import Parameter
+from .fieldSpec import Attribute, INTEGER, WORDS
 
 
 class EnumParameter(Parameter):
@@ -18,25 +19,10 @@ class EnumParameter(Parameter):
         self.count = count
         self.labels = labels if labels is not None else []
 
-    def to_xml(self):
-        elem = super().to_xml()
-        if self.value is not None:
-            elem.set("value", str(self.value))
-        if self.count is not None:
-            elem.set("count", str(self.count))
-        if self.labels:
-            elem.set("labels", " ".join(self.labels))
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return None
-        instance = super().from_xml(element)
-        value = element.get("value")
-        instance.value = int(value) if value is not None else None
-        count = element.get("count")
-        instance.count = int(count) if count is not None else None
-        labels_str = element.get("labels")
-        instance.labels = labels_str.split() if labels_str else []
-        return instance
+    def _xml_fields(cls):
+        return (
+            Attribute("value", "value", INTEGER),
+            Attribute("count", "count", INTEGER),
+            Attribute("labels", "labels", WORDS, default_factory=list),
+        )
@@ -1,10 +1,10 @@
 """Equalizer model -- a built-in equalizer device."""
 
-from lxml import etree as ET
 from .builtInDevice import BuiltinDevice
 from .realParameter import RealParameter
 from .eqBand import EqBand
 from .unit import Unit
+from .fieldSpec import Child, Children, OnDemand
 
 
 class Equalizer(BuiltinDevice):
@@ -17,8 +17,14 @@ class Equalizer(BuiltinDevice):
         bands: List of EqBand objects.
         input_gain: RealParameter for input gain.
         output_gain: RealParameter for output gain.
+
+    Gains that are not given are created as empty parameters on first
+    access (see OnDemand).
     """
 
+    input_gain = OnDemand(RealParameter)
+    output_gain = OnDemand(RealParameter)
+
     def __init__(
         self,
         bands=None,
@@ -28,65 +34,15 @@ class Equalizer(BuiltinDevice):
     ):
         super().__init__(**kwargs)
         self.bands = bands if bands is not None else []
-
-        self.input_gain = (
-            input_gain
-            if isinstance(input_gain, RealParameter)
-            else RealParameter(input_gain)
-        )
-        self.output_gain = (
-            output_gain
-            if isinstance(output_gain, RealParameter)
-            else RealParameter(output_gain)
-        )
-
-    def to_xml(self):
-        eq_elem = super().to_xml()
-
-        # XSD order after device elements: Band*, InputGain?, OutputGain?
-        for band in self.bands:
-            eq_elem.append(band.to_xml())
-
-        if self.input_gain is not None and self.input_gain.value is not None:
-            ig_xml = self.input_gain.to_xml()
-            ig_xml.tag = "InputGain"
-            ig_xml.set("unit", Unit.DECIBEL.value)
-            eq_elem.append(ig_xml)
-
-        if self.output_gain is not None and self.output_gain.value is not None:
-            og_xml = self.output_gain.to_xml()
-            og_xml.tag = "OutputGain"
-            og_xml.set("unit", Unit.DECIBEL.value)
-            eq_elem.append(og_xml)
-
-        return eq_elem
+        self._set_parameters(RealParameter, input_gain=input_gain, output_gain=output_gain)
 
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return None
-
-        # Parse Device-level attributes (id, deviceName, deviceRole, enabled, etc.)
-        instance = super().from_xml(element)
-
-        # Parse Equalizer-specific content
-        bands = []
-        for band_elem in element.findall("Band"):
-            bands.append(EqBand.from_xml(band_elem))
-        instance.bands = bands
-
-        input_gain_elem = element.find("InputGain")
-        instance.input_gain = (
-            RealParameter.from_xml(input_gain_elem)
-            if input_gain_elem is not None
-            else RealParameter(None)
-        )
-
-        output_gain_elem = element.find("OutputGain")
-        instance.output_gain = (
-            RealParameter.from_xml(output_gain_elem)
-            if output_gain_elem is not None
-            else RealParameter(None)
+    def _xml_fields(cls):
+        def gain(tag, attribute):
+            return Child(tag, attribute, RealParameter, unit=Unit.DECIBEL, omit_if_unset=True)
+
+        return (
+            Children("Band", "bands", EqBand),
+            gain("InputGain", "input_gain"),
+            gain("OutputGain", "output_gain"),
         )
-
-        return instance
@@ -0,0 +1,911 @@
+"""Field specs -- declarative XML description of the model classes.
+
+A model class lists its XML attributes and child elements once, in a
+``_xml_fields`` classmethod returning Attribute, Reference, Child,
+Children, Wrapped and Text specs. Child specs are listed in the order of
+the class's Project.xsd sequence, which is the order they are written in.
+
+From the specs of a class and all its bases, :func:`model_codec` generates
+the Python source of the class's ``to_xml``, ``write_xml`` and
+``from_xml`` (see ModelCodec): every attribute is read or written by one
+straight-line statement, and each element is created once, with its final
+tag and attributes. :class:`XmlModel` is the base class routing those
+methods to the generated code.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+
+from lxml import etree as ET
+
+from .doubleAdapter import DoubleAdapter
+from .lazySubtree import LazySubtree, LazyAttribute
+from .unknownContent import UnknownContent
+
+
+# How a dispatcher stores what a handler returns
+_SINGLE = 0   # the first match is the attribute value
+_LIST = 1     # every match is appended to the attribute list
+_CUSTOM = 2   # the handler updates the values itself: handler(values, element)
+_CAPTURE = 3  # every match is appended unparsed to the attribute list
+
+# Key under which ChildDispatcher.read returns the child elements no spec accepts
+UNKNOWN = "_xml_unknown"
+
+_columnar = ContextVar("dawproject_columnar_load", default=False)
+
+
+@contextmanager
+def columnar_loading(columnar=True):
+    """Read child specs that declare ``columns`` into their column store within the block.
+
+    For example, the notes of a Notes timeline are then loaded into a
+    NoteArray instead of a list of Note objects, and the points of a
+    Points timeline into a PointArray.
+    """
+    token = _columnar.set(columnar)
+    try:
+        yield
+    finally:
+        _columnar.reset(token)
+
+
+def is_columnar():
+    """Whether columnar loading is enabled in the current context."""
+    return _columnar.get()
+
+
+class Codec:
+    """Converts an attribute value to and from its XML text.
+
+    Args:
+        encode: Returns the text of a value (never called with None), or
+            None to omit the attribute.
+        decode: Returns the value of a text (never called with None), or
+            None to use the attribute's default.
+        encode_source: Optional Python expression equivalent to ``encode``,
+            with ``{}`` standing for the value; inlined by the generated
+            code instead of a call. It must not return None.
+        decode_source: Likewise for ``decode``.
+    """
+
+    def __init__(self, encode, decode, encode_source=None, decode_source=None):
+        self.encode = encode
+        self.decode = decode
+        self.encode_source = encode_source
+        self.decode_source = decode_source
+
+
+def _identity(value):
+    return value
+
+
+def _integer(text):
+    return int(text) if text else None
+
+
+def _float(text):
+    return float(text) if text else None
+
+
+def _boolean_text(value):
+    return str(value).lower()
+
+
+def _boolean(text):
+    return text.lower() == "true" if text else None
+
+
+def _words_text(values):
+    return " ".join(values) or None
+
+
+def _words(text):
+    return text.split() or None
+
+
+def _enum_text(value):
+    return value.value if isinstance(value, Enum) else str(value)
+
+
+STRING = Codec(_identity, _identity, "{}", "{}")
+INTEGER = Codec(str, _integer, "str({})", "(int({0}) if {0} else None)")
+# xs:double as DoubleAdapter writes it: str(float) renders infinity as
+# "inf"/"-inf", and "null" or "" read back as None
+DOUBLE = Codec(
+    DoubleAdapter.to_xml, DoubleAdapter.from_xml,
+    "str(float({}))", '(float({0}) if {0} and {0} != "null" else None)',
+)
+# Plain float, written with str() (Warp and Marker times)
+FLOAT = Codec(str, _float, "str({})", "(float({0}) if {0} else None)")
+BOOLEAN = Codec(_boolean_text, _boolean, "str({}).lower()", '({0}.lower() == "true" if {0} else None)')
+# Space-separated list of strings (xs:list of xs:string)
+WORDS = Codec(_words_text, _words)
+# An enum member written as its value, read back as the plain string
+ENUM_TEXT = Codec(_enum_text, _identity)
+
+
+def enum_codec(enum, invalid="raise"):
+    """Return a codec storing a member of ``enum`` as its value.
+
+    Args:
+        enum: The Enum class.
+        invalid: What an unknown value decodes to: ``"raise"`` (ValueError),
+            ``"none"`` (None), or ``"keep"`` (the string itself).
+    """
+
+    def decode(text):
+        if not text:
+            return None
+        try:
+            return enum(text)
+        except ValueError:
+            if invalid == "raise":
+                raise
+            return text if invalid == "keep" else None
+
+    return Codec(_enum_text, decode)
+
+
+def enum_list_codec(enum):
+    """Return a codec for a space-separated list of ``enum`` members (xs:list).
+
+    Commas are accepted as separators too, for older files.
+    """
+
+    def encode(values):
+        return " ".join(_enum_text(value) for value in values) or None
+
+    def decode(text):
+        return [enum(item) for item in text.replace(",", " ").split()] or None
+
+    return Codec(encode, decode)
+
+
+class Attribute:
+    """An XML attribute stored in a model attribute.
+
+    Attributes whose value is None are not written.
+
+    Args:
+        name: The XML attribute name.
+        attribute: Name of the model attribute.
+        codec: Codec converting the value (default STRING).
+        default: Value when the XML attribute is missing or empty.
+        default_factory: Called to create the default instead (for lists).
+        required: Whether a missing value raises ValueError, both when
+            reading and when writing.
+    """
+
+    is_child = False
+
+    def __init__(self, name, attribute, codec=STRING, default=None, default_factory=None, required=False):
+        self.name = name
+        self.attribute = attribute
+        self.codec = codec
+        self.default = default
+        self.default_factory = default_factory
+        self.required = required
+
+
+class Reference(Attribute):
+    """An IDREF attribute holding another Referenceable.
+
+    It is written as the target's ``id`` and resolved with
+    ``Referenceable.get_by_id`` after the element's children have been read,
+    so that forward references can be deferred (see ReferenceTable).
+
+    Args:
+        name: The XML attribute name.
+        attribute: Name of the model attribute.
+        keep_id: Whether an unresolved ID is kept as a string instead of None.
+    """
+
+    def __init__(self, name, attribute, keep_id=False):
+        super().__init__(name, attribute)
+        self.keep_id = keep_id
+
+
+class Child:
+    """A child element deserialized into a single attribute.
+
+    If several children match, the first one wins.
+
+    Args:
+        tag: The element tag, or a dict mapping each accepted tag to its
+            class (for polymorphic content such as a Clip's timeline).
+        attribute: Name of the model attribute.
+        cls: Class whose ``from_xml`` parses the element (or any callable
+            taking the element); not used when ``tag`` is a dict.
+        default_factory: Called to create the value when no child matches;
+            the value is None otherwise.
+        unit: Unit written on the element in place of the parameter's own.
+        default_unit: Unit written on the element if the parameter has none.
+        omit_if_unset: Whether the element is left out when the parameter's
+            ``value`` is None.
+        lazy: Whether, while lazy loading is enabled, the matching elements
+            are kept unparsed until the attribute is accessed (see
+            LazySubtree).
+        columns: For a list attribute, a column store class (such as
+            NoteArray or PointArray) the value may be instead of a list. It
+            is written with the store's ``append_to(parent, tag)`` and
+            ``write_to(writer, tag)``, and while columnar loading is
+            enabled the matching elements are read with its
+            ``from_elements(elements)`` (see columnar_loading), which may
+            also return a list.
+    """
+
+    is_child = True
+    # Whether the attribute holds a list of all matching elements
+    is_list = False
+
+    def __init__(self, tag, attribute, cls=None, default_factory=None, unit=None, default_unit=None,
+                 omit_if_unset=False, lazy=False, columns=None):
+        self.classes = dict(tag) if isinstance(tag, dict) else {tag: cls}
+        self.attribute = attribute
+        self.default_factory = default_factory
+        self.unit = unit.value if unit is not None else None
+        self.default_unit = default_unit.value if default_unit is not None else None
+        self.omit_if_unset = omit_if_unset
+        self.lazy = lazy
+        self.columns = columns
+
+    @property
+    def tags(self):
+        return tuple(self.classes)
+
+    @property
+    def tag(self):
+        """The tag the value is written with, or None to keep its own."""
+        return next(iter(self.classes)) if len(self.classes) == 1 else None
+
+    def handlers(self):
+        """Yield ``(tag, (mode, attribute, handler))`` dispatch entries."""
+        for tag, cls in self.classes.items():
+            yield tag, (_SINGLE, self.attribute, _parser(cls))
+
+    def deferred_handlers(self):
+        """Yield dispatch entries capturing the matching elements unparsed."""
+        attribute = self.attribute
+        if self.is_list:
+            for tag in self.classes:
+                yield tag, (_CAPTURE, attribute, None)
+            return
+
+        def capture(values, element):
+            elements = values[attribute]
+            if not elements:
+                elements.append(element)
+
+        for tag in self.classes:
+            yield tag, (_CUSTOM, attribute, capture)
+
+    def build(self):
+        """Return ``build(value)`` creating the element of a value."""
+        tag, unit, default_unit = self.tag, self.unit, self.default_unit
+        if unit is None and default_unit is None:
+            return lambda value: value.to_xml(tag)
+
+        def build(value):
+            element = value.to_xml(tag)
+            if unit is not None:
+                element.set("unit", unit)
+            elif "unit" not in element.attrib:
+                element.set("unit", default_unit)
+            return element
+
+        return build
+
+    def appender(self):
+        """Return ``append(parent, value)`` adding the value's element to ``parent``."""
+        build = self.build()
+        return lambda parent, value: parent.append(build(value))
+
+    def streamer(self):
+        """Return ``stream(writer, value)`` writing the value to a StreamingWriter."""
+        if self.unit is None and self.default_unit is None:
+            tag = self.tag
+            return lambda writer, value: writer.write_object(value, tag)
+        build = self.build()
+        return lambda writer, value: writer.write(build(value))
+
+
+class Children(Child):
+    """Repeated child elements collected into a list attribute."""
+
+    is_list = True
+
+    def handlers(self):
+        for tag, cls in self.classes.items():
+            yield tag, (_LIST, self.attribute, _parser(cls))
+
+    def appender(self):
+        tag, columns = self.tag, self.columns
+
+        def append(parent, values):
+            if values.__class__ is columns:
+                values.append_to(parent, tag)
+                return
+            for value in values:
+                parent.append(value.to_xml(tag))
+
+        return append
+
+    def streamer(self):
+        tag, columns = self.tag, self.columns
+
+        def stream(writer, values):
+            if values.__class__ is columns:
+                values.write_to(writer, tag)
+                return
+            for value in values:
+                writer.write_object(value, tag)
+
+        return stream
+
+
+class Wrapped(Child):
+    """A wrapper element (e.g. ``<Sends>``) whose children form a list attribute.
+
+    Args:
+        tag: The wrapper element tag.
+        attribute: Name of the list attribute.
+        items: Dict mapping each accepted item tag to its class.
+        fallback: Class (or callable) for item elements not in ``items``;
+            without one they are skipped.
+    """
+
+    is_list = True
+
+    def __init__(self, tag, attribute, items, fallback=None):
+        super().__init__(tag, attribute)
+        self.items = dict(items)
+        self.fallback = fallback
+
+    def handlers(self):
+        attribute = self.attribute
+        parsers = {tag: _parser(cls) for tag, cls in self.items.items()}
+        fallback = _parser(self.fallback) if self.fallback is not None else None
+
+        def read(values, element):
+            items = values[attribute]
+            for item in element:
+                parse = parsers.get(item.tag)
+                if parse is None:
+                    if fallback is None or not isinstance(item.tag, str):
+                        continue
+                    parse = fallback
+                items.append(parse(item))
+
+        for tag in self.classes:
+            yield tag, (_CUSTOM, attribute, read)
+
+    def appender(self):
+        tag = self.tag
+
+        def append(parent, values):
+            wrapper = ET.SubElement(parent, tag)
+            for value in values:
+                wrapper.append(value.to_xml())
+
+        return append
+
+    def streamer(self):
+        tag = self.tag
+
+        def stream(writer, values):
+            with writer.element(tag):
+                for value in values:
+                    writer.write_object(value)
+
+        return stream
+
+
+class Text(Child):
+    """A child element whose text content is the attribute value."""
+
+    def handlers(self):
+        attribute = self.attribute
+
+        def read(values, element):
+            if values[attribute] is None:
+                values[attribute] = element.text or ""
+
+        for tag in self.classes:
+            yield tag, (_CUSTOM, attribute, read)
+
+    def build(self):
+        tag = self.tag
+
+        def build(value):
+            element = ET.Element(tag)
+            element.text = str(value)
+            return element
+
+        return build
+
+    def streamer(self):
+        build = self.build()
+        return lambda writer, value: writer.write(build(value))
+
+
+class ChildDispatcher:
+    """Reads the child elements of one model class in a single pass.
+
+    Args:
+        specs: The child specs.
+        deferrable: Whether lazy specs may be captured unparsed (False for
+            the dispatchers that later parse the captured elements).
+
+    Attributes:
+        specs: The child specs, in declaration order (base classes first).
+        handlers: Dict mapping a child tag to its ``(mode, attribute,
+            handler)`` entry.
+        lazy_handlers: The handlers used while lazy loading is enabled, or
+            None if no spec is lazy.
+        columnar_handlers: The handlers used while columnar loading is
+            enabled, or None if no spec declares ``columns``.
+    """
+
+    def __init__(self, specs, deferrable=True):
+        self.specs = tuple(specs)
+        self.handlers = self._handler_table(())
+        lazy = tuple(spec for spec in self.specs if spec.lazy and deferrable)
+        columnar = tuple(spec for spec in self.specs if spec.columns is not None)
+        # Handler tables by (lazy, columnar) mode, capturing the elements of
+        # the specs read later (into a LazySubtree or a column store)
+        self._tables = {
+            mode: self._handler_table(deferred) if deferred else self.handlers
+            for mode, deferred in (((True, False), lazy), ((False, True), columnar), ((True, True), lazy + columnar))
+        }
+        self.lazy_handlers = self._tables[True, False] if lazy else None
+        self.columnar_handlers = self._tables[False, True] if columnar else None
+        # Each lazy attribute is later read on its own, from the captured elements
+        self._lazy = tuple((spec.attribute, ChildDispatcher((spec,), deferrable=False)) for spec in lazy)
+        self._columns = tuple((spec.attribute, spec.columns) for spec in columnar)
+        self._empty = {spec.attribute: None for spec in self.specs}
+        self._lists = tuple(spec.attribute for spec in self.specs if spec.is_list)
+        self._factories = tuple(
+            (spec.attribute, spec.default_factory) for spec in self.specs if spec.default_factory is not None
+        )
+
+    def _handler_table(self, deferred):
+        handlers = {}
+        for spec in self.specs:
+            for tag, handler in spec.deferred_handlers() if spec in deferred else spec.handlers():
+                handlers.setdefault(tag, handler)
+        return handlers
+
+    def read(self, element, lazy=False, columnar=False):
+        """Return a dict mapping each spec's attribute to its value.
+
+        Child elements that no spec accepts are returned as a list under
+        the key UNKNOWN (only if there are any).
+
+        Args:
+            element: The parent element (or any iterable of child elements).
+            lazy: Whether the elements of lazy specs are captured in a
+                LazySubtree instead of being parsed.
+            columnar: Whether the elements of specs declaring ``columns``
+                are read into their column store instead of a list.
+        """
+        values = self._empty.copy()
+        for attribute in self._lists:
+            values[attribute] = []
+        if lazy or columnar:
+            handlers = self._tables[bool(lazy), bool(columnar)]
+        else:
+            handlers = self.handlers
+        if lazy:
+            for attribute, _ in self._lazy:
+                values[attribute] = []
+        for child in element:
+            entry = handlers.get(child.tag)
+            if entry is None:
+                # Comments and processing instructions are not kept
+                if child.tag.__class__ is str:
+                    values.setdefault(UNKNOWN, []).append(child)
+                continue
+            mode, attribute, handler = entry
+            if mode == _LIST:
+                values[attribute].append(handler(child))
+            elif mode == _SINGLE:
+                if values[attribute] is None:
+                    values[attribute] = handler(child)
+            elif mode == _CAPTURE:
+                values[attribute].append(child)
+            else:
+                handler(values, child)
+        if lazy:
+            for attribute, dispatcher in self._lazy:
+                elements = values[attribute]
+                if elements:
+                    values[attribute] = LazySubtree(elements, dispatcher, attribute, columnar)
+                else:
+                    values[attribute] = [] if attribute in self._lists else None
+        if columnar:
+            for attribute, columns in self._columns:
+                elements = values[attribute]
+                # A pending LazySubtree is read into columns when it is materialized
+                if elements.__class__ is list:
+                    values[attribute] = columns.from_elements(elements)
+        for attribute, factory in self._factories:
+            if values[attribute] is None:
+                values[attribute] = factory()
+        return values
+
+
+class ModelCodec:
+    """The generated XML serializer and deserializer of one model class.
+
+    Attributes:
+        cls: The model class.
+        tag: The element tag written by default.
+        attributes: The Attribute and Reference specs.
+        children: The child specs, in the order they are written.
+        dispatcher: The ChildDispatcher reading the children.
+        source: The generated Python source (for debugging).
+        to_xml: ``to_xml(obj, tag=None)`` returning an lxml element.
+        write_xml: ``write_xml(obj, writer, tag=None)`` writing to a
+            StreamingWriter; an element with children is streamed, one
+            without is written as a whole.
+        from_xml: ``from_xml(cls, element)`` returning a new instance.
+
+    A lazy child attribute is backed by a LazyAttribute installed on the
+    class; while its LazySubtree is pending, the generated serializers copy
+    the captured elements instead of reading the attribute.
+    """
+
+    def __init__(self, cls, fields):
+        from .referenceable import Referenceable
+
+        self.cls = cls
+        self.tag = getattr(cls, "_xml_tag", None) or cls.__name__
+        self.attributes = tuple(spec for spec in fields if not spec.is_child)
+        self.children = tuple(spec for spec in fields if spec.is_child)
+        self.dispatcher = ChildDispatcher(self.children)
+
+        namespace = {
+            "_Element": ET.Element,
+            "_new": cls.__new__,
+            "_register": getattr(cls, "_register_from_xml", None),
+            "_read": self.dispatcher.read,
+            "_get_by_id": Referenceable.get_by_id,
+            "_LazySubtree": LazySubtree,
+            "_keep_unknown": _keep_unknown,
+            "_keep_unknown_attributes": _keep_unknown_attributes,
+            "_UNKNOWN": UNKNOWN,
+            "_KNOWN": frozenset(spec.name for spec in self.attributes),
+            "_pending": LazySubtree.pending,
+            "_lazy": LazySubtree.is_enabled,
+            "_columnar": is_columnar,
+            "_TAG": self.tag,
+        }
+        for i, spec in enumerate(self.attributes):
+            namespace[f"_encode{i}"] = spec.codec.encode
+            namespace[f"_decode{i}"] = spec.codec.decode
+            namespace[f"_default{i}"] = spec.default
+            namespace[f"_factory{i}"] = spec.default_factory
+        for i, spec in enumerate(self.children):
+            namespace[f"_append{i}"] = spec.appender()
+            namespace[f"_stream{i}"] = spec.streamer()
+            namespace[f"_child_factory{i}"] = spec.default_factory
+            if spec.lazy:
+                namespace[f"_append{i}"] = _copy_pending(namespace[f"_append{i}"], LazySubtree.append_to)
+                namespace[f"_stream{i}"] = _copy_pending(namespace[f"_stream{i}"], LazySubtree.write_to)
+                if not isinstance(getattr(cls, spec.attribute, None), LazyAttribute):
+                    setattr(cls, spec.attribute, LazyAttribute(spec.attribute))
+
+        self.source = "\n".join(self._to_xml_source() + self._write_xml_source() + self._from_xml_source())
+        exec(compile(self.source, f"<xml codec of {cls.__name__}>", "exec"), namespace)
+        self.to_xml = namespace["to_xml"]
+        self.write_xml = namespace["write_xml"]
+        self.from_xml = namespace["from_xml"]
+
+    def _attrib_source(self):
+        lines = ["    a = {}", "    u = obj._xml_unknown"]
+        for i, spec in enumerate(self.attributes):
+            lines.append(f"    v = obj.{spec.attribute}")
+            if spec.required:
+                message = f"{self.cls.__name__}.{spec.attribute} is required by the XSD schema and must not be None"
+                lines += ["    if v is None:", f"        raise ValueError({message!r})"]
+            if isinstance(spec, Reference):
+                lines += ["    if v is not None:", f"        a[{spec.name!r}] = v if v.__class__ is str else v.id"]
+            elif spec.codec.encode_source is not None:
+                lines += ["    if v is not None:", f"        a[{spec.name!r}] = {spec.codec.encode_source.format('v')}"]
+            else:
+                lines += [
+                    "    if v is not None:",
+                    f"        v = _encode{i}(v)",
+                    "        if v is not None:",
+                    f"            a[{spec.name!r}] = v",
+                ]
+        return lines + ["    if u is not None:", "        u.add_attributes(a)"]
+
+    def _present(self, spec, name):
+        if spec.is_list:
+            present = name
+        elif spec.omit_if_unset:
+            present = f"{name} is not None and {name}.value is not None"
+        else:
+            present = f"{name} is not None"
+        if spec.lazy:
+            present = f"{name}.__class__ is _LazySubtree or {present}"
+        return present
+
+    def _on_demand(self, spec):
+        return isinstance(getattr(self.cls, spec.attribute, None), OnDemand)
+
+    def _value(self, spec):
+        if spec.lazy:
+            return f"(_pending(obj, {spec.attribute!r}) or obj.{spec.attribute})"
+        if self._on_demand(spec):
+            # Reading the attribute would create the default value
+            return f"obj.__dict__.get({spec.attribute!r})"
+        return f"obj.{spec.attribute}"
+
+    def _to_xml_source(self):
+        lines = ["def to_xml(obj, tag=None):"] + self._attrib_source()
+        lines.append("    element = _Element(tag or _TAG, a)")
+        for i, spec in enumerate(self.children):
+            lines += [
+                f"    v = {self._value(spec)}",
+                f"    if {self._present(spec, 'v')}:",
+                f"        _append{i}(element, v)",
+            ]
+        return lines + ["    if u is not None:", "        u.append_to(element)", "    return element"]
+
+    def _write_xml_source(self):
+        lines = ["def write_xml(obj, writer, tag=None):"] + self._attrib_source()
+        for i, spec in enumerate(self.children):
+            lines += [f"    c{i} = {self._value(spec)}", f"    p{i} = {self._present(spec, f'c{i}')}"]
+        present = " or ".join([f"p{i}" for i in range(len(self.children))] + ["u is not None and u.elements"])
+        lines += [f"    if {present}:", "        with writer.element(tag or _TAG, a):"]
+        for i in range(len(self.children)):
+            lines += [f"            if p{i}:", f"                _stream{i}(writer, c{i})"]
+        lines += ["            if u is not None:", "                u.write_to(writer)"]
+        return lines + ["    else:", "        writer.write(_Element(tag or _TAG, a))"]
+
+    def _from_xml_source(self):
+        if getattr(self.cls, "_xml_default_when_missing", False):
+            missing = "cls()"
+        else:
+            missing = "None"
+        lines = [
+            "def from_xml(cls, element):",
+            "    if element is None:",
+            f"        return {missing}",
+            "    obj = _new(cls)",
+            "    get = element.get",
+            # Number of declared attributes present, to detect unknown ones
+            "    n = 0",
+        ]
+        if getattr(self.cls, "_xml_unknown", None) is not None:
+            # A slot: unlike the class default, it has no value until set
+            lines.append("    obj._xml_unknown = None")
+        references = []
+        for i, spec in enumerate(self.attributes):
+            if isinstance(spec, Reference):
+                references.append(spec)
+                continue
+            lines.append(f"    v = get({spec.name!r})")
+            if spec.required:
+                message = f"{self.tag} element is missing required attribute '{spec.name}'"
+                lines += ["    if not v:", f"        raise ValueError({message!r})"]
+            decode = spec.codec.decode_source
+            lines += ["    if v is not None:", "        n += 1"]
+            if decode is None:
+                lines.append(f"        v = _decode{i}(v)")
+            elif decode != "{}":
+                lines.append(f"        v = {decode.format('v')}")
+            if spec.default_factory is not None:
+                lines += ["    if v is None:", f"        v = _factory{i}()"]
+            elif spec.default is not None:
+                lines += ["    if v is None:", f"        v = _default{i}"]
+            lines.append(f"    obj.{spec.attribute} = v")
+        if getattr(self.cls, "_register_from_xml", None) is not None:
+            lines.append("    _register(obj, element)")
+        if self.children:
+            # Leaf elements (most notes and points) skip the dispatcher
+            if self.dispatcher.lazy_handlers is not None:
+                # A LazySubtree is materialized in the columnar mode it was captured in
+                read = "_read(element, _lazy(), _columnar())"
+            elif self.dispatcher.columnar_handlers is not None:
+                read = "_read(element, columnar=_columnar())"
+            else:
+                read = "_read(element)"
+            lines += ["    if len(element):", f"        values = {read}"]
+            for spec in self.children:
+                if spec.lazy:
+                    lines += [
+                        f"        v = values[{spec.attribute!r}]",
+                        "        if v.__class__ is _LazySubtree:",
+                        "            v.attach(obj)",
+                        "        else:",
+                        f"            obj.{spec.attribute} = v",
+                    ]
+                elif self._on_demand(spec):
+                    lines += [
+                        f"        v = values[{spec.attribute!r}]",
+                        "        if v is not None:",
+                        f"            obj.{spec.attribute} = v",
+                    ]
+                else:
+                    lines.append(f"        obj.{spec.attribute} = values[{spec.attribute!r}]")
+            lines += [
+                "        v = values.get(_UNKNOWN)",
+                "        if v is not None:",
+                "            _keep_unknown(obj, v)",
+            ]
+            defaults = []
+            for i, spec in enumerate(self.children):
+                if self._on_demand(spec):
+                    continue
+                if spec.default_factory is not None:
+                    empty = f"_child_factory{i}()"
+                else:
+                    empty = "[]" if spec.is_list else "None"
+                defaults.append(f"        obj.{spec.attribute} = {empty}")
+            if defaults:
+                lines += ["    else:"] + defaults
+        else:
+            lines += [
+                "    if len(element):",
+                "        _keep_unknown(obj, [child for child in element if child.tag.__class__ is str])",
+            ]
+        for spec in references:
+            lines.append(f"    v = get({spec.name!r})")
+            resolve = f"_get_by_id(v, obj, {spec.attribute!r})"
+            if spec.keep_id:
+                resolve = f"({resolve} or v)"
+            lines += ["    if v is not None:", "        n += 1", f"    obj.{spec.attribute} = {resolve} if v else None"]
+        lines += ["    if len(element.attrib) != n:", "        _keep_unknown_attributes(obj, element, _KNOWN)"]
+        return lines + ["    return obj"]
+
+
+_codecs = {}
+
+
+def model_codec(cls):
+    """Return the generated ModelCodec of a model class (cached per class).
+
+    The fields of all classes in the MRO that define ``_xml_fields`` are
+    merged, base classes first; a subclass spec replaces a base spec for the
+    same attribute.
+    """
+    codec = _codecs.get(cls)
+    if codec is None:
+        codec = _codecs[cls] = ModelCodec(cls, _merged_fields(cls))
+    return codec
+
+
+def child_dispatcher(cls):
+    """Return the compiled ChildDispatcher of a model class."""
+    return model_codec(cls).dispatcher
+
+
+def read_children(cls, element):
+    """Deserialize the child elements of ``element`` as declared by ``cls``."""
+    return model_codec(cls).dispatcher.read(element)
+
+
+def _merged_fields(cls):
+    specs = {}
+    for klass in reversed(cls.__mro__):
+        declare = klass.__dict__.get("_xml_fields")
+        if declare is not None:
+            for spec in declare.__func__(cls):
+                specs.pop(spec.attribute, None)
+                specs[spec.attribute] = spec
+    return tuple(specs.values())
+
+
+def _parser(cls):
+    return getattr(cls, "from_xml", cls)
+
+
+def _keep_unknown(obj, elements):
+    """Store unknown child elements in ``obj._xml_unknown``."""
+    if not elements:
+        return
+    unknown = obj._xml_unknown
+    if unknown is None:
+        obj._xml_unknown = UnknownContent(elements=elements)
+    else:
+        unknown.add_elements(elements)
+
+
+def _keep_unknown_attributes(obj, element, known):
+    """Store the attributes of ``element`` not in ``known`` in ``obj._xml_unknown``."""
+    unknown = obj._xml_unknown
+    if unknown is None:
+        obj._xml_unknown = UnknownContent.from_element(element, known)
+    else:
+        unknown.attrib.update((name, value) for name, value in element.items() if name not in known)
+
+
+def _copy_pending(write, copy):
+    """Wrap an appender or streamer to copy a pending LazySubtree verbatim."""
+
+    def write_or_copy(target, value):
+        if value.__class__ is LazySubtree:
+            copy(value, target)
+        else:
+            write(target, value)
+
+    return write_or_copy
+
+
+class OnDemand:
+    """Class attribute creating an attribute's default value on first access.
+
+    Declared in the class body for optional values that callers expect to
+    find (such as a device's empty RealParameter), so that instances which
+    never set or read them allocate nothing::
+
+        class Limiter(BuiltinDevice):
+            attack = OnDemand(RealParameter)
+
+    It is a non-data descriptor: an assigned (or loaded) value is stored in
+    the instance dict and found first. Until then the generated serializers
+    treat the attribute as None.
+
+    Args:
+        factory: Called without arguments to create the default value.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.attribute = None
+
+    def __set_name__(self, owner, name):
+        self.attribute = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.attribute] = self.factory()
+        return value
+
+
+class XmlModel:
+    """Base class of the model classes serialized from their ``_xml_fields``.
+
+    Class attributes:
+        _xml_tag: The element tag, if it is not the class name.
+        _xml_default_when_missing: Whether ``from_xml(None)`` returns a
+            default instance rather than None.
+        _register_from_xml: Optional hook ``(instance, element)`` run after
+            the attributes and before the children are read.
+        _xml_unknown: The UnknownContent of a deserialized instance (the
+            attributes and child elements its class does not declare), or
+            None. It is written back by ``to_xml`` and ``write_xml``.
+
+    The base declares no instance storage (``__slots__ = ()``), so that
+    high-cardinality subclasses can be fully slotted. A slotted class lists
+    ``_xml_unknown`` in its ``__slots__`` and sets it to None in
+    ``__init__``; the generated ``from_xml`` then initializes it as well.
+    """
+
+    __slots__ = ()
+    _xml_tag = None
+    _xml_unknown = None
+    _xml_default_when_missing = False
+    _register_from_xml = None
+
+    def to_xml(self, tag=None):
+        """Serialize to an lxml element (with ``tag`` instead of the default tag)."""
+        codec = _codecs.get(self.__class__) or model_codec(self.__class__)
+        return codec.to_xml(self, tag)
+
+    def write_xml(self, writer, tag=None):
+        """Write this object into a StreamingWriter."""
+        codec = _codecs.get(self.__class__) or model_codec(self.__class__)
+        codec.write_xml(self, writer, tag)
+
+    @classmethod
+    def from_xml(cls, element):
+        """Create an instance from an lxml element."""
+        codec = _codecs.get(cls) or model_codec(cls)
+        return codec.from_xml(cls, element)
@@ -1,9 +1,9 @@
 """FileReference model -- a reference to a file (internal or external)."""
 
-from lxml import etree as ET
+from .fieldSpec import XmlModel, Attribute, BOOLEAN
 
 
-class FileReference:
+class FileReference(XmlModel):
     """A reference to a file, either embedded or external.
 
     Attributes:
@@ -11,21 +11,19 @@ class FileReference:
         external: Whether the file is external to the archive.
     """
 
+    __slots__ = ("path", "external", "_xml_unknown")
+
+    _xml_tag = "File"
+    _xml_default_when_missing = True
+
     def __init__(self, path="", external=False):
         self.path = path
         self.external = external
-
-    def to_xml(self):
-        file_elem = ET.Element("File")
-        file_elem.set("path", self.path)
-        file_elem.set("external", str(self.external).lower())
-        return file_elem
+        self._xml_unknown = None
 
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return cls()
-        path = element.get("path", "")
-        external = element.get("external")
-        external = external.lower() == "true" if external else False
-        return cls(path, external)
+    def _xml_fields(cls):
+        return (
+            Attribute("path", "path", default=""),
+            Attribute("external", "external", BOOLEAN, default=False),
+        )
@@ -0,0 +1,137 @@
+"""IdScope -- ID allocation and lookup for Referenceable objects."""
+
+import threading
+import weakref
+from contextvars import ContextVar
+
+
+_current = ContextVar("dawproject_id_scope", default=None)
+
+
+class IdScope:
+    """A namespace that allocates Referenceable IDs and resolves them.
+
+    A Referenceable loaded while a scope is active is registered there
+    under its ID; a new one draws its ID from the scope that is active when
+    the ID is first needed (see Referenceable), and is registered then. The registry holds weak
+    references only, so objects are freed as soon as the project that owns
+    them is dropped.
+
+    The active scope is carried in a context variable: entering a scope
+    with ``with`` affects only the current thread or asyncio task, so
+    concurrent loads in their own scopes cannot see or renumber each
+    other's objects. Code that never enters a scope shares one process-wide
+    default scope, which is what ``Referenceable.ID`` and
+    ``Referenceable.reset_id()`` operate on.
+
+    Example::
+
+        with IdScope():
+            project = DawProject.load_project("song.dawproject")
+
+    Attributes:
+        next_id: Number of the next generated ID ("id<next_id>").
+        fixups: While a loader defers reference resolution, the
+            ReferenceTable collecting the references not yet resolvable;
+            otherwise None.
+    """
+
+    def __init__(self, next_id=0):
+        self.next_id = next_id
+        self.fixups = None
+        self._instances = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._tokens = []
+
+    @classmethod
+    def current(cls):
+        """Return the active scope (the process-wide default if none was entered)."""
+        scope = _current.get()
+        return scope if scope is not None else _default
+
+    def __enter__(self):
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current.reset(self._tokens.pop())
+
+    def allocate(self):
+        """Return a new, unused ID string."""
+        with self._lock:
+            number = self.next_id
+            self.next_id += 1
+        return f"id{number}"
+
+    def reserve(self, id):
+        """Make sure generated IDs never collide with a loaded ``id<n>`` ID."""
+        try:
+            number = int(id.removeprefix("id"))
+        except (ValueError, AttributeError):
+            return
+        with self._lock:
+            if number >= self.next_id:
+                self.next_id = number + 1
+
+    def register(self, instance):
+        """Register an object under its ``id``."""
+        self._instances[instance.id] = instance
+
+    def get(self, id):
+        """Return the live object registered under ``id``, or None."""
+        return self._instances.get(id)
+
+    def objects(self):
+        """Return the live registered objects whose current ID is their key."""
+        return [obj for id, obj in self._instances.items() if obj.id == id]
+
+    def renumber(self, objects, start=0, skip=()):
+        """Give ``objects`` the dense IDs ``id<start>``, ``id<start + 1>``, ... in order.
+
+        The objects are re-registered under their new IDs, and the counter
+        is advanced past them.
+
+        Args:
+            objects: The Referenceable objects to renumber.
+            start: Number of the first ID.
+            skip: IDs not to hand out (e.g. IDs used in kept foreign XML).
+        """
+        number = start
+        with self._lock:
+            for obj in objects:
+                old = vars(obj).get("id")
+                if old is not None and self._instances.get(old) is obj:
+                    del self._instances[old]
+            for obj in objects:
+                while f"id{number}" in skip:
+                    number += 1
+                obj.id = f"id{number}"
+                self._instances[obj.id] = obj
+                number += 1
+            self.next_id = max(self.next_id, number)
+
+    def merge(self, other):
+        """Adopt the objects and the ID counter of another scope.
+
+        Used after a load in a private scope, so that the loaded objects can
+        be looked up here and new objects do not reuse their IDs.
+        """
+        for obj in other.objects():
+            self._instances[obj.id] = obj
+        with self._lock:
+            self.next_id = max(self.next_id, other.next_id)
+
+    def clear(self):
+        """Reset the ID counter and forget all registered objects."""
+        with self._lock:
+            self.next_id = 0
+        self._instances = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._instances)
+
+    def __repr__(self):
+        return f"IdScope(next_id={self.next_id}, objects={len(self)})"
+
+
+_default = IdScope()
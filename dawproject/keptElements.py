@@ -0,0 +1,50 @@
+"""KeptElements -- XML elements kept verbatim and written back as copies."""
+
+from copy import deepcopy
+
+
+def reserve_ids(elements):
+    """Reserve the IDs used in ``elements`` and their descendants in the active IdScope.
+
+    Kept elements are not parsed into model objects (or not yet), so their
+    IDs are not registered; reserving them keeps new objects from taking
+    them.
+    """
+    from .idScope import IdScope
+
+    scope = IdScope.current()
+    for element in elements:
+        for id in element.xpath("descendant-or-self::*/@id"):
+            scope.reserve(id)
+
+
+class KeptElements:
+    """Mixin for holders of kept XML elements (UnknownContent, LazySubtree).
+
+    The elements, in ``self.elements``, stay part of the loaded tree; they
+    are written as copies so that the tree is left as it is. The copies
+    lose the indentation of the source document, so that they are
+    indented (or not) like the rest of the output.
+    """
+
+    def append_to(self, parent):
+        """Append a copy of the kept elements to ``parent``."""
+        for element in self.elements:
+            parent.append(_copy(element))
+
+    def write_to(self, writer):
+        """Write a copy of the kept elements to a StreamingWriter."""
+        for element in self.elements:
+            writer.write(_copy(element))
+
+
+def _copy(element):
+    """Return a deep copy of ``element`` without whitespace-only text between elements."""
+    copy = deepcopy(element)
+    copy.tail = None
+    for node in copy.iter():
+        if len(node) and node.text is not None and not node.text.strip():
+            node.text = None
+        if node is not copy and node.tail is not None and not node.tail.strip():
+            node.tail = None
+    return copy
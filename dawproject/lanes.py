@@ -1,6 +1,7 @@
 """Lanes model -- a container of Timeline elements."""
 
 from .timeline import Timeline
+from .fieldSpec import Children
 
 
 class Lanes(Timeline):
@@ -22,24 +23,8 @@ class Lanes(Timeline):
         super().__init__(track, time_unit, name, color, comment)
         self.lanes = lanes if lanes else []
 
-    def to_xml(self):
-        elem = super().to_xml()
-        for lane in self.lanes:
-            elem.append(lane.to_xml())
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
+    def _xml_fields(cls):
         from . import registry
-
-        instance = super().from_xml(element)
-
-        # Resolve child elements as Timeline subclasses via registry
-        lanes = []
-        for child in element:
-            child_cls = registry.resolve_timeline(child.tag)
-            if child_cls is not None:
-                lanes.append(child_cls.from_xml(child))
-        instance.lanes = lanes
-
-        return instance
+        # Every Timeline subclass child is a lane
+        return (Children(registry.classes_for(registry.TIMELINE_TAGS), "lanes", lazy=True),)
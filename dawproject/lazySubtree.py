@@ -0,0 +1,117 @@
+"""LazySubtree -- deferred deserialization of heavy timeline subtrees."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .keptElements import KeptElements, reserve_ids
+
+
+_enabled = ContextVar("dawproject_lazy_load", default=False)
+
+# Instance dict key holding the unmaterialized subtrees of an object
+PENDING = "_lazy_subtrees"
+
+
+class LazySubtree(KeptElements):
+    """The unparsed XML of one lazily loaded model attribute.
+
+    While lazy loading is enabled, child specs declared with ``lazy=True``
+    (a Clip's ``content``, ``Lanes.lanes``, ``Notes.notes``) do not build
+    their model objects. The matching child elements are kept instead, and
+    the objects are built on first access to the attribute (lazy subtrees
+    nested in them are captured again). Until then, saving writes a copy of
+    the original elements.
+
+    The IDs found in a subtree are reserved when it is captured, so new
+    objects never take them. Objects in the subtree are registered, and
+    their references resolved, in the active IdScope when they are built;
+    until then, references into the subtree from outside do not resolve.
+
+    Example::
+
+        with LazySubtree.enabled():
+            project = Project.from_xml(root)
+        project.arrangement.lanes.lanes  # parsed here
+
+    Attributes:
+        elements: The captured child elements (still part of the loaded tree).
+        dispatcher: ChildDispatcher reading the elements into the attribute.
+        attribute: Name of the model attribute.
+        columnar: Whether the elements are read with columnar loading
+            enabled, as they would have been when captured.
+    """
+
+    def __init__(self, elements, dispatcher, attribute, columnar=False):
+        self.elements = elements
+        self.dispatcher = dispatcher
+        self.attribute = attribute
+        self.columnar = columnar
+        reserve_ids(elements)
+
+    @classmethod
+    @contextmanager
+    def enabled(cls, lazy=True):
+        """Load lazily (or, with ``lazy=False``, eagerly) within the block."""
+        token = _enabled.set(lazy)
+        try:
+            yield
+        finally:
+            _enabled.reset(token)
+
+    @staticmethod
+    def is_enabled():
+        """Whether lazy loading is enabled in the current context."""
+        return _enabled.get()
+
+    @staticmethod
+    def pending(obj, attribute):
+        """Return the LazySubtree still standing in for ``obj.<attribute>``, or None."""
+        values = obj.__dict__
+        if attribute in values:
+            return None
+        subtrees = values.get(PENDING)
+        return subtrees.get(attribute) if subtrees else None
+
+    def attach(self, obj):
+        """Stand in for the attribute of ``obj`` until it is first accessed."""
+        obj.__dict__.setdefault(PENDING, {})[self.attribute] = self
+
+    def materialize(self):
+        """Build and return the attribute value from the captured elements."""
+        from .fieldSpec import columnar_loading
+        from .referenceTable import ReferenceTable
+
+        columnar = self.columnar
+        with ReferenceTable.collect(), LazySubtree.enabled(), columnar_loading(columnar):
+            return self.dispatcher.read(self.elements, columnar=columnar)[self.attribute]
+
+    def __repr__(self):
+        tags = ", ".join(element.tag for element in self.elements[:3])
+        more = ", ..." if len(self.elements) > 3 else ""
+        return f"LazySubtree({self.attribute!r}, [{tags}{more}])"
+
+
+class LazyAttribute:
+    """Class attribute building a pending LazySubtree on first access.
+
+    It is a non-data descriptor: once the value is stored in the instance
+    dict (by the first access, by assignment, or by an eager load), the
+    descriptor is no longer consulted.
+    """
+
+    def __init__(self, attribute):
+        self.attribute = attribute
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        values = obj.__dict__
+        subtrees = values.get(PENDING)
+        subtree = subtrees.get(self.attribute) if subtrees else None
+        if subtree is None:
+            raise AttributeError(f"{type(obj).__name__!r} object has no attribute {self.attribute!r}")
+        value = values[self.attribute] = subtree.materialize()
+        del subtrees[self.attribute]
+        if not subtrees:
+            del values[PENDING]
+        return value
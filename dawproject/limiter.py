@@ -2,6 +2,7 @@
 
 from .builtInDevice import BuiltinDevice
 from .realParameter import RealParameter
+from .fieldSpec import Child, OnDemand
 
 
 class Limiter(BuiltinDevice):
@@ -13,8 +14,17 @@ class Limiter(BuiltinDevice):
         output_gain: RealParameter for output gain.
         attack: RealParameter for attack time.
         release: RealParameter for release time.
+
+    Parameters that are not given are created empty on first access (see
+    OnDemand).
     """
 
+    threshold = OnDemand(RealParameter)
+    input_gain = OnDemand(RealParameter)
+    output_gain = OnDemand(RealParameter)
+    attack = OnDemand(RealParameter)
+    release = OnDemand(RealParameter)
+
     def __init__(
         self,
         threshold=None,
@@ -25,75 +35,26 @@ class Limiter(BuiltinDevice):
         **kwargs,
     ):
         super().__init__(**kwargs)
-        self.threshold = (
-            threshold
-            if isinstance(threshold, RealParameter)
-            else RealParameter(threshold)
-        )
-        self.input_gain = (
-            input_gain
-            if isinstance(input_gain, RealParameter)
-            else RealParameter(input_gain)
-        )
-        self.output_gain = (
-            output_gain
-            if isinstance(output_gain, RealParameter)
-            else RealParameter(output_gain)
-        )
-        self.attack = (
-            attack
-            if isinstance(attack, RealParameter)
-            else RealParameter(attack)
+        self._set_parameters(
+            RealParameter,
+            threshold=threshold,
+            input_gain=input_gain,
+            output_gain=output_gain,
+            attack=attack,
+            release=release,
         )
-        self.release = (
-            release
-            if isinstance(release, RealParameter)
-            else RealParameter(release)
-        )
-
-    def to_xml(self):
-        elem = super().to_xml()
-        elem.tag = "Limiter"
-
-        # XSD alphabetical order: Attack, InputGain, OutputGain, Release, Threshold
-        if self.attack is not None and self.attack.value is not None:
-            attack_xml = self.attack.to_xml()
-            attack_xml.tag = "Attack"
-            elem.append(attack_xml)
-
-        if self.input_gain is not None and self.input_gain.value is not None:
-            ig_xml = self.input_gain.to_xml()
-            ig_xml.tag = "InputGain"
-            elem.append(ig_xml)
-
-        if self.output_gain is not None and self.output_gain.value is not None:
-            og_xml = self.output_gain.to_xml()
-            og_xml.tag = "OutputGain"
-            elem.append(og_xml)
-
-        if self.release is not None and self.release.value is not None:
-            release_xml = self.release.to_xml()
-            release_xml.tag = "Release"
-            elem.append(release_xml)
-
-        if self.threshold is not None and self.threshold.value is not None:
-            threshold_xml = self.threshold.to_xml()
-            threshold_xml.tag = "Threshold"
-            elem.append(threshold_xml)
-
-        return elem
 
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return None
-
-        instance = super().from_xml(element)
-
-        instance.threshold = RealParameter.from_xml(element.find("Threshold")) or RealParameter(None)
-        instance.input_gain = RealParameter.from_xml(element.find("InputGain")) or RealParameter(None)
-        instance.output_gain = RealParameter.from_xml(element.find("OutputGain")) or RealParameter(None)
-        instance.attack = RealParameter.from_xml(element.find("Attack")) or RealParameter(None)
-        instance.release = RealParameter.from_xml(element.find("Release")) or RealParameter(None)
-
-        return instance
+    def _xml_fields(cls):
+        # Missing optional parameters are created empty on access (OnDemand),
+        # so that callers can always use .value; unset ones are not written.
+        def param(tag, attribute):
+            return Child(tag, attribute, RealParameter, omit_if_unset=True)
+
+        return (
+            param("Attack", "attack"),
+            param("InputGain", "input_gain"),
+            param("OutputGain", "output_gain"),
+            param("Release", "release"),
+            param("Threshold", "threshold"),
+        )
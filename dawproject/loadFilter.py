@@ -0,0 +1,86 @@
+"""LoadFilter -- selects which tracks and timelines a partial load deserializes."""
+
+from enum import Enum
+
+
+class LoadFilter:
+    """Selection criteria for a partial project load.
+
+    A track is selected if it matches any of the given track criteria (its
+    id, its name, or one of its content types). Tracks nested in a selected
+    track are selected with it, and a folder track is kept, holding only its
+    selected children, when any track below it is selected. Without track
+    criteria every track is selected.
+
+    Timelines that belong to a track (``track="..."`` on Lanes, Clips,
+    Points, ClipSlot, ...) are loaded only for selected tracks, and
+    timelines of the kinds in ``skip_timelines`` are not loaded at all.
+    References to objects that were not loaded (e.g. a channel destination
+    outside the selection) resolve to None.
+
+    Example::
+
+        only_vocals = LoadFilter(track_names={"Vocal Bus"}, skip_timelines={"Notes"})
+        project = DawProject.load_project("song.dawproject", load_filter=only_vocals)
+
+    Attributes:
+        track_ids: Ids of the tracks to load.
+        track_names: Names of the tracks to load.
+        content_types: ContentType values (or their strings) of the tracks to load.
+        skip_timelines: Timeline element names (or classes, e.g. Notes,
+            Points) to leave out.
+    """
+
+    def __init__(self, track_ids=None, track_names=None, content_types=None, skip_timelines=None):
+        self.track_ids = set(track_ids or ())
+        self.track_names = set(track_names or ())
+        self.content_types = {
+            content_type.value if isinstance(content_type, Enum) else content_type
+            for content_type in content_types or ()
+        }
+        self.skip_timelines = set()
+        for kind in skip_timelines or ():
+            tag = getattr(kind, "__name__", kind)
+            self.skip_timelines.add(tag)
+            if tag == "Markers":
+                # The XSD spells the global element in lowercase
+                self.skip_timelines.add("markers")
+
+    @property
+    def filters_tracks(self):
+        """Whether any track criteria were given."""
+        return bool(self.track_ids or self.track_names or self.content_types)
+
+    def matches_track(self, element):
+        """Return True if a Track element itself meets the track criteria."""
+        if not self.filters_tracks:
+            return True
+        if element.get("id") in self.track_ids or element.get("name") in self.track_names:
+            return True
+        content_types = (element.get("contentType") or "").split()
+        return any(content_type in self.content_types for content_type in content_types)
+
+    def select_track(self, element):
+        """Decide whether to keep a Track element whose subtree has been parsed.
+
+        Nested tracks are decided first (their end tags come first), so a
+        kept child Track left inside ``element`` means a descendant matched.
+        """
+        if self.matches_track(element):
+            return True
+        if any(self.matches_track(ancestor) for ancestor in element.iterancestors("Track")):
+            return True
+        return element.find("Track") is not None
+
+    def skips_timeline(self, element, selected_track_ids):
+        """Return True if a timeline element must not be loaded."""
+        if element.tag in self.skip_timelines:
+            return True
+        track = element.get("track")
+        return self.filters_tracks and track is not None and track not in selected_track_ids
+
+    def __repr__(self):
+        return (
+            f"LoadFilter(track_ids={self.track_ids!r}, track_names={self.track_names!r}, "
+            f"content_types={self.content_types!r}, skip_timelines={self.skip_timelines!r})"
+        )
@@ -1,6 +1,7 @@
 """Marker model -- a named marker on a timeline."""
 
 from .nameable import Nameable
+from .fieldSpec import Attribute, FLOAT
 
 
 class Marker(Nameable):
@@ -10,19 +11,13 @@ class Marker(Nameable):
         time: The time position of the marker.
     """
 
+    __slots__ = ("time", "_xml_unknown")
+
     def __init__(self, time=0.0, name=None, color=None, comment=None):
         super().__init__(name, color, comment)
         self.time = time
-
-    def to_xml(self):
-        marker_elem = super().to_xml()
-        marker_elem.tag = "Marker"
-        marker_elem.set("time", str(self.time))
-        return marker_elem
+        self._xml_unknown = None
 
     @classmethod
-    def from_xml(cls, element):
-        instance = super().from_xml(element)
-        time = element.get("time")
-        instance.time = float(time) if time is not None else 0.0
-        return instance
+    def _xml_fields(cls):
+        return (Attribute("time", "time", FLOAT, default=0.0),)
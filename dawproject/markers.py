@@ -2,6 +2,7 @@
 
 from .timeline import Timeline
 from .marker import Marker
+from .fieldSpec import Children
 
 
 class Markers(Timeline):
@@ -23,19 +24,6 @@ class Markers(Timeline):
         super().__init__(track, time_unit, name, color, comment)
         self.markers = markers if markers else []
 
-    def to_xml(self):
-        elem = super().to_xml()
-        for marker in self.markers:
-            elem.append(marker.to_xml())
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
-        instance = super().from_xml(element)
-
-        markers = []
-        for marker_elem in element.findall("Marker"):
-            markers.append(Marker.from_xml(marker_elem))
-        instance.markers = markers
-
-        return instance
+    def _xml_fields(cls):
+        return (Children("Marker", "markers", Marker),)
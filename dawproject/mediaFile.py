@@ -2,7 +2,7 @@
 
 from .fileReference import FileReference
 from .timeline import Timeline
-from .doubleAdapter import DoubleAdapter
+from .fieldSpec import Attribute, Child, DOUBLE
 
 
 class MediaFile(Timeline):
@@ -18,28 +18,9 @@ class MediaFile(Timeline):
         self.file = file if file else FileReference(path="")
         self.duration = duration
 
-    def to_xml(self):
-        elem = super().to_xml()
-        elem.set("duration", DoubleAdapter.to_xml(self.duration))
-        file_elem = self.file.to_xml()
-        file_elem.tag = "File"
-        elem.append(file_elem)
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return None
-
-        instance = super().from_xml(element)
-
-        file_elem = element.find("File")
-        instance.file = (
-            FileReference.from_xml(file_elem)
-            if file_elem is not None
-            else FileReference(path="")
+    def _xml_fields(cls):
+        return (
+            Attribute("duration", "duration", DOUBLE, default=0.0),
+            Child("File", "file", FileReference, default_factory=lambda: FileReference(path="")),
         )
-        parsed_duration = DoubleAdapter.from_xml(element.get("duration"))
-        instance.duration = parsed_duration if parsed_duration is not None else 0.0
-
-        return instance
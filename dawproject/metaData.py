@@ -1,9 +1,9 @@
 """MetaData model -- project metadata (title, artist, etc.)."""
 
-from lxml import etree as ET
+from .fieldSpec import XmlModel, Text
 
 
-class MetaData:
+class MetaData(XmlModel):
     """Metadata for a DAWproject file.
 
     Attributes:
@@ -22,6 +22,8 @@ class MetaData:
         comment: Additional comments.
     """
 
+    _xml_default_when_missing = True
+
     def __init__(
         self,
         title=None,
@@ -52,48 +54,20 @@ class MetaData:
         self.website = website
         self.comment = comment
 
-    def to_xml(self):
-        root = ET.Element("MetaData")
-
-        fields = [
-            ("Title", self.title),
-            ("Artist", self.artist),
-            ("Album", self.album),
-            ("OriginalArtist", self.original_artist),
-            ("Composer", self.composer),
-            ("Songwriter", self.songwriter),
-            ("Producer", self.producer),
-            ("Arranger", self.arranger),
-            ("Year", self.year),
-            ("Genre", self.genre),
-            ("Copyright", self.copyright),
-            ("Website", self.website),
-            ("Comment", self.comment),
-        ]
-
-        for tag, value in fields:
-            if value is not None:
-                elem = ET.SubElement(root, tag)
-                elem.text = str(value)
-
-        return root
-
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return cls()
-        return cls(
-            title=element.findtext("Title"),
-            artist=element.findtext("Artist"),
-            album=element.findtext("Album"),
-            original_artist=element.findtext("OriginalArtist"),
-            composer=element.findtext("Composer"),
-            songwriter=element.findtext("Songwriter"),
-            producer=element.findtext("Producer"),
-            arranger=element.findtext("Arranger"),
-            year=element.findtext("Year"),
-            genre=element.findtext("Genre"),
-            copyright=element.findtext("Copyright"),
-            website=element.findtext("Website"),
-            comment=element.findtext("Comment"),
+    def _xml_fields(cls):
+        return (
+            Text("Title", "title"),
+            Text("Artist", "artist"),
+            Text("Album", "album"),
+            Text("OriginalArtist", "original_artist"),
+            Text("Composer", "composer"),
+            Text("Songwriter", "songwriter"),
+            Text("Producer", "producer"),
+            Text("Arranger", "arranger"),
+            Text("Year", "year"),
+            Text("Genre", "genre"),
+            Text("Copyright", "copyright"),
+            Text("Website", "website"),
+            Text("Comment", "comment"),
         )
@@ -1,45 +1,33 @@
 """Nameable model -- base class for objects with name, color, and comment."""
 
 from abc import ABC
-from lxml import etree as ET
+from .fieldSpec import XmlModel, Attribute
 
 
-class Nameable(ABC):
+class Nameable(XmlModel, ABC):
     """Abstract base class for objects with name, color, and comment attributes.
 
+    ``to_xml``/``from_xml`` are generated from the ``_xml_fields`` of the
+    class and its bases (see fieldSpec). ``from_xml`` creates the instance
+    with ``__new__``, so subclass constructors are not called.
+
     Attributes:
         name: Display name.
         color: Color string (e.g. hex color).
         comment: Optional comment text.
     """
 
+    __slots__ = ("name", "color", "comment")
+
     def __init__(self, name=None, color=None, comment=None):
         self.name = name
         self.color = color
         self.comment = comment
 
-    def to_xml(self):
-        element = ET.Element(self.__class__.__name__)
-
-        if self.name is not None:
-            element.set("name", self.name)
-        if self.color is not None:
-            element.set("color", self.color)
-        if self.comment is not None:
-            element.set("comment", self.comment)
-
-        return element
-
     @classmethod
-    def from_xml(cls, element):
-        """Create an instance from an XML element.
-
-        Uses __new__ to avoid positional arg mismatch in subclass constructors,
-        then sets name/color/comment from element attributes.
-        """
-        instance = cls.__new__(cls)
-        # Initialize all __init__ defaults to avoid missing attributes
-        instance.name = element.get("name") if element is not None else None
-        instance.color = element.get("color") if element is not None else None
-        instance.comment = element.get("comment") if element is not None else None
-        return instance
+    def _xml_fields(cls):
+        return (
+            Attribute("name", "name"),
+            Attribute("color", "color"),
+            Attribute("comment", "comment"),
+        )
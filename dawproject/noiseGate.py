@@ -2,6 +2,7 @@
 
 from .builtInDevice import BuiltinDevice
 from .realParameter import RealParameter
+from .fieldSpec import Child, OnDemand
 
 
 class NoiseGate(BuiltinDevice):
@@ -13,8 +14,17 @@ class NoiseGate(BuiltinDevice):
         attack: RealParameter for attack time.
         release: RealParameter for release time.
         range: RealParameter for maximum gain reduction range [-inf to 0].
+
+    Parameters that are not given are created empty on first access (see
+    OnDemand).
     """
 
+    threshold = OnDemand(RealParameter)
+    ratio = OnDemand(RealParameter)
+    attack = OnDemand(RealParameter)
+    release = OnDemand(RealParameter)
+    range = OnDemand(RealParameter)
+
     def __init__(
         self,
         threshold=None,
@@ -25,75 +35,26 @@ class NoiseGate(BuiltinDevice):
         **kwargs,
     ):
         super().__init__(**kwargs)
-        self.threshold = (
-            threshold
-            if isinstance(threshold, RealParameter)
-            else RealParameter(threshold)
-        )
-        self.ratio = (
-            ratio
-            if isinstance(ratio, RealParameter)
-            else RealParameter(ratio)
-        )
-        self.attack = (
-            attack
-            if isinstance(attack, RealParameter)
-            else RealParameter(attack)
-        )
-        self.release = (
-            release
-            if isinstance(release, RealParameter)
-            else RealParameter(release)
+        self._set_parameters(
+            RealParameter,
+            threshold=threshold,
+            ratio=ratio,
+            attack=attack,
+            release=release,
+            range=range_param,
         )
-        self.range = (
-            range_param
-            if isinstance(range_param, RealParameter)
-            else RealParameter(range_param)
-        )
-
-    def to_xml(self):
-        elem = super().to_xml()
-        elem.tag = "NoiseGate"
-
-        # XSD alphabetical order: Attack, Range, Ratio, Release, Threshold
-        if self.attack is not None and self.attack.value is not None:
-            attack_xml = self.attack.to_xml()
-            attack_xml.tag = "Attack"
-            elem.append(attack_xml)
-
-        if self.range is not None and self.range.value is not None:
-            range_xml = self.range.to_xml()
-            range_xml.tag = "Range"
-            elem.append(range_xml)
-
-        if self.ratio is not None and self.ratio.value is not None:
-            ratio_xml = self.ratio.to_xml()
-            ratio_xml.tag = "Ratio"
-            elem.append(ratio_xml)
-
-        if self.release is not None and self.release.value is not None:
-            release_xml = self.release.to_xml()
-            release_xml.tag = "Release"
-            elem.append(release_xml)
-
-        if self.threshold is not None and self.threshold.value is not None:
-            threshold_xml = self.threshold.to_xml()
-            threshold_xml.tag = "Threshold"
-            elem.append(threshold_xml)
-
-        return elem
 
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return None
-
-        instance = super().from_xml(element)
-
-        instance.threshold = RealParameter.from_xml(element.find("Threshold")) or RealParameter(None)
-        instance.ratio = RealParameter.from_xml(element.find("Ratio")) or RealParameter(None)
-        instance.attack = RealParameter.from_xml(element.find("Attack")) or RealParameter(None)
-        instance.release = RealParameter.from_xml(element.find("Release")) or RealParameter(None)
-        instance.range = RealParameter.from_xml(element.find("Range")) or RealParameter(None)
-
-        return instance
+    def _xml_fields(cls):
+        # Missing optional parameters are created empty on access (OnDemand),
+        # so that callers can always use .value; unset ones are not written.
+        def param(tag, attribute):
+            return Child(tag, attribute, RealParameter, omit_if_unset=True)
+
+        return (
+            param("Attack", "attack"),
+            param("Range", "range"),
+            param("Ratio", "ratio"),
+            param("Release", "release"),
+            param("Threshold", "threshold"),
+        )
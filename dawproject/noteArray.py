@@ -0,0 +1,213 @@
+"""NoteArray -- columnar storage of the notes of a Notes timeline."""
+
+from .arrayReader import LAYOUTS
+from .columnStore import ColumnStore
+
+
+# Column name (the Note attribute and XML attribute) and NumPy dtype, in XML order.
+# Float columns store a missing value as NaN.
+COLUMNS = tuple((name, dtype) for name, dtype, _ in LAYOUTS["Note"])
+_NAMES = tuple(name for name, _ in COLUMNS)
+_FLOATS = ("time", "duration", "vel", "rel")
+
+
+class NoteArray(ColumnStore):
+    """The notes of a Notes timeline as parallel NumPy arrays.
+
+    An alternative to a list of Note objects for ``Notes.notes``: each
+    Note attribute is one column (``time``, ``duration``, ``vel`` and
+    ``rel`` as float64, ``key`` and ``channel`` as int32), so that dense
+    MIDI can be transformed and analyzed with vectorized NumPy operations::
+
+        notes = NoteArray.from_notes(clip_notes.notes)
+        notes.time += 4.0                       # shift by a bar
+        loud = notes[notes.vel > 0.8]           # mask
+        notes.sort()
+        clip_notes.notes = notes                # written column by column
+
+    A missing float value (a Note attribute of None) is stored as NaN. The
+    rare per-note ``content`` (expression timelines) and any unknown XML
+    kept from a loaded note are held in sparse dicts keyed by row.
+
+    Iterating, or indexing with an integer, yields NoteView objects which
+    read and write a row through the columns, for code written against
+    Note objects. Slicing, masks and growth work as for any ColumnStore.
+
+    NumPy is an optional dependency (``pip install dawproject[columnar]``),
+    imported when a NoteArray is created. A project is loaded with
+    NoteArrays instead of lists with ``columnar=True`` (see
+    ``Project.from_xml``).
+
+    Args:
+        time, duration, key, channel, vel, rel: Array-likes of equal length
+            (``key`` and ``channel`` default to 0, ``vel`` and ``rel`` to
+            NaN).
+        content: Dict mapping a row to the note's content Timeline.
+
+    Attributes:
+        content: Dict mapping a row to the note's content Timeline.
+        unknown: Dict mapping a row to the note's UnknownContent.
+    """
+
+    _sparse = ("content", "unknown")
+
+    def __init__(self, time=(), duration=None, key=None, channel=None, vel=None, rel=None, content=None):
+        self._init_columns("Note", {
+            "time": time, "duration": duration, "key": key, "channel": channel, "vel": vel, "rel": rel,
+        })
+        if content:
+            self.content.update(content)
+
+    @classmethod
+    def from_notes(cls, notes):
+        """Create a NoteArray from Note objects (or NoteViews)."""
+        notes = list(notes)
+        columns = {name: [getattr(note, name) for note in notes] for name in _NAMES}
+        for name in ("key", "channel"):
+            columns[name] = [value or 0 for value in columns[name]]
+        # None becomes NaN in the float columns
+        array = cls(**columns)
+        for row, note in enumerate(notes):
+            array._keep(row, note)
+        return array
+
+    @classmethod
+    def from_elements(cls, elements):
+        """Read Note elements into a NoteArray, without creating Note objects.
+
+        The columns are read in bulk by ArrayReader. Only notes with child
+        elements (per-note expressions) or unknown attributes are parsed by
+        ``Note.from_xml``, to fill the sparse content and unknown tables.
+        """
+        from .note import Note
+
+        return cls._read_elements(elements, "Note", Note.from_xml)
+
+    def _keep(self, row, note):
+        if note.content is not None:
+            self.content[row] = note.content
+        unknown = getattr(note, "_xml_unknown", None)
+        if unknown is not None:
+            self.unknown[row] = unknown
+
+    def to_notes(self):
+        """Return the notes as a list of new Note objects."""
+        return [view.to_note() for view in self]
+
+    def __iter__(self):
+        for row in range(self._size):
+            yield NoteView(self, row)
+
+    def __getitem__(self, index):
+        import numpy as np
+
+        if isinstance(index, (int, np.integer)):
+            return NoteView(self, self._row(index))
+        return self._select(index)
+
+    def __repr__(self):
+        return f"NoteArray({self._size} notes)"
+
+    def append(self, note):
+        """Append one note (a Note or NoteView) in amortized constant time."""
+        row = self._size
+        self._reserve(row + 1)
+        for name in _NAMES:
+            value = getattr(note, name)
+            if value is None:
+                value = float("nan") if name in _FLOATS else 0
+            self._data[name][row] = value
+        self._size = row + 1
+        self._keep(row, note)
+
+    def extend(self, notes):
+        """Append many notes at once: another NoteArray, or an iterable of notes."""
+        if not isinstance(notes, NoteArray):
+            notes = NoteArray.from_notes(notes)
+        self._extend_rows(notes)
+
+    def sort(self, by="time"):
+        """Sort the notes in place (stable) by one column or a tuple of columns.
+
+        With several columns, the first is the primary key, e.g.
+        ``sort(("time", "key"))``.
+        """
+        import numpy as np
+
+        names = (by,) if isinstance(by, str) else tuple(by)
+        if len(names) == 1:
+            order = np.argsort(self.column(names[0]), kind="stable")
+        else:
+            # lexsort takes the primary key last
+            order = np.lexsort([self.column(name) for name in reversed(names)])
+        self._reorder(order)
+
+    def _append_children(self, elements):
+        # Content comes before unknown elements, as in Note.to_xml
+        for row, value in self.content.items():
+            elements[row].append(value.to_xml())
+
+
+class NoteView:
+    """One row of a NoteArray, read and written like a Note.
+
+    A view refers to its row by position, so it follows the row's new
+    contents after the array is sorted.
+    """
+
+    __slots__ = ("array", "row")
+
+    def __init__(self, array, row):
+        self.array = array
+        self.row = row
+
+    def _get(self, name):
+        value = self.array.column(name)[self.row].item()
+        if value != value:
+            # NaN
+            return None
+        return value
+
+    def _set(self, name, value):
+        if value is None:
+            value = float("nan") if name in _FLOATS else 0
+        self.array.column(name)[self.row] = value
+
+    @property
+    def content(self):
+        return self.array.content.get(self.row)
+
+    @content.setter
+    def content(self, value):
+        if value is None:
+            self.array.content.pop(self.row, None)
+        else:
+            self.array.content[self.row] = value
+
+    @property
+    def _xml_unknown(self):
+        return self.array.unknown.get(self.row)
+
+    def to_note(self):
+        """Return a new Note with this row's values."""
+        from .note import Note
+
+        note = Note(*(self._get(name) for name in _NAMES), content=self.content)
+        note._xml_unknown = self._xml_unknown
+        return note
+
+    def to_xml(self, tag=None):
+        """Serialize the row as a Note element."""
+        return self.to_note().to_xml(tag)
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={self._get(name)!r}" for name in _NAMES)
+        return f"NoteView({values})"
+
+
+def _view_property(name):
+    return property(lambda view: view._get(name), lambda view, value: view._set(name, value))
+
+
+for _name in _NAMES:
+    setattr(NoteView, _name, _view_property(_name))
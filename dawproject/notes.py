@@ -2,13 +2,16 @@
 
 from .timeline import Timeline
 from .note import Note
+from .noteArray import NoteArray
+from .fieldSpec import Children
 
 
 class Notes(Timeline):
     """A timeline containing MIDI notes.
 
     Attributes:
-        notes: List of Note objects.
+        notes: List of Note objects, or a NoteArray holding the notes as
+            columns (as loaded with ``columnar=True``).
     """
 
     def __init__(
@@ -21,21 +24,8 @@ class Notes(Timeline):
         comment=None,
     ):
         super().__init__(track, time_unit, name, color, comment)
-        self.notes = notes if notes else []
-
-    def to_xml(self):
-        elem = super().to_xml()
-        for note in self.notes:
-            elem.append(note.to_xml())
-        return elem
+        self.notes = notes if notes is not None else []
 
     @classmethod
-    def from_xml(cls, element):
-        instance = super().from_xml(element)
-
-        notes = []
-        for note_elem in element.findall("Note"):
-            notes.append(Note.from_xml(note_elem))
-        instance.notes = notes
-
-        return instance
+    def _xml_fields(cls):
+        return (Children("Note", "notes", Note, lazy=True, columns=NoteArray),)
@@ -0,0 +1,189 @@
+"""ParallelLoader -- deserializes large projects on a pool of worker processes.
+
+The document is parsed once (libxml2 is fast; building Python objects is
+not) and split at the top-level ``Structure`` entries and the children of
+``Arrangement/Lanes`` that have a model class; other elements stay where
+they are.  Each batch of pieces is deserialized in a worker process with
+an IdScope of its own.  References to objects in other pieces cannot be
+resolved there, so they are recorded in a ReferenceTable instead.  The
+main process deserializes the remaining small parts, stitches the pieces
+into the Project and then patches every recorded reference in one linear
+pass.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree as ET
+
+from . import registry
+from .idScope import IdScope
+from .referenceTable import ReferenceTable
+from .streamingLoader import large_file_parser
+
+
+# Pieces are grouped into tasks of at least this many bytes of XML
+_MIN_TASK_BYTES = 256 * 1024
+
+# Each batch numbers the objects it creates without an XML id from its own
+# range, so that generated ids never collide across batches.
+_ID_STRIDE = 1 << 32
+
+_NUMERIC_ID = re.compile(r"id(\d+)$")
+
+# Structure children deserialized in the workers; others (read by the
+# Lane fallback) stay in the tree for the main process
+_STRUCTURE_PIECES = ("Track", "Channel")
+
+
+def _id_number(id):
+    match = _NUMERIC_ID.match(id) if isinstance(id, str) else None
+    return int(match.group(1)) if match else None
+
+
+def _deserialize_pieces(batch):
+    """Worker entry point: deserialize a batch of (kind, xml bytes) pieces.
+
+    Returns:
+        ``(objects, referenceables, fixups)``. They are pickled together,
+        so the fix-ups refer to the very objects returned.
+    """
+    from .project import Project
+
+    first_id, pieces = batch
+    # A scope of our own also keeps the caller's registry intact when a
+    # batch runs in the calling process.
+    with IdScope(first_id) as scope:
+        scope.fixups = ReferenceTable()
+        parser = large_file_parser()
+        objects = []
+        for kind, xml in pieces:
+            element = ET.fromstring(xml, parser)
+            if kind == "structure":
+                objects.append(Project.structure_from_xml(element))
+            else:
+                objects.append(registry.resolve_timeline(element.tag).from_xml(element))
+        return objects, scope.objects(), scope.fixups
+
+
+class ParallelLoader:
+    """Deserializes a Project using a pool of worker processes.
+
+    The result is the same object graph the sequential loader produces:
+    references between pieces (``Clips.track``, ``Channel.destination``,
+    ``Send.destination``, ``AutomationTarget.parameter``, ...) are patched
+    once all pieces are back, and every loaded object is registered with
+    Referenceable as usual.
+
+    Example::
+
+        with zip_file.open("project.xml") as stream:
+            project = ParallelLoader(workers=8).load(stream)
+
+    Attributes:
+        workers: Number of worker processes. With 1, the pieces are
+            deserialized in the calling process (useful for debugging).
+        references: The ReferenceTable of the last load.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.references = None
+
+    def load(self, source):
+        """Deserialize a Project from a file path or binary file-like object.
+
+        Args:
+            source: Path to an XML file, or a readable binary stream.
+
+        Returns:
+            A Project instance.
+        """
+        from .project import Project
+
+        root = ET.parse(source, large_file_parser()).getroot()
+        numbers = [_id_number(id) for id in root.xpath("//@id")]
+        last_id = max((n for n in numbers if n is not None), default=-1)
+
+        pieces = []
+        # Whether each Structure child is a piece, or is left to Project.from_xml
+        structure_order = []
+        for parent, kind in ((root.find("Structure"), "structure"), (root.find("Arrangement/Lanes"), "lane")):
+            if parent is None:
+                continue
+            for child in list(parent):
+                if not isinstance(child.tag, str):
+                    parent.remove(child)
+                    continue
+                # Elements without a model class stay in the tree, so that the
+                # sequential pass keeps them exactly as a sequential load does
+                if kind == "structure":
+                    is_piece = child.tag in _STRUCTURE_PIECES
+                    structure_order.append(is_piece)
+                else:
+                    is_piece = registry.resolve_timeline(child.tag) is not None
+                if is_piece:
+                    pieces.append((kind, ET.tostring(child)))
+                    parent.remove(child)
+        structure_count = sum(1 for kind, _ in pieces if kind == "structure")
+
+        batches = [
+            (last_id + 1 + (index + 1) * _ID_STRIDE, batch)
+            for index, batch in enumerate(self._batches(pieces))
+        ]
+        objects, referenceables, worker_references = self._deserialize(batches)
+
+        with ReferenceTable.collect() as references:
+            self.references = references
+            references.merge(worker_references)
+            # What is left of the tree is small: Application, Transport, the
+            # Arrangement shell (markers, tempo automation) and Scenes.
+            project = Project.from_xml(root)
+            loaded, local = iter(objects[:structure_count]), iter(project.structure)
+            project.structure = [next(loaded) if is_piece else next(local) for is_piece in structure_order]
+            if project.arrangement is not None and project.arrangement.lanes is not None:
+                # Unknown lanes were kept in the Lanes' _xml_unknown by Project.from_xml
+                project.arrangement.lanes.lanes = objects[structure_count:]
+            self._register(referenceables, last_id)
+        return project
+
+    def _deserialize(self, batches):
+        """Deserialize all batches; returns merged (objects, referenceables, references)."""
+        if self.workers == 1 or len(batches) < 2:
+            return self._merge(map(_deserialize_pieces, batches))
+        with ProcessPoolExecutor(min(self.workers, len(batches))) as pool:
+            return self._merge(pool.map(_deserialize_pieces, batches))
+
+    @staticmethod
+    def _merge(outputs):
+        objects, referenceables, references = [], [], ReferenceTable()
+        for batch_objects, batch_referenceables, batch_references in outputs:
+            objects.extend(batch_objects)
+            referenceables.extend(batch_referenceables)
+            references.merge(batch_references)
+        return objects, referenceables, references
+
+    def _batches(self, pieces):
+        """Group consecutive pieces so that each task carries enough work."""
+        total = sum(len(xml) for _, xml in pieces)
+        target = max(_MIN_TASK_BYTES, total // (4 * self.workers))
+        batches, batch, size = [], [], 0
+        for piece in pieces:
+            batch.append(piece)
+            size += len(piece[1])
+            if size >= target:
+                batches.append(batch)
+                batch, size = [], 0
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _register(referenceables, last_id):
+        """Register the objects loaded by the workers with the active scope."""
+        scope = IdScope.current()
+        for obj in referenceables:
+            scope.register(obj)
+        # Objects created from here on must not reuse a loaded id
+        scope.reserve(f"id{last_id}")
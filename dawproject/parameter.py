@@ -1,6 +1,7 @@
 """Parameter model -- base class for parameters (RealParameter, BoolParameter)."""
 
 from .referenceable import Referenceable
+from .fieldSpec import Attribute, INTEGER
 
 
 class Parameter(Referenceable):
@@ -14,15 +15,6 @@ class Parameter(Referenceable):
         super().__init__(name, color, comment)
         self.parameter_id = parameter_id
 
-    def to_xml(self):
-        parameter_elem = super().to_xml()
-        if self.parameter_id is not None:
-            parameter_elem.set("parameterID", str(self.parameter_id))
-        return parameter_elem
-
     @classmethod
-    def from_xml(cls, element):
-        instance = super().from_xml(element)
-        parameter_id = element.get("parameterID")
-        instance.parameter_id = int(parameter_id) if parameter_id is not None else None
-        return instance
+    def _xml_fields(cls):
+        return (Attribute("parameterID", "parameter_id", INTEGER),)
@@ -1,6 +1,7 @@
 """Plugin model -- abstract base class for all plug-in formats."""
 
 from .device import Device
+from .fieldSpec import Attribute
 
 
 class Plugin(Device):
@@ -14,16 +15,6 @@ class Plugin(Device):
         super().__init__(**kwargs)
         self.plugin_version = plugin_version
 
-    def to_xml(self):
-        elem = super().to_xml()
-        if self.plugin_version is not None:
-            elem.set("pluginVersion", self.plugin_version)
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return None
-        instance = super().from_xml(element)
-        instance.plugin_version = element.get("pluginVersion")
-        return instance
+    def _xml_fields(cls):
+        return (Attribute("pluginVersion", "plugin_version"),)
@@ -0,0 +1,284 @@
+"""PointArray -- columnar, time-ordered storage of the points of a Points timeline."""
+
+from .arrayReader import LAYOUTS, INTERPOLATION_CODES
+from .columnStore import ColumnStore
+from .interpolation import Interpolation
+
+
+class PointArray(ColumnStore):
+    """The points of one kind as time-sorted parallel NumPy arrays.
+
+    An alternative to a list of Point objects for ``Points.points`` when
+    all points have the same kind: a ``time`` column and the kind's value
+    columns (``value`` as float64 for RealPoint, bool for BoolPoint, int64
+    for IntegerPoint and EnumPoint; ``numerator`` and ``denominator`` as
+    int32 for TimeSignaturePoint). RealPoint also has an ``interpolation``
+    column of int8 codes: 0 for HOLD, 1 for LINEAR, -1 when unset.
+
+    The rows are kept in time order, so that curves recorded at control
+    rate can be built and scanned quickly::
+
+        curve = PointArray(RealPoint)
+        for time, value in samples:
+            curve.add(time, value=value)        # amortized O(1) at the end
+        curve.add(1.5, value=0.0)               # binary-search insertion
+        bar = curve.time_range(4.0, 8.0)        # zero-copy view
+        bar.value *= 0.5                        # writes through
+        points.points = curve
+
+    Points at equal times keep the order they were added in. Assigning to
+    the ``time`` column can break the order; call ``sort()`` afterwards.
+
+    Iterating, or indexing with an integer, yields new Point objects (a
+    copy of the row). A missing float value is NaN; a missing integer or
+    boolean value is stored (and written) as 0 or false.
+
+    NumPy is an optional dependency (``pip install dawproject[columnar]``).
+    A project is loaded with PointArrays with ``columnar=True`` (see
+    ``Project.from_xml``); Points mixing kinds, or whose points are not in
+    time order, stay lists of Point objects so that they are written back
+    unchanged.
+
+    Args:
+        kind: The point class (e.g. RealPoint) or its tag.
+        time: Array-like of point times.
+        **columns: Array-likes of the kind's other columns, of the same
+            length (``interpolation`` may hold Interpolation members).
+    """
+
+    def __init__(self, kind, time=(), **columns):
+        import numpy as np
+
+        tag = _tag_of(kind)
+        names = _VALUE_NAMES[tag]
+        for name in columns:
+            if name not in names:
+                raise TypeError(f"{tag} has no column {name!r}")
+        interpolation = columns.get("interpolation")
+        if interpolation is not None and np.asarray(interpolation).dtype.kind not in "iu":
+            columns["interpolation"] = [_code(value) for value in interpolation]
+        self._init_columns(tag, dict(columns, time=time))
+        times = self.column("time")
+        if not np.all(times[1:] >= times[:-1]):
+            self._reorder(np.argsort(times, kind="stable"))
+
+    @property
+    def kind(self):
+        """The point class of the rows."""
+        from . import registry
+
+        return registry.classes_for(registry.POINT_TAGS)[self.tag]
+
+    @classmethod
+    def from_points(cls, points, kind=None):
+        """Create a PointArray from Point objects of one kind.
+
+        Args:
+            points: The points, in any order.
+            kind: The point class; by default the class of the points
+                (required when ``points`` is empty).
+
+        Raises:
+            ValueError: If the points are not all of the same kind.
+        """
+        # Sorted here (stably) so that the rows line up with the points' kept XML
+        points = sorted(points, key=lambda point: _sort_key(point.time))
+        if kind is None:
+            if not points:
+                raise ValueError("PointArray.from_points needs a kind for an empty list of points")
+            kind = type(points[0])
+        tag = _tag_of(kind)
+        if any(point.__class__.__name__ != tag for point in points):
+            raise ValueError(f"PointArray holds points of one kind ({tag}); use a list for mixed kinds")
+        columns = {
+            name: [_cell(name, dtype, getattr(point, name)) for point in points]
+            for name, dtype, _ in LAYOUTS[tag]
+        }
+        array = cls(tag, **columns)
+        for row, point in enumerate(points):
+            array._keep(row, point)
+        return array
+
+    @classmethod
+    def from_elements(cls, elements):
+        """Read point elements into a PointArray, without creating Point objects.
+
+        Used by columnar loading. The result is a list of Point objects
+        instead if the elements mix kinds or are not in time order (and an
+        empty list if there are none).
+        """
+        import numpy as np
+        from . import registry
+
+        classes = registry.classes_for(registry.POINT_TAGS)
+        elements = list(elements)
+        tags = {element.tag for element in elements}
+        if len(tags) == 1:
+            tag = tags.pop()
+            array = cls._read_elements(elements, tag, classes[tag].from_xml)
+            times = array.column("time")
+            if np.all(times[1:] >= times[:-1]):
+                return array
+        return [classes[element.tag].from_xml(element) for element in elements]
+
+    def to_points(self):
+        """Return the points as a list of new Point objects, in time order."""
+        return [self._point(row) for row in range(self._size)]
+
+    def _point(self, row):
+        values = {}
+        for name, dtype, _ in LAYOUTS[self.tag]:
+            value = self._data[name][row].item()
+            if dtype == "interpolation":
+                value = _MEMBERS[value] if value >= 0 else None
+            elif value != value:
+                # NaN
+                value = None
+            values[name] = value
+        point = self.kind(**values)
+        point._xml_unknown = self.unknown.get(row)
+        return point
+
+    def __iter__(self):
+        for row in range(self._size):
+            yield self._point(row)
+
+    def __getitem__(self, index):
+        import numpy as np
+
+        if isinstance(index, (int, np.integer)):
+            return self._point(self._row(index))
+        return self._select(index)
+
+    def __repr__(self):
+        return f"PointArray({self._size} {self.tag}s)"
+
+    def bisect(self, time, side="right"):
+        """Return the row at which a point at ``time`` would be inserted.
+
+        A binary search over the time column; ``side`` is "left" or
+        "right" (after the points at the same time), as in
+        ``numpy.searchsorted``. ``time`` may be an array of times.
+        """
+        import numpy as np
+
+        return np.searchsorted(self.column("time"), time, side=side)
+
+    def add(self, time, **values):
+        """Insert a point in time order and return its row.
+
+        A point at or after the last one is appended in amortized
+        constant time; an earlier one is inserted after the points at the
+        same time (found by binary search), moving the later rows.
+
+        Args:
+            time: The point's time.
+            **values: The kind's other columns (e.g. ``value`` and
+                ``interpolation``); missing ones are left unset.
+        """
+        layout = LAYOUTS[self.tag]
+        for name in values:
+            if name not in _VALUE_NAMES[self.tag]:
+                raise TypeError(f"{self.tag} has no column {name!r}")
+        if time is None:
+            time = float("nan")
+        data, size = self._data, self._size
+        row = size
+        if size and not time >= data["time"][size - 1]:
+            row = int(self.bisect(time))
+        if size == len(data["time"]):
+            self._reserve(size + 1)
+        for name, dtype, _ in layout:
+            column = data[name]
+            if row < size:
+                column[row + 1:size + 1] = column[row:size]
+            column[row] = time if name == "time" else _cell(name, dtype, values.get(name))
+        object.__setattr__(self, "_size", size + 1)
+        if row < size and self.unknown:
+            self.unknown = {(key + 1 if key >= row else key): value for key, value in self.unknown.items()}
+        return row
+
+    def append(self, point):
+        """Insert one Point of this kind in time order (see ``add``) and return its row."""
+        if point.__class__.__name__ != self.tag:
+            raise TypeError(f"PointArray of {self.tag} cannot hold a {type(point).__name__}")
+        row = self.add(point.time, **{name: getattr(point, name) for name in _VALUE_NAMES[self.tag]})
+        if point._xml_unknown is not None:
+            self.unknown[row] = point._xml_unknown
+        return row
+
+    def extend(self, points):
+        """Insert many points at once: another PointArray of this kind, or Point objects.
+
+        Points at or after the last one are appended in bulk; otherwise the
+        rows are merged by a stable sort.
+        """
+        import numpy as np
+
+        if not isinstance(points, PointArray):
+            points = PointArray.from_points(points, self.kind)
+        if points.tag != self.tag:
+            raise TypeError(f"PointArray of {self.tag} cannot hold {points.tag}s")
+        if not len(points):
+            return
+        merge = self._size and not points.column("time")[0] >= self.column("time")[-1]
+        self._extend_rows(points)
+        if merge:
+            self._reorder(np.argsort(self.column("time"), kind="stable"))
+
+    def time_range(self, start=None, end=None):
+        """Return the points with ``start <= time < end`` as a view.
+
+        The rows are found by binary search and the returned PointArray's
+        columns are views into this one, so no point data is copied and
+        writes to the columns go through. Either bound may be None.
+        """
+        lo = 0 if start is None else int(self.bisect(start, "left"))
+        hi = self._size if end is None else int(self.bisect(end, "left"))
+        return self[lo:max(lo, hi)]
+
+    def sort(self):
+        """Restore time order (stable) after the time column was modified."""
+        import numpy as np
+
+        self._reorder(np.argsort(self.column("time"), kind="stable"))
+
+
+# Interpolation member by code
+_MEMBERS = tuple(Interpolation)
+# The columns of each tag after ``time``
+_VALUE_NAMES = {tag: tuple(name for name, _, _ in layout[1:]) for tag, layout in LAYOUTS.items()}
+
+
+def _tag_of(kind):
+    from . import registry
+
+    tag = kind if isinstance(kind, str) else kind.__name__
+    if tag not in registry.POINT_TAGS:
+        raise ValueError(f"{kind!r} is not a point kind")
+    return tag
+
+
+def _code(value):
+    """The interpolation code of an Interpolation member, value string, code or None."""
+    if value is None:
+        return -1
+    if isinstance(value, Interpolation):
+        return INTERPOLATION_CODES[value.value]
+    if isinstance(value, str):
+        return INTERPOLATION_CODES[value]
+    return int(value)
+
+
+def _cell(name, dtype, value):
+    """The column entry of a Point attribute value (None when unset)."""
+    if dtype == "interpolation":
+        return _code(value)
+    if value is None:
+        return float("nan") if dtype.startswith("float") else 0
+    return value
+
+
+def _sort_key(time):
+    # NaN times sort last, as in numpy.argsort
+    return (time is None or time != time, time if time is not None and time == time else 0.0)
@@ -2,7 +2,8 @@
 
 from .timeline import Timeline
 from .automationTarget import AutomationTarget
-from .unit import Unit
+from .fieldSpec import Attribute, Child, Children, ENUM_TEXT
+from .pointArray import PointArray
 
 
 class Points(Timeline):
@@ -10,7 +11,8 @@ class Points(Timeline):
 
     Attributes:
         target: An AutomationTarget describing what parameter is automated.
-        points: List of Point objects (RealPoint, etc.).
+        points: List of Point objects (RealPoint, etc.), or a PointArray
+            holding points of one kind as time-sorted columns.
         unit: Optional unit string.
     """
 
@@ -27,42 +29,15 @@ class Points(Timeline):
     ):
         super().__init__(track, time_unit, name, color, comment)
         self.target = target if target else AutomationTarget()
-        self.points = points if points else []
+        self.points = points if points is not None else []
         self.unit = unit
 
-    def to_xml(self):
-        elem = super().to_xml()
-        if self.unit is not None:
-            unit_val = self.unit.value if isinstance(self.unit, Unit) else str(self.unit)
-            elem.set("unit", unit_val)
-        elem.append(self.target.to_xml())
-        for point in self.points:
-            elem.append(point.to_xml())
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
+    def _xml_fields(cls):
         from . import registry
-
-        instance = super().from_xml(element)
-
-        instance.unit = element.get("unit")
-
-        target_elem = element.find("Target")
-        instance.target = (
-            AutomationTarget.from_xml(target_elem)
-            if target_elem is not None
-            else AutomationTarget()
+        return (
+            # Written from a Unit, read back as the unit string
+            Attribute("unit", "unit", ENUM_TEXT),
+            Child("Target", "target", AutomationTarget, default_factory=AutomationTarget),
+            Children(registry.classes_for(registry.POINT_TAGS), "points", columns=PointArray),
         )
-
-        # Resolve point types via registry
-        points = []
-        point_tags = {"RealPoint", "EnumPoint", "BoolPoint", "IntegerPoint", "TimeSignaturePoint"}
-        for child in element:
-            if child.tag in point_tags:
-                point_cls = registry.resolve_point(child.tag)
-                if point_cls is not None:
-                    points.append(point_cls.from_xml(child))
-        instance.points = points
-
-        return instance
@@ -1,14 +1,14 @@
 """Project model -- the top-level container for a DAWproject file."""
 
-from lxml import etree as ET
 from .application import Application
 from .transport import Transport
 from .lane import Lane
 from .arrangement import Arrangement
 from .scene import Scene
+from .fieldSpec import XmlModel, Attribute, Child, Wrapped
 
 
-class Project:
+class Project(XmlModel):
     """Top-level DAWproject model containing structure, arrangement, and metadata.
 
     Attributes:
@@ -38,72 +38,49 @@ class Project:
         self.arrangement = arrangement
         self.scenes = scenes if scenes else []
 
-    def to_xml(self):
-        """Serialize this Project to an lxml Element."""
-        root = ET.Element("Project", version=self.version)
-
-        # Application element
-        app_elem = self.application.to_xml()
-        root.append(app_elem)
-
-        if self.transport:
-            root.append(self.transport.to_xml())
-
-        if self.structure:
-            structure_elem = ET.SubElement(root, "Structure")
-            for lane in self.structure:
-                structure_elem.append(lane.to_xml())
-
-        if self.arrangement:
-            root.append(self.arrangement.to_xml())
-
-        if self.scenes:
-            scenes_elem = ET.SubElement(root, "Scenes")
-            for scene in self.scenes:
-                scenes_elem.append(scene.to_xml())
-
-        return root
-
-    @classmethod
-    def from_xml(cls, element):
-        """Deserialize a Project from an lxml Element."""
+    @staticmethod
+    def structure_from_xml(element):
+        """Deserialize one child of the Structure element, dispatching by tag name."""
         from .track import Track
         from .channel import Channel
 
-        version = element.get("version", cls.CURRENT_VERSION)
+        if element.tag == "Track":
+            return Track.from_xml(element)
+        elif element.tag == "Channel":
+            return Channel.from_xml(element)
+        return Lane.from_xml(element)
 
-        app_elem = element.find("Application")
-        application = Application.from_xml(app_elem) if app_elem is not None else Application()
-
-        transport_elem = element.find("Transport")
-        transport = (
-            Transport.from_xml(transport_elem) if transport_elem is not None else None
-        )
-
-        # Dispatch structure children by tag name
-        structure_elem = element.find("Structure")
-        structure = []
-        if structure_elem is not None:
-            for child in structure_elem:
-                if child.tag == "Track":
-                    structure.append(Track.from_xml(child))
-                elif child.tag == "Channel":
-                    structure.append(Channel.from_xml(child))
-                else:
-                    structure.append(Lane.from_xml(child))
-
-        arrangement_elem = element.find("Arrangement")
-        arrangement = (
-            Arrangement.from_xml(arrangement_elem)
-            if arrangement_elem is not None
-            else None
+    @classmethod
+    def _xml_fields(cls):
+        return (
+            Attribute("version", "version", default=cls.CURRENT_VERSION),
+            Child("Application", "application", Application, default_factory=Application),
+            Child("Transport", "transport", Transport),
+            Wrapped("Structure", "structure", {}, fallback=cls.structure_from_xml),
+            Child("Arrangement", "arrangement", Arrangement),
+            Wrapped("Scenes", "scenes", {"Scene": Scene}),
         )
 
-        scenes_elem = element.find("Scenes")
-        scenes = []
-        if scenes_elem is not None:
-            for scene_elem in scenes_elem:
-                if scene_elem.tag == "Scene":
-                    scenes.append(Scene.from_xml(scene_elem))
-
-        return cls(version, application, transport, structure, arrangement, scenes)
+    @classmethod
+    def from_xml(cls, element, lazy=False, columnar=False):
+        """Deserialize a Project from an lxml Element.
+
+        References to objects later in the document are resolved once the
+        whole project has been read (see ReferenceTable).
+
+        Args:
+            element: The Project element.
+            lazy: If True, clip content, lanes and notes are parsed on first
+                access rather than now (see LazySubtree). The element tree
+                is kept alive by the project until then.
+            columnar: If True, the notes of each Notes timeline are loaded
+                into a NoteArray instead of a list of Note objects, and the
+                points of each Points timeline whose points have one kind
+                and are in time order into a PointArray (this needs NumPy).
+        """
+        from .referenceTable import ReferenceTable
+        from .lazySubtree import LazySubtree
+        from .fieldSpec import columnar_loading
+
+        with ReferenceTable.collect(), LazySubtree.enabled(lazy), columnar_loading(columnar):
+            return super().from_xml(element)
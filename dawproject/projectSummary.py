@@ -0,0 +1,139 @@
+"""ProjectSummary -- aggregate facts about a project from a single streaming pass."""
+
+from lxml import etree as ET
+
+from .streamingLoader import LARGE_FILE_PARSER_OPTIONS
+
+
+PLUGIN_TAGS = ("Vst2Plugin", "Vst3Plugin", "ClapPlugin", "AuPlugin")
+
+# Elements whose subtrees are freed as soon as they close
+_DISCARD_TAGS = ("Track", "Clip", "Notes", "Points", "Warps", "Markers", "markers", "Audio", "Video")
+
+
+class ProjectSummary:
+    """Library-browser facts about a project, gathered without loading it.
+
+    :meth:`from_xml_stream` makes one ``iterparse`` pass over project.xml
+    and only looks at the elements it needs; no model objects are built and
+    dense content (notes, automation points, warps) is discarded as soon as
+    it has been parsed.
+
+    Attributes:
+        version: The DAWproject format version.
+        application: Name of the application that wrote the file.
+        application_version: Version of that application.
+        tempo: Transport tempo (BPM), or None.
+        time_signature: ``(numerator, denominator)``, or None.
+        track_names: Names of all tracks (including nested tracks), in
+            document order.
+        clip_count: Number of clips, not counting clips nested inside clips.
+        arrangement_length: End time of the last arrangement clip, in
+            ``arrangement_time_unit``.
+        arrangement_time_unit: Time unit of the arrangement lanes.
+        plugins: One dict per plug-in instance with its ``format`` (tag,
+            e.g. "Vst3Plugin"), ``name``, ``vendor``, ``id`` and ``version``.
+    """
+
+    def __init__(self):
+        self.version = None
+        self.application = None
+        self.application_version = None
+        self.tempo = None
+        self.time_signature = None
+        self.track_names = []
+        self.clip_count = 0
+        self.arrangement_length = 0.0
+        self.arrangement_time_unit = None
+        self.plugins = []
+
+    @property
+    def track_count(self):
+        """Number of tracks, including nested tracks."""
+        return len(self.track_names)
+
+    @classmethod
+    def from_xml_stream(cls, source, parser_options=None):
+        """Summarize project.xml from a file path or binary stream.
+
+        Args:
+            source: Path to an XML file, or a readable binary stream.
+            parser_options: Extra keyword arguments for ``iterparse``.
+
+        Returns:
+            A ProjectSummary.
+        """
+        options = dict(LARGE_FILE_PARSER_OPTIONS)
+        if parser_options:
+            options.update(parser_options)
+
+        summary = cls()
+        in_arrangement = False
+        clip_depth = 0
+        tags = ("Project", "Application", "Transport", "Tempo", "TimeSignature", "Arrangement", "Lanes") \
+            + PLUGIN_TAGS + _DISCARD_TAGS
+        context = ET.iterparse(source, events=("start", "end"), tag=tags, **options)
+
+        for event, element in context:
+            tag = element.tag
+            if event == "start":
+                if tag == "Project" and element.getparent() is None:
+                    summary.version = element.get("version")
+                elif tag == "Track":
+                    summary.track_names.append(element.get("name"))
+                elif tag == "Arrangement":
+                    in_arrangement = True
+                elif tag == "Clip":
+                    if clip_depth == 0:
+                        summary._add_clip(element, in_arrangement)
+                    clip_depth += 1
+                elif tag == "Lanes" and in_arrangement and summary.arrangement_time_unit is None:
+                    summary.arrangement_time_unit = element.get("timeUnit")
+                continue
+
+            if tag == "Application":
+                summary.application = element.get("name")
+                summary.application_version = element.get("version")
+            elif tag == "Tempo" and element.getparent().tag == "Transport":
+                summary.tempo = _float(element.get("value"))
+            elif tag == "TimeSignature" and element.getparent().tag == "Transport":
+                numerator, denominator = element.get("numerator"), element.get("denominator")
+                if numerator is not None and denominator is not None:
+                    summary.time_signature = (int(numerator), int(denominator))
+            elif tag in PLUGIN_TAGS:
+                summary.plugins.append({
+                    "format": tag,
+                    "name": element.get("deviceName"),
+                    "vendor": element.get("deviceVendor"),
+                    "id": element.get("deviceID"),
+                    "version": element.get("pluginVersion"),
+                })
+            elif tag == "Arrangement":
+                in_arrangement = False
+            elif tag == "Clip":
+                clip_depth -= 1
+
+            if tag in _DISCARD_TAGS or tag in ("Transport", "Arrangement"):
+                element.clear(keep_tail=False)
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+        return summary
+
+    def _add_clip(self, element, in_arrangement):
+        self.clip_count += 1
+        if in_arrangement:
+            time = _float(element.get("time")) or 0.0
+            duration = _float(element.get("duration")) or 0.0
+            self.arrangement_length = max(self.arrangement_length, time + duration)
+
+    def __repr__(self):
+        return (
+            f"ProjectSummary(application={self.application!r}, tempo={self.tempo}, "
+            f"tracks={self.track_count}, clips={self.clip_count}, "
+            f"arrangement_length={self.arrangement_length}, plugins={len(self.plugins)})"
+        )
+
+
+def _float(value):
+    return float(value) if value is not None else None
@@ -0,0 +1,88 @@
+"""ReferenceTable -- deferred resolution of ID references while loading."""
+
+from contextlib import contextmanager
+
+from .idScope import IdScope
+
+
+class ReferenceTable:
+    """Fix-up table for the ID references met while deserializing.
+
+    While a table is active in the current IdScope, every reference that
+    ``Referenceable.get_by_id`` cannot resolve yet (typically a forward
+    reference such as a ``destination`` pointing at a channel later in the
+    document) is recorded as ``(holder, attribute, id)``. :meth:`resolve`
+    then patches all of them in one linear pass once the whole document has
+    been read.
+
+    Example::
+
+        with ReferenceTable.collect() as references:
+            project = Project.from_xml(root)
+        print(references.resolved, references.dangling_count)
+
+    Attributes:
+        pending: ``(holder, attribute, id)`` entries not resolved yet.
+        resolved: Number of references resolved (immediately or deferred).
+        dangling: ``(holder, attribute, id)`` entries whose ID did not exist
+            when the table was resolved. The attribute keeps the value the
+            deserializer gave it (None, or the ID string for automation
+            targets).
+    """
+
+    def __init__(self):
+        self.pending = []
+        self.resolved = 0
+        self.dangling = []
+
+    @property
+    def dangling_count(self):
+        return len(self.dangling)
+
+    @classmethod
+    @contextmanager
+    def collect(cls, scope=None):
+        """Defer reference resolution in ``scope`` (default: the active scope).
+
+        If a table is already collecting there, it is yielded and left to
+        its owner; otherwise a new table is installed, and resolved when the
+        block exits without an error.
+        """
+        scope = scope if scope is not None else IdScope.current()
+        if scope.fixups is not None:
+            yield scope.fixups
+            return
+        table = scope.fixups = cls()
+        try:
+            yield table
+        finally:
+            scope.fixups = None
+        table.resolve(scope)
+
+    def add(self, holder, attribute, id):
+        """Record a reference that could not be resolved yet."""
+        self.pending.append((holder, attribute, id))
+
+    def merge(self, other):
+        """Take over the pending entries and counts of another table."""
+        self.pending.extend(other.pending)
+        self.resolved += other.resolved
+        self.dangling.extend(other.dangling)
+
+    def resolve(self, scope=None):
+        """Patch every pending reference that the scope can now resolve."""
+        scope = scope if scope is not None else IdScope.current()
+        for holder, attribute, id in self.pending:
+            target = scope.get(id)
+            if target is None:
+                self.dangling.append((holder, attribute, id))
+            else:
+                setattr(holder, attribute, target)
+                self.resolved += 1
+        self.pending = []
+
+    def __repr__(self):
+        return (
+            f"ReferenceTable(resolved={self.resolved}, pending={len(self.pending)}, "
+            f"dangling={self.dangling_count})"
+        )
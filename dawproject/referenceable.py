@@ -1,61 +1,106 @@
 """Referenceable model -- base class for objects with a unique ID."""
 
+from abc import ABCMeta
+
+from .idScope import IdScope
 from .nameable import Nameable
+from .fieldSpec import Attribute
+
+
+class _ScopedRegistry(ABCMeta):
+    """Routes the legacy class-level ID state to the active IdScope."""
+
+    @property
+    def ID(cls):
+        return IdScope.current().next_id
+
+    @ID.setter
+    def ID(cls, value):
+        IdScope.current().next_id = value
+
+    @property
+    def _instances(cls):
+        return IdScope.current()._instances
+
+    @property
+    def _fixups(cls):
+        return IdScope.current().fixups
+
+    @_fixups.setter
+    def _fixups(cls, value):
+        IdScope.current().fixups = value
+
 
+class _LazyId:
+    """Allocates the ID of a Referenceable on first access.
 
-class Referenceable(Nameable):
+    A non-data descriptor: once allocated (or loaded, or assigned), the ID
+    is an ordinary instance attribute.
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        scope = IdScope.current()
+        id = instance.__dict__["id"] = scope.allocate()
+        scope.register(instance)
+        return id
+
+
+class Referenceable(Nameable, metaclass=_ScopedRegistry):
     """Base class for objects that can be referenced by ID.
 
-    Maintains a class-level registry of all instances by ID,
-    enabling cross-references (e.g. channel destinations, track references).
+    A new object gets its ID from the active IdScope (see there) on first
+    access to ``id``, which serialization does for every object it writes.
+    Objects that are never saved or looked up therefore never allocate or
+    register an ID, and a saved project numbers its new objects in document
+    order. ``Referenceable.ID`` and ``reset_id()`` act on the active scope.
 
     Attributes:
         id: Unique string identifier (e.g. "id0", "id1").
     """
 
-    ID = 0
-    _instances = {}
+    id = _LazyId()
 
     @classmethod
     def reset_id(cls):
         """Reset the ID counter and clear the instance registry."""
-        cls.ID = 0
-        cls._instances = {}
-
-    def __init__(self, name=None, color=None, comment=None):
-        super().__init__(name, color, comment)
-        self.id = f"id{Referenceable.ID}"
-        Referenceable._instances[self.id] = self
-        Referenceable.ID += 1
+        IdScope.current().clear()
 
-    def to_xml(self):
-        element = super().to_xml()
-        element.set("id", self.id)
-        return element
+    @classmethod
+    def _xml_fields(cls):
+        return (Attribute("id", "id"),)
 
     @classmethod
-    def from_xml(cls, element):
-        """Create instance from XML, registering it by ID."""
-        instance = super().from_xml(element)
-        # Read ID from XML; generate one if missing
-        xml_id = element.get("id") if element is not None else None
-        if xml_id:
-            instance.id = xml_id
-            # Advance the counter past any loaded ID so that newly created
-            # objects never collide with deserialized ones.
-            try:
-                num = int(xml_id.removeprefix("id"))
-                if num >= Referenceable.ID:
-                    Referenceable.ID = num + 1
-            except (ValueError, AttributeError):
-                pass
-        else:
-            instance.id = f"id{Referenceable.ID}"
-            Referenceable.ID += 1
-        Referenceable._instances[instance.id] = instance
-        return instance
+    def _register_from_xml(cls, instance, element):
+        """Register the instance (under its XML id) before its children load."""
+        if not instance.id:
+            # No id in the XML: allocate one on first access, like a new object
+            del instance.id
+            return
+        scope = IdScope.current()
+        # Advance the counter past any loaded ID so that newly created
+        # objects never collide with deserialized ones.
+        scope.reserve(instance.id)
+        scope.register(instance)
 
     @classmethod
-    def get_by_id(cls, id):
-        """Look up a Referenceable instance by its ID string."""
-        return cls._instances.get(id)
+    def get_by_id(cls, id, holder=None, attribute=None):
+        """Look up a Referenceable instance by its ID string.
+
+        Args:
+            id: The ID to look up.
+            holder: The object whose ``attribute`` receives the result. If the
+                ID is unknown while a ReferenceTable is collecting, the
+                reference is recorded so that it can be patched later.
+            attribute: Name of the attribute on ``holder``.
+        """
+        scope = IdScope.current()
+        instance = scope.get(id)
+        references = scope.fixups
+        if holder is not None and references is not None:
+            if instance is None:
+                references.add(holder, attribute, id)
+            else:
+                references.resolved += 1
+        return instance
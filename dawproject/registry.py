@@ -8,6 +8,23 @@ for polymorphic deserialization across modules.
 _TAG_REGISTRY = {}
 _REGISTRY_POPULATED = False
 
+# Tags of all Timeline subclasses (elements that may appear as lanes or clip content)
+TIMELINE_TAGS = (
+    "Lanes", "Clips", "Notes", "Markers", "markers", "Points",
+    "Warps", "Audio", "Video", "MediaFile", "ClipSlot",
+)
+POINT_TAGS = ("RealPoint", "BoolPoint", "EnumPoint", "IntegerPoint", "TimeSignaturePoint")
+PARAMETER_TAGS = (
+    "BoolParameter", "RealParameter", "IntegerParameter", "EnumParameter", "TimeSignatureParameter",
+)
+DEVICE_TAGS = (
+    "Device", "BuiltinDevice", "Equalizer", "Compressor", "NoiseGate", "Limiter",
+    "Plugin", "Vst2Plugin", "Vst3Plugin", "ClapPlugin", "AuPlugin",
+)
+
+# Tag -> class dicts per kind, built once by classes_for()
+_KIND_MAPS = {}
+
 
 def register(tag_name, cls):
     """Register a class for a given XML tag name."""
@@ -102,25 +119,42 @@ def populate_registry():
     register("AuPlugin", AuPlugin)
 
 
+def classes_for(tags):
+    """Return a dict mapping each of ``tags`` to its registered class.
+
+    The dict is built once per tag tuple (e.g. TIMELINE_TAGS) and shared,
+    so that deserializers can dispatch on it without further lookups.
+    """
+    classes = _KIND_MAPS.get(tags)
+    if classes is None:
+        populate_registry()
+        classes = _KIND_MAPS[tags] = {tag: _TAG_REGISTRY[tag] for tag in tags}
+    return classes
+
+
 def resolve_timeline(tag_name):
     """Look up a Timeline subclass by XML tag name."""
-    populate_registry()
-    return get_class(tag_name)
+    if not _REGISTRY_POPULATED:
+        populate_registry()
+    return _TAG_REGISTRY.get(tag_name)
 
 
 def resolve_point(tag_name):
     """Look up a Point subclass by XML tag name."""
-    populate_registry()
-    return get_class(tag_name)
+    if not _REGISTRY_POPULATED:
+        populate_registry()
+    return _TAG_REGISTRY.get(tag_name)
 
 
 def resolve_parameter(tag_name):
     """Look up a Parameter subclass by XML tag name."""
-    populate_registry()
-    return get_class(tag_name)
+    if not _REGISTRY_POPULATED:
+        populate_registry()
+    return _TAG_REGISTRY.get(tag_name)
 
 
 def resolve_device(tag_name):
     """Look up a Device subclass by XML tag name."""
-    populate_registry()
-    return get_class(tag_name)
+    if not _REGISTRY_POPULATED:
+        populate_registry()
+    return _TAG_REGISTRY.get(tag_name)
@@ -1,7 +1,7 @@
 """Scene model -- a scene containing timeline content."""
 
-from lxml import etree as ET
 from .referenceable import Referenceable
+from .fieldSpec import Child
 
 
 class Scene(Referenceable):
@@ -15,27 +15,8 @@ class Scene(Referenceable):
         super().__init__(name, color, comment)
         self.content = content
 
-    def to_xml(self):
-        scene_elem = super().to_xml()
-        scene_elem.tag = "Scene"
-
-        if self.content is not None:
-            scene_elem.append(self.content.to_xml())
-
-        return scene_elem
-
     @classmethod
-    def from_xml(cls, element):
+    def _xml_fields(cls):
         from . import registry
-
-        instance = super().from_xml(element)
-
-        # Look for a Timeline subclass child element
-        instance.content = None
-        for child in element:
-            content_cls = registry.resolve_timeline(child.tag)
-            if content_cls is not None:
-                instance.content = content_cls.from_xml(child)
-                break
-
-        return instance
+        # The first Timeline subclass child is the content
+        return (Child(registry.classes_for(registry.TIMELINE_TAGS), "content"),)
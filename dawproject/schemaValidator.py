@@ -0,0 +1,218 @@
+"""SchemaValidator -- validation against Project.xsd and MetaData.xsd with cached schemas."""
+
+import threading
+from pathlib import Path
+from zipfile import ZipFile, BadZipFile
+
+from lxml import etree as ET
+
+
+# The schemas ship at the repository root, next to the package
+SCHEMA_DIR = Path(__file__).parent.parent
+PROJECT_SCHEMA = "Project.xsd"
+METADATA_SCHEMA = "MetaData.xsd"
+
+# Elements of the fileReference type in Project.xsd
+FILE_REFERENCE_TAGS = ("File", "State")
+
+
+class ArchiveValidationResult:
+    """Outcome of validating a .dawproject archive on disk.
+
+    A result is truthy when the archive is valid.
+
+    Attributes:
+        errors: Schema and structure errors, each prefixed with the entry
+            it was found in.
+        missing_files: Paths of internal FileReferences (``external="false"``)
+            that have no entry in the archive.
+    """
+
+    def __init__(self):
+        self.errors = []
+        self.missing_files = []
+
+    @property
+    def valid(self):
+        return not self.errors and not self.missing_files
+
+    def __bool__(self):
+        return self.valid
+
+    def __repr__(self):
+        return (
+            f"ArchiveValidationResult(valid={self.valid}, errors={len(self.errors)}, "
+            f"missing_files={len(self.missing_files)})"
+        )
+
+
+class SchemaValidator:
+    """Validates project and metadata XML against the DAWproject schemas.
+
+    Each schema file is read and compiled only once per process; every
+    SchemaValidator shares the compiled schemas.  Validation runs directly
+    on an lxml element tree, so a project serialized once with ``to_xml()``
+    can be validated and then written without being serialized again.
+
+    Example::
+
+        validator = SchemaValidator()
+        root = project.to_xml()
+        validator.validate_project(root)
+
+    Attributes:
+        schema_dir: Directory containing Project.xsd and MetaData.xsd.
+    """
+
+    # Compiled schemas by path, shared by all instances
+    _compiled = {}
+    _compile_lock = threading.Lock()
+
+    def __init__(self, schema_dir=None):
+        self.schema_dir = Path(schema_dir) if schema_dir is not None else SCHEMA_DIR
+
+    @classmethod
+    def compiled_schema(cls, path):
+        """Return the compiled XMLSchema for an .xsd file, compiling it on first use."""
+        key = str(Path(path).resolve())
+        entry = cls._compiled.get(key)
+        if entry is None:
+            with cls._compile_lock:
+                entry = cls._compiled.get(key)
+                if entry is None:
+                    schema = ET.XMLSchema(ET.parse(key))
+                    # An XMLSchema keeps its error log on the instance, so
+                    # validations with the same schema must not overlap.
+                    entry = cls._compiled[key] = (schema, threading.Lock())
+        return entry
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget all compiled schemas (e.g. after editing an .xsd file)."""
+        with cls._compile_lock:
+            cls._compiled.clear()
+
+    def validate_project(self, project):
+        """Validate a project against Project.xsd.
+
+        Args:
+            project: A Project, its element tree (from ``to_xml()``), or the
+                serialized document as bytes.
+
+        Raises:
+            IOError: If the project is invalid or the schema cannot be loaded.
+        """
+        self._validate(PROJECT_SCHEMA, project)
+
+    def validate_metadata(self, metadata):
+        """Validate metadata against MetaData.xsd.
+
+        Args:
+            metadata: A MetaData, its element tree, or serialized bytes.
+
+        Raises:
+            IOError: If the metadata is invalid or the schema cannot be loaded.
+        """
+        self._validate(METADATA_SCHEMA, metadata)
+
+    def project_errors(self, project):
+        """Return the schema violations of a project as a list of messages."""
+        return self._errors(PROJECT_SCHEMA, project)
+
+    def metadata_errors(self, metadata):
+        """Return the schema violations of metadata as a list of messages."""
+        return self._errors(METADATA_SCHEMA, metadata)
+
+    def validate_archive(self, file):
+        """Validate a .dawproject archive without building the object model.
+
+        project.xml and metadata.xml are streamed from the zip into lxml's
+        validating parser (no Project or MetaData objects are created, and
+        parsed elements are freed as soon as they close). The path of every
+        internal FileReference is then checked against the zip entries.
+
+        Args:
+            file: Path to (or binary file object of) the .dawproject file.
+
+        Returns:
+            An ArchiveValidationResult.
+        """
+        from .dawProject import PROJECT_FILE, METADATA_FILE
+
+        result = ArchiveValidationResult()
+        try:
+            zip_file = ZipFile(file, "r")
+        except (OSError, BadZipFile) as e:
+            result.errors.append(f"{file}: not a readable zip archive: {e}")
+            return result
+
+        with zip_file:
+            entries = set(zip_file.namelist())
+            if PROJECT_FILE not in entries:
+                result.errors.append(f"{PROJECT_FILE}: missing from the archive")
+            else:
+                references = self._stream_validate(zip_file, PROJECT_FILE, PROJECT_SCHEMA, result)
+                result.missing_files = [path for path in references if path not in entries]
+            if METADATA_FILE in entries:
+                self._stream_validate(zip_file, METADATA_FILE, METADATA_SCHEMA, result)
+        return result
+
+    def _stream_validate(self, zip_file, entry_name, schema_name, result):
+        """Validate one XML entry while parsing it; return its internal file paths."""
+        try:
+            schema, lock = self.compiled_schema(self.schema_dir / schema_name)
+        except (OSError, ET.XMLSchemaParseError, ET.XMLSyntaxError) as e:
+            raise IOError(f"Could not load schema {schema_name}: {e}")
+
+        references = []
+        with lock, zip_file.open(entry_name) as stream:
+            context = ET.iterparse(stream, events=("end",), schema=schema, huge_tree=True)
+            try:
+                for _, element in context:
+                    if element.tag in FILE_REFERENCE_TAGS:
+                        if element.get("external", "false") not in ("true", "1"):
+                            references.append(element.get("path", ""))
+                    # Free everything parsed so far; validation does not need it
+                    element.clear(keep_tail=False)
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+            except ET.XMLSyntaxError as e:
+                messages = [
+                    f"{error.message} (line {error.line})" if error.line else error.message
+                    for error in context.error_log
+                    if error.level >= ET.ErrorLevels.ERROR
+                ]
+                result.errors.extend(f"{entry_name}: {message}" for message in messages or [str(e)])
+        return list(dict.fromkeys(references))
+
+    def _validate(self, schema_name, document):
+        errors = self._errors(schema_name, document)
+        if errors:
+            raise IOError(f"Schema validation error: {errors[0]}")
+
+    def _errors(self, schema_name, document):
+        try:
+            schema, lock = self.compiled_schema(self.schema_dir / schema_name)
+        except (OSError, ET.XMLSchemaParseError, ET.XMLSyntaxError) as e:
+            raise IOError(f"Could not load schema {schema_name}: {e}")
+
+        tree = self._as_tree(document)
+        with lock:
+            if schema.validate(tree):
+                return []
+            return [
+                f"{error.message} (line {error.line})" if error.line else error.message
+                for error in schema.error_log
+            ]
+
+    @staticmethod
+    def _as_tree(document):
+        """Return an lxml element (tree) for a model object, element or bytes."""
+        if isinstance(document, (ET._Element, ET._ElementTree)):
+            return document
+        if isinstance(document, (bytes, bytearray, memoryview)):
+            try:
+                return ET.fromstring(bytes(document))
+            except ET.XMLSyntaxError as e:
+                raise IOError(f"Schema validation error: {e}")
+        return document.to_xml()
@@ -1,9 +1,9 @@
 """Send model -- an auxiliary bus send from a channel."""
 
-from lxml import etree as ET
 from .referenceable import Referenceable
 from .sendType import SendType
 from .realParameter import RealParameter
+from .fieldSpec import Attribute, Reference, Child, enum_codec
 
 
 class Send(Referenceable):
@@ -32,52 +32,11 @@ class Send(Referenceable):
         self.type = type
         self.destination = destination
 
-    def to_xml(self):
-        send_elem = super().to_xml()
-        send_elem.tag = "Send"
-
-        # Serialize type as enum value string
-        if self.type is not None:
-            type_val = self.type.value if isinstance(self.type, SendType) else str(self.type)
-            send_elem.set("type", type_val)
-
-        if self.destination is not None:
-            send_elem.set("destination", str(self.destination.id))
-
-        # XSD sequence order: Pan, Volume
-        if self.pan is not None:
-            pan_xml = self.pan.to_xml()
-            pan_xml.tag = "Pan"
-            send_elem.append(pan_xml)
-
-        if self.volume is not None:
-            vol_xml = self.volume.to_xml()
-            vol_xml.tag = "Volume"
-            send_elem.append(vol_xml)
-
-        return send_elem
-
     @classmethod
-    def from_xml(cls, element):
-        instance = super().from_xml(element)
-
-        volume_elem = element.find("Volume")
-        instance.volume = (
-            RealParameter.from_xml(volume_elem) if volume_elem is not None else None
-        )
-
-        pan_elem = element.find("Pan")
-        instance.pan = (
-            RealParameter.from_xml(pan_elem) if pan_elem is not None else None
+    def _xml_fields(cls):
+        return (
+            Attribute("type", "type", enum_codec(SendType), default=SendType.POST),
+            Reference("destination", "destination"),
+            Child("Pan", "pan", RealParameter),
+            Child("Volume", "volume", RealParameter),
         )
-
-        type_str = element.get("type")
-        instance.type = SendType(type_str) if type_str else SendType.POST
-
-        destination_id = element.get("destination")
-        if destination_id is not None:
-            instance.destination = Referenceable.get_by_id(destination_id)
-        else:
-            instance.destination = None
-
-        return instance
@@ -0,0 +1,171 @@
+"""StreamingLoader -- bounded-memory loading of project.xml via lxml iterparse.
+
+The regular loader reads the whole ``project.xml`` entry into memory, builds
+a complete lxml tree and only then walks it with ``Project.from_xml``.  The
+streaming loader instead feeds the entry stream straight into
+``etree.iterparse`` and deserializes each top-level ``Structure`` entry,
+``Arrangement/Lanes`` child and ``Scene`` as soon as its subtree closes.
+Consumed elements are cleared immediately, so at any point only the subtree
+currently being deserialized is held as XML.
+"""
+
+from lxml import etree as ET
+
+from . import registry
+
+
+# Parser options suited to very large documents: lift libxml2's hard limits
+# on tree depth and text node size, and drop ignorable whitespace so that
+# pretty-printed files do not allocate a text node for every indentation.
+LARGE_FILE_PARSER_OPTIONS = {
+    "huge_tree": True,
+    "remove_blank_text": True,
+}
+
+
+def large_file_parser(**kwargs):
+    """Create an XMLParser configured for large project files.
+
+    Keyword arguments override or extend LARGE_FILE_PARSER_OPTIONS.
+    """
+    options = dict(LARGE_FILE_PARSER_OPTIONS)
+    options.update(kwargs)
+    return ET.XMLParser(**options)
+
+
+class StreamingLoader:
+    """Incrementally deserializes a Project from a binary XML stream.
+
+    The document is parsed with ``iterparse``; whenever a streamable subtree
+    (a top-level structure entry, an arrangement lane or a scene) closes, it
+    is turned into model objects and its XML is discarded.  The remaining
+    small parts of the document (Application, Transport, Arrangement
+    attributes and non-lane children) are deserialized from the pruned tree
+    once the root element closes.
+
+    With a LoadFilter, tracks and timelines outside the selection are
+    discarded as soon as their subtree closes, before any model object is
+    built for them.
+
+    Example::
+
+        with zip_file.open("project.xml") as stream:
+            project = StreamingLoader().load(stream)
+
+    References to elements later in the document are resolved in one pass
+    once the root element has closed (see ReferenceTable).
+
+    Attributes:
+        parser_options: Keyword arguments passed to ``iterparse``.
+        load_filter: An optional LoadFilter for a partial load.
+        references: The ReferenceTable of the last load (resolved and
+            dangling reference counts).
+    """
+
+    def __init__(self, parser_options=None, load_filter=None):
+        self.parser_options = dict(LARGE_FILE_PARSER_OPTIONS)
+        if parser_options:
+            self.parser_options.update(parser_options)
+        self.load_filter = load_filter
+        self.references = None
+
+    def load(self, source):
+        """Deserialize a Project from a file path or binary file-like object.
+
+        Args:
+            source: Path to an XML file, or a readable binary stream.
+
+        Returns:
+            A Project instance.
+        """
+        from .referenceTable import ReferenceTable
+
+        with ReferenceTable.collect() as references:
+            self.references = references
+            return self._load(source)
+
+    def _load(self, source):
+        from .project import Project
+        from .arrangement import Arrangement
+        from .lanes import Lanes
+        from .scene import Scene
+
+        structure = []
+        arrangement_lanes = []
+        scenes = []
+        lanes = None
+        arrangement = None
+        project = None
+        load_filter = self.load_filter
+        selected_track_ids = set()
+
+        # Only ask lxml for events on elements that can start a streamable
+        # subtree; dense leaf elements (Note, RealPoint, ...) then never
+        # reach Python at all.
+        context = ET.iterparse(
+            source, events=("end",), tag=self._event_tags(load_filter), **self.parser_options
+        )
+        for _, element in context:
+            parent = element.getparent()
+            if parent is None:
+                project = Project.from_xml(element)
+                project.structure = structure
+                project.arrangement = arrangement
+                project.scenes = scenes
+                continue
+
+            if load_filter is not None:
+                if element.tag == "Track":
+                    if not load_filter.select_track(element):
+                        self._discard(element)
+                        continue
+                    selected_track_ids.add(element.get("id"))
+                elif load_filter.skips_timeline(element, selected_track_ids):
+                    self._discard(element)
+                    continue
+
+            grandparent = parent.getparent()
+            at_top = grandparent is not None and grandparent.getparent() is None
+
+            if at_top and parent.tag == "Structure":
+                structure.append(Project.structure_from_xml(element))
+                self._discard(element)
+            elif at_top and parent.tag == "Scenes":
+                scenes.append(Scene.from_xml(element))
+                self._discard(element)
+            elif at_top and parent.tag == "Arrangement" and element.tag == "Lanes":
+                # Children were consumed below; this only reads the attributes
+                lanes = Lanes.from_xml(element)
+                lanes.lanes = arrangement_lanes
+                self._discard(element)
+            elif (
+                parent.tag == "Lanes"
+                and grandparent.tag == "Arrangement"
+                and grandparent.getparent().getparent() is None
+            ):
+                lane_cls = registry.resolve_timeline(element.tag)
+                if lane_cls is not None:
+                    arrangement_lanes.append(lane_cls.from_xml(element))
+                self._discard(element)
+            elif grandparent is None and element.tag == "Arrangement":
+                arrangement = Arrangement.from_xml(element)
+                arrangement.lanes = lanes
+                self._discard(element)
+
+        return project
+
+    @staticmethod
+    def _event_tags(load_filter=None):
+        """Tags of the elements that can root a streamable subtree."""
+        tags = ["Project", "Track", "Channel", "Scene", "Arrangement"] + list(registry.TIMELINE_TAGS)
+        if load_filter is not None:
+            tags += [tag for tag in load_filter.skip_timelines if tag not in tags]
+        return tags
+
+    @staticmethod
+    def _discard(element):
+        """Free an already-deserialized element and detach it from the tree."""
+        element.clear(keep_tail=False)
+        parent = element.getparent()
+        if parent is not None:
+            parent.remove(element)
@@ -0,0 +1,102 @@
+"""StreamingWriter -- incremental serialization of model objects via lxml xmlfile.
+
+``Project.to_xml()`` builds the complete element tree before anything can be
+written, and ``ET.tostring`` then renders the whole document into a single
+bytes object.  The streaming writer instead lets every model class emit its
+own subtree into an ``etree.xmlfile`` context: container classes (Project,
+Arrangement, Lanes, Clips, Notes, Points, ...) open their element and stream
+their children one by one, so only one small leaf subtree exists as an lxml
+element at any time.
+"""
+
+from contextlib import contextmanager
+
+from lxml import etree as ET
+
+
+class StreamingWriter:
+    """Writes model objects to an ``etree.xmlfile`` context.
+
+    Model objects serialize themselves through ``write_xml(writer, tag=None)``:
+    containers open a structural element with :meth:`element` and write
+    their children into it, leaves hand a complete element to :meth:`write`.
+
+    Attributes:
+        pretty_print: Whether to indent the output. Compact output is
+            noticeably smaller for dense note and automation lanes.
+        indent: The indentation string used per nesting level.
+    """
+
+    def __init__(self, xf, pretty_print=True, indent="  "):
+        self.xf = xf
+        self.pretty_print = pretty_print
+        self.indent = indent
+        self._depth = 0
+        # One flag per open element: whether anything has been written into it
+        self._has_children = []
+
+    @classmethod
+    def serialize(cls, obj, stream, pretty_print=True):
+        """Write an XML document for a model object to a binary stream.
+
+        Args:
+            obj: The root model object (Project, MetaData, ...).
+            stream: A writable binary file-like object.
+            pretty_print: Whether to indent the output. Pretty output ends
+                with a newline, as with ``ET.tostring(pretty_print=True)``.
+        """
+        with ET.xmlfile(stream, encoding="UTF-8") as xf:
+            xf.write_declaration()
+            cls(xf, pretty_print).write_object(obj)
+        if pretty_print:
+            # xmlfile does not accept text after the root element
+            stream.write(b"\n")
+
+    def write_object(self, obj, tag=None):
+        """Write a model object, streaming it if it supports ``write_xml``.
+
+        An lxml element that has already been built (e.g. by ``to_xml()``)
+        is written as it is.
+        """
+        if isinstance(obj, ET._Element):
+            if tag is not None:
+                obj.tag = tag
+            self.write(obj)
+            return
+        write_xml = getattr(obj, "write_xml", None)
+        if write_xml is not None:
+            write_xml(self, tag)
+        else:
+            element = obj.to_xml()
+            if tag is not None:
+                element.tag = tag
+            self.write(element)
+
+    @contextmanager
+    def element(self, tag, attrib=None):
+        """Open a structural element; children are written inside the block."""
+        self._begin_child()
+        with self.xf.element(tag, attrib or {}):
+            self._depth += 1
+            self._has_children.append(False)
+            try:
+                yield
+            finally:
+                has_children = self._has_children.pop()
+                self._depth -= 1
+                if self.pretty_print and has_children:
+                    self.xf.write("\n" + self.indent * self._depth)
+
+    def write(self, element):
+        """Write a complete element subtree at the current position."""
+        self._begin_child()
+        if self.pretty_print and len(element):
+            ET.indent(element, space=self.indent, level=self._depth)
+        element.tail = None
+        self.xf.write(element)
+
+    def _begin_child(self):
+        if self._has_children:
+            self._has_children[-1] = True
+        if self.pretty_print and self._depth:
+            self.xf.write("\n" + self.indent * self._depth)
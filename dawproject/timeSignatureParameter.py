@@ -1,6 +1,7 @@
 """TimeSignatureParameter model -- numerator/denominator time signature."""
 
 from .parameter import Parameter
+from .fieldSpec import Attribute, INTEGER
 
 
 class TimeSignatureParameter(Parameter):
@@ -14,26 +15,16 @@ class TimeSignatureParameter(Parameter):
         denominator: The bottom number (e.g. 4 in 4/4).
     """
 
+    _xml_default_when_missing = True
+
     def __init__(self, numerator=None, denominator=None, **kwargs):
         super().__init__(**kwargs)
         self.numerator = numerator
         self.denominator = denominator
 
-    def to_xml(self):
-        elem = super().to_xml()
-        if self.numerator is not None:
-            elem.set("numerator", str(self.numerator))
-        if self.denominator is not None:
-            elem.set("denominator", str(self.denominator))
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return cls()
-        instance = super().from_xml(element)
-        numerator = element.get("numerator")
-        instance.numerator = int(numerator) if numerator is not None else None
-        denominator = element.get("denominator")
-        instance.denominator = int(denominator) if denominator is not None else None
-        return instance
+    def _xml_fields(cls):
+        return (
+            Attribute("numerator", "numerator", INTEGER),
+            Attribute("denominator", "denominator", INTEGER),
+        )
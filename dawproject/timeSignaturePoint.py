@@ -1,6 +1,7 @@
 """TimeSignaturePoint model -- a time-signature automation point."""
 
 from .point import Point
+from .fieldSpec import Attribute, INTEGER
 
 
 class TimeSignaturePoint(Point):
@@ -12,25 +13,16 @@ class TimeSignaturePoint(Point):
         denominator: Denominator of the time signature (e.g. 4 in 3/4).
     """
 
+    __slots__ = ("numerator", "denominator")
+
     def __init__(self, time=None, numerator=None, denominator=None):
         super().__init__(time)
         self.numerator = numerator
         self.denominator = denominator
 
-    def to_xml(self):
-        elem = super().to_xml()
-        elem.tag = "TimeSignaturePoint"
-        if self.numerator is not None:
-            elem.set("numerator", str(self.numerator))
-        if self.denominator is not None:
-            elem.set("denominator", str(self.denominator))
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
-        instance = super().from_xml(element)
-        numerator = element.get("numerator")
-        instance.numerator = int(numerator) if numerator is not None else None
-        denominator = element.get("denominator")
-        instance.denominator = int(denominator) if denominator is not None else None
-        return instance
+    def _xml_fields(cls):
+        return (
+            Attribute("numerator", "numerator", INTEGER),
+            Attribute("denominator", "denominator", INTEGER),
+        )
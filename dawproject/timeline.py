@@ -1,6 +1,7 @@
 """Timeline model -- abstract base for all timeline content types."""
 
 from .referenceable import Referenceable
+from .fieldSpec import Attribute, Reference, enum_codec
 
 
 class Timeline(Referenceable):
@@ -16,39 +17,10 @@ class Timeline(Referenceable):
         self.track = track
         self.time_unit = time_unit
 
-    def to_xml(self):
-        """Serialize base Timeline attributes (id, name, color, comment, track, timeUnit)."""
-        from .timeUnit import TimeUnit
-
-        elem = super().to_xml()  # Referenceable adds id; Nameable adds name/color/comment
-        if self.track is not None:
-            elem.set("track", str(self.track.id))
-        if self.time_unit is not None:
-            tu = self.time_unit.value if isinstance(self.time_unit, TimeUnit) else str(self.time_unit)
-            elem.set("timeUnit", tu)
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
-        """Base deserialization for Timeline attributes."""
-        instance = super().from_xml(element)
-
-        # Parse track reference
-        track_id = element.get("track")
-        if track_id:
-            instance.track = Referenceable.get_by_id(track_id)
-        else:
-            instance.track = None
-
-        # Parse time_unit
-        time_unit_str = element.get("timeUnit")
-        if time_unit_str:
-            from .timeUnit import TimeUnit
-            try:
-                instance.time_unit = TimeUnit(time_unit_str)
-            except ValueError:
-                instance.time_unit = None
-        else:
-            instance.time_unit = None
-
-        return instance
+    def _xml_fields(cls):
+        from .timeUnit import TimeUnit
+        return (
+            Attribute("timeUnit", "time_unit", enum_codec(TimeUnit, invalid="none")),
+            Reference("track", "track"),
+        )
@@ -1,9 +1,9 @@
 """Track model -- a track in the project structure."""
 
-from lxml import etree as ET
 from .lane import Lane
 from .channel import Channel
 from .contentType import ContentType
+from .fieldSpec import Attribute, Child, Children, BOOLEAN, enum_list_codec
 
 
 class Track(Lane):
@@ -32,58 +32,12 @@ class Track(Lane):
         self.channel = channel
         self.tracks = tracks if tracks else []
 
-    def to_xml(self):
-        track_elem = super().to_xml()
-        track_elem.tag = "Track"
-
-        # Set content_type as a space-separated attribute (per XSD xs:list)
-        if self.content_type:
-            content_type_str = " ".join(
-                ct.value if isinstance(ct, ContentType) else str(ct)
-                for ct in self.content_type
-            )
-            track_elem.set("contentType", content_type_str)
-
-        if self.loaded is not None:
-            track_elem.set("loaded", str(self.loaded).lower())
-
-        # Append Channel as a nested XML element
-        if self.channel is not None:
-            track_elem.append(self.channel.to_xml())
-
-        # Recursively add nested tracks
-        for track in self.tracks:
-            track_elem.append(track.to_xml())
-
-        return track_elem
-
     @classmethod
-    def from_xml(cls, element):
-        instance = super().from_xml(element)
-
-        # Read contentType as a space-separated XML attribute (per XSD xs:list).
-        # Also accept commas for backward compatibility with older files.
-        content_type_str = element.get("contentType")
-        if content_type_str:
-            # Normalize: replace commas with spaces, then split on whitespace
-            normalized = content_type_str.replace(",", " ")
-            instance.content_type = [
-                ContentType(ct) for ct in normalized.split() if ct
-            ]
-        else:
-            instance.content_type = []
-
-        loaded = element.get("loaded")
-        instance.loaded = loaded.lower() == "true" if loaded else None
-
-        channel_elem = element.find("Channel")
-        instance.channel = (
-            Channel.from_xml(channel_elem) if channel_elem is not None else None
+    def _xml_fields(cls):
+        return (
+            # xs:list of content types; commas are accepted for older files
+            Attribute("contentType", "content_type", enum_list_codec(ContentType), default_factory=list),
+            Attribute("loaded", "loaded", BOOLEAN),
+            Child("Channel", "channel", Channel),
+            Children("Track", "tracks", Track),
         )
-
-        tracks = []
-        for track_elem in element.findall("Track"):
-            tracks.append(Track.from_xml(track_elem))
-        instance.tracks = tracks
-
-        return instance
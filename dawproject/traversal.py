@@ -0,0 +1,118 @@
+"""Generic traversal of the DAWproject object graph."""
+
+from .fieldSpec import XmlModel
+from .noteArray import NoteArray
+
+
+# Per-type caches: whether a type is a model class, and its slot names
+_model_types = {}
+_slot_names = {}
+
+
+def _is_model(value):
+    """True for instances of dawproject model classes (not enums or kept XML)."""
+    cls = type(value)
+    result = _model_types.get(cls)
+    if result is None:
+        result = _model_types[cls] = issubclass(cls, XmlModel)
+    return result
+
+
+def _slots(cls):
+    names = _slot_names.get(cls)
+    if names is None:
+        names = []
+        for klass in cls.__mro__:
+            slots = getattr(klass, "__slots__", ())
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                if slot not in ("__dict__", "__weakref__"):
+                    names.append(slot)
+        names = _slot_names[cls] = tuple(names)
+    return names
+
+
+def _attribute_values(obj):
+    """Return the attribute values of a model object (``__dict__`` and ``__slots__``)."""
+    values = list(getattr(obj, "__dict__", {}).values())
+    for slot in _slots(type(obj)):
+        if hasattr(obj, slot):
+            values.append(getattr(obj, slot))
+    return values
+
+
+def iter_objects(root):
+    """Yield every model object reachable from ``root``, depth first, in attribute order.
+
+    The children of an object are visited in the order of its attributes
+    (instance dict, then slots), which is not necessarily the order of the
+    XML child elements. Each object is yielded once, so cross references
+    (e.g. ``Clips.track`` or ``Channel.destination``) do not cause cycles.
+    Lazily loaded subtrees are parsed when their parent is reached, so
+    that the objects in them are yielded too.
+
+    Args:
+        root: A model object, typically a Project.
+    """
+    from .lazySubtree import PENDING
+
+    seen = set()
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        yield obj
+
+        pending = getattr(obj, "__dict__", {}).get(PENDING)
+        if pending:
+            # Parsed here, before the children of obj are collected
+            for attribute in list(pending):
+                getattr(obj, attribute)
+        children = []
+        for value in _attribute_values(obj):
+            if isinstance(value, (list, tuple, set, frozenset)):
+                children.extend(item for item in value if _is_model(item))
+            elif value.__class__ is NoteArray:
+                # The notes themselves are columns; only their content timelines are objects
+                children.extend(value.content[row] for row in sorted(value.content))
+            elif _is_model(value):
+                children.append(value)
+        stack.extend(reversed(children))
+
+
+def renumber_ids(root, start=0):
+    """Renumber every Referenceable reachable from ``root`` densely, in traversal order.
+
+    References between model objects hold the objects themselves, so they
+    are written with the new IDs. Lazily loaded subtrees are parsed by the
+    traversal, so that their objects and references are renumbered too.
+    IDs used inside kept unknown XML are left out of the numbering; IDREFs
+    there are not rewritten.
+
+    Args:
+        root: A model object, typically a Project.
+        start: Number of the first ID.
+    """
+    from .idScope import IdScope
+    from .referenceable import Referenceable
+
+    objects = []
+    skip = set()
+    for obj in iter_objects(root):
+        unknown = obj._xml_unknown
+        if unknown is not None:
+            for element in unknown.elements:
+                skip.update(element.xpath("descendant-or-self::*/@id"))
+        if isinstance(obj, Referenceable):
+            objects.append(obj)
+    IdScope.current().renumber(objects, start, skip)
+
+
+def iter_file_references(root):
+    """Yield every FileReference (media files, device state) reachable from ``root``."""
+    from .fileReference import FileReference
+
+    for obj in iter_objects(root):
+        if isinstance(obj, FileReference):
+            yield obj
@@ -0,0 +1,63 @@
+"""UnknownContent -- XML attributes and elements the model does not declare."""
+
+from lxml import etree as ET
+
+from .keptElements import KeptElements, reserve_ids
+
+
+class UnknownContent(KeptElements):
+    """Foreign XML kept on a model object so that a round trip does not lose it.
+
+    When an element is deserialized, attributes that its class does not
+    declare, and child elements that no child spec accepts (for example a
+    Lanes child of a timeline type unknown to the registry, or another
+    DAW's extension element), are collected here and stored in the
+    object's ``_xml_unknown``. Serializing the object writes them back
+    verbatim: the attributes after the declared ones, the elements after
+    the declared children.
+
+    IDs found in the kept elements are reserved in the active IdScope, so
+    that new objects do not reuse them.
+
+    Attributes:
+        attrib: Dict of the unknown attributes, in document order.
+        elements: List of the unknown child elements.
+    """
+
+    def __init__(self, attrib=None, elements=None):
+        self.attrib = attrib if attrib is not None else {}
+        self.elements = elements if elements is not None else []
+        if self.elements:
+            reserve_ids(self.elements)
+
+    @classmethod
+    def from_element(cls, element, known):
+        """Collect the attributes of ``element`` whose names are not in ``known``."""
+        return cls({name: value for name, value in element.items() if name not in known})
+
+    def add_elements(self, elements):
+        """Keep more unknown child elements."""
+        reserve_ids(elements)
+        self.elements.extend(elements)
+
+    def add_attributes(self, attrib):
+        """Add the unknown attributes to ``attrib``; declared values take precedence."""
+        for name, value in self.attrib.items():
+            attrib.setdefault(name, value)
+
+    def __bool__(self):
+        return bool(self.attrib or self.elements)
+
+    def __reduce__(self):
+        # lxml elements cannot be pickled (e.g. by the ParallelLoader)
+        return _unpickle, (self.attrib, [ET.tostring(element) for element in self.elements])
+
+    def __repr__(self):
+        tags = [element.tag for element in self.elements]
+        return f"UnknownContent(attrib={self.attrib!r}, elements={tags!r})"
+
+
+def _unpickle(attrib, elements):
+    content = UnknownContent(attrib)
+    content.elements = [ET.fromstring(data) for data in elements]
+    return content
@@ -2,6 +2,7 @@
 
 from .mediaFile import MediaFile
 from .timeUnit import TimeUnit
+from .fieldSpec import Attribute, INTEGER, enum_codec
 
 
 class Video(MediaFile):
@@ -35,28 +36,11 @@ class Video(MediaFile):
         if self.time_unit is None:
             self.time_unit = TimeUnit.SECONDS
 
-    def to_xml(self):
-        elem = super().to_xml()
-        elem.set("sampleRate", str(self.sample_rate))
-        elem.set("channels", str(self.channels))
-        if self.algorithm:
-            elem.set("algorithm", self.algorithm)
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
-        if element is None:
-            return None
-
-        instance = super().from_xml(element)
-
-        sample_rate = element.get("sampleRate")
-        instance.sample_rate = int(sample_rate) if sample_rate else 0
-        channels = element.get("channels")
-        instance.channels = int(channels) if channels else 0
-        instance.algorithm = element.get("algorithm")
-
-        if instance.time_unit is None:
-            instance.time_unit = TimeUnit.SECONDS
-
-        return instance
+    def _xml_fields(cls):
+        return (
+            Attribute("timeUnit", "time_unit", enum_codec(TimeUnit, invalid="none"), default=TimeUnit.SECONDS),
+            Attribute("sampleRate", "sample_rate", INTEGER, default=0),
+            Attribute("channels", "channels", INTEGER, default=0),
+            Attribute("algorithm", "algorithm"),
+        )
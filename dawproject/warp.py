@@ -1,9 +1,9 @@
 """Warp model -- a time-warp point mapping timeline time to content time."""
 
-from lxml import etree as ET
+from .fieldSpec import XmlModel, Attribute, FLOAT
 
 
-class Warp:
+class Warp(XmlModel):
     """A single warp point mapping a timeline position to a content position.
 
     Attributes:
@@ -11,18 +11,16 @@ class Warp:
         content_time: Corresponding position in the content.
     """
 
+    __slots__ = ("time", "content_time", "_xml_unknown")
+
     def __init__(self, time=0.0, content_time=0.0):
         self.time = time
         self.content_time = content_time
-
-    def to_xml(self):
-        warp_elem = ET.Element("Warp")
-        warp_elem.set("time", str(self.time))
-        warp_elem.set("contentTime", str(self.content_time))
-        return warp_elem
+        self._xml_unknown = None
 
     @classmethod
-    def from_xml(cls, element):
-        time = float(element.get("time", 0.0))
-        content_time = float(element.get("contentTime", 0.0))
-        return cls(time, content_time)
+    def _xml_fields(cls):
+        return (
+            Attribute("time", "time", FLOAT, default=0.0),
+            Attribute("contentTime", "content_time", FLOAT, default=0.0),
+        )
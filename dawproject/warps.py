@@ -3,6 +3,7 @@
 from .timeline import Timeline
 from .warp import Warp
 from .timeUnit import TimeUnit
+from .fieldSpec import Attribute, Child, Children, enum_codec
 
 
 class Warps(Timeline):
@@ -24,51 +25,14 @@ class Warps(Timeline):
             )
         self.content_time_unit = content_time_unit
 
-    def to_xml(self):
-        # super().to_xml() returns an element with only attributes (from
-        # Timeline/Referenceable/Nameable); no child elements are added by the
-        # base classes.  The XSD 'warps' extension of 'timeline' defines the
-        # child sequence as: content (Timeline choice) followed by Warp
-        # elements, with 'contentTimeUnit' as an attribute.  The ordering below
-        # matches that schema.
-        elem = super().to_xml()
-        if self.content_time_unit is None:
-            raise ValueError(
-                "Warps.content_time_unit is required by the XSD schema and must not be None"
-            )
-        elem.set("contentTimeUnit", self.content_time_unit.value)
-        if self.content is not None:
-            elem.append(self.content.to_xml())
-        for warp in self.events:
-            elem.append(warp.to_xml())
-        return elem
-
     @classmethod
-    def from_xml(cls, element):
+    def _xml_fields(cls):
         from . import registry
-
-        instance = super().from_xml(element)
-
-        # Parse content -- find first Timeline subclass child (not Warp)
-        content = None
-        for child in element:
-            if child.tag != "Warp":
-                content_cls = registry.resolve_timeline(child.tag)
-                if content_cls is not None:
-                    content = content_cls.from_xml(child)
-                    break
-        instance.content = content
-
-        events = []
-        for warp_elem in element.findall("Warp"):
-            events.append(Warp.from_xml(warp_elem))
-        instance.events = events
-
-        content_time_unit_str = element.get("contentTimeUnit")
-        if not content_time_unit_str:
-            raise ValueError(
-                "Warps element is missing required attribute 'contentTimeUnit'"
-            )
-        instance.content_time_unit = TimeUnit(content_time_unit_str)
-
-        return instance
+        # The XSD 'warps' extension of 'timeline' defines the child sequence
+        # as: content (Timeline choice) followed by Warp elements, with
+        # 'contentTimeUnit' as a required attribute.
+        return (
+            Attribute("contentTimeUnit", "content_time_unit", enum_codec(TimeUnit), required=True),
+            Child(registry.classes_for(registry.TIMELINE_TAGS), "content"),
+            Children("Warp", "events", Warp),
+        )
@@ -27,14 +27,6 @@ def create_empty_project():
     return project
 
 
-def get_audio_file_as_bytes(sample_path):
-    """
-    Method to retrieve the audio file content as bytes.
-    """
-    with open(sample_path, 'rb') as audio_file:
-        return audio_file.read()
-
-
 def save_test_project(project, name, configurer=None):
     metadata = MetaData()
     embedded_files = {}
@@ -101,8 +93,8 @@ def create_project_with_audio_tracks(audio_tracks):
         audio.file.external = True
         audio.file.path = os.path.abspath(sample_path)
 
-        # Add the audio file to the embedded files
-        embedded_files[get_audio_file_as_bytes(os.path.abspath(sample_path))] = os.path.basename(sample_path)
+        # Add the audio file to the embedded files; it is streamed from disk on save
+        embedded_files[os.path.abspath(sample_path)] = os.path.basename(sample_path)
 
         # Create and add clip to the track
         audio_clip = Utility.create_clip(audio, 0, sample_duration)
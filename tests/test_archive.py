@@ -0,0 +1,566 @@
+"""Tests for DawProjectArchive, the persistent handle on a .dawproject file."""
+
+from io import BytesIO
+
+import pytest
+from dawproject import (
+    DawProject, DawProjectArchive, Project, Application, Arrangement, Lanes,
+    Vst3Plugin, FileReference, MetaData, ContentType, MixerRole, TimeUnit,
+    Utility, Referenceable, DeviceRole,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_ids():
+    Referenceable.reset_id()
+    yield
+    Referenceable.reset_id()
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    project = Project(application=Application(name="TestDAW", version="1.0"))
+    track = Utility.create_track("Lead", {ContentType.AUDIO}, MixerRole.REGULAR, 0.8, 0.5)
+    track.channel.devices.append(
+        Vst3Plugin(device_name="Synth", device_role=DeviceRole.INSTRUMENT, state=FileReference("plugins/synth.vstpreset"))
+    )
+    project.structure.append(track)
+
+    embedded = Utility.create_audio("audio/lead.wav", 44100, 2, 1.0)
+    external = Utility.create_audio("/samples/kick.wav", 44100, 2, 1.0)
+    external.file.external = True
+    missing = Utility.create_audio("audio/missing.wav", 44100, 2, 1.0)
+    clips = Utility.create_clips(
+        Utility.create_clip(embedded, 0, 1.0),
+        Utility.create_clip(external, 1, 1.0),
+        Utility.create_clip(missing, 2, 1.0),
+    )
+    clips.track = track
+    project.arrangement = Arrangement(lanes=Lanes(lanes=[clips], time_unit=TimeUnit.SECONDS))
+
+    path = str(tmp_path / "archive.dawproject")
+    DawProject.save(
+        project,
+        MetaData(title="Song"),
+        {b"RIFF-lead": "audio/lead.wav", b"preset": "plugins/synth.vstpreset"},
+        path,
+    )
+    Referenceable.reset_id()
+    return path
+
+
+class TestDawProjectArchive:
+    def test_entries_are_listed_once(self, archive_path):
+        with DawProjectArchive(archive_path) as archive:
+            assert list(archive.entries) == [
+                "metadata.xml", "project.xml", "audio/lead.wav", "plugins/synth.vstpreset",
+            ]
+            assert archive.embedded_files == ["audio/lead.wav", "plugins/synth.vstpreset"]
+            assert "project.xml" in archive
+
+    def test_project_and_metadata_are_lazy_and_cached(self, archive_path):
+        with DawProject.open(archive_path) as archive:
+            assert archive._project is None
+            project = archive.project
+            assert project.structure[0].name == "Lead"
+            assert archive.project is project
+            assert archive.metadata.title == "Song"
+            assert archive.metadata is archive.metadata
+
+    def test_streaming_project(self, archive_path):
+        with DawProjectArchive(archive_path, streaming=True) as archive:
+            assert len(archive.project.arrangement.lanes.lanes[0].clips) == 3
+
+    def test_file_references_resolve_to_entries(self, archive_path):
+        with DawProjectArchive(archive_path) as archive:
+            resolved = {ref.path: info for ref, info in archive.file_references()}
+
+        assert resolved["audio/lead.wav"].filename == "audio/lead.wav"
+        assert resolved["plugins/synth.vstpreset"].filename == "plugins/synth.vstpreset"
+        assert resolved["/samples/kick.wav"] is None
+        assert resolved["audio/missing.wav"] is None
+
+    def test_open_embedded_by_reference(self, archive_path):
+        with DawProjectArchive(archive_path) as archive:
+            clip = archive.project.arrangement.lanes.lanes[0].clips[0]
+            with archive.open(clip.content.file) as stream:
+                assert stream.read() == b"RIFF-lead"
+            with archive.open("plugins/synth.vstpreset") as stream:
+                assert stream.read() == b"preset"
+
+    def test_open_external_reference_raises(self, archive_path):
+        with DawProjectArchive(archive_path) as archive:
+            clip = archive.project.arrangement.lanes.lanes[0].clips[1]
+            with pytest.raises(KeyError):
+                archive.open(clip.content.file)
+
+    def test_stream_outlives_archive(self, archive_path):
+        with DawProjectArchive(archive_path) as archive:
+            stream = archive.open("audio/lead.wav")
+        with stream:
+            assert stream.read() == b"RIFF-lead"
+
+
+class TestCompressionPolicy:
+    def test_media_is_stored_by_extension(self):
+        from zipfile import ZIP_STORED
+        from dawproject import CompressionPolicy
+
+        policy = CompressionPolicy()
+        for path in ("audio/a.wav", "audio/B.FLAC", "audio/c.mp3", "video/d.mp4"):
+            assert policy.choose(path) == (ZIP_STORED, None)
+
+    def test_media_is_stored_by_content(self):
+        from zipfile import ZIP_STORED, ZIP_DEFLATED
+        from dawproject import CompressionPolicy
+
+        policy = CompressionPolicy()
+        assert policy.choose("audio/take1", b"RIFF\x00\x00\x00\x00WAVEfmt ")[0] == ZIP_STORED
+        assert policy.choose("audio/take2", b"fLaC\x00\x00\x00\x22")[0] == ZIP_STORED
+        assert policy.choose("plugins/state.bin", b"\x00\x01\x02\x03")[0] == ZIP_DEFLATED
+        assert CompressionPolicy(sniff=False).choose("audio/take1", b"RIFF\x00\x00\x00\x00WAVE")[0] == ZIP_DEFLATED
+
+    def test_xml_level_is_tunable(self):
+        from zipfile import ZIP_DEFLATED, ZIP_STORED
+        from dawproject import CompressionPolicy
+
+        assert CompressionPolicy(xml_level=9).choose("project.xml") == (ZIP_DEFLATED, 9)
+        assert CompressionPolicy.stored().choose("project.xml") == (ZIP_STORED, 6)
+
+    def test_unsupported_method_raises(self):
+        from zipfile import ZIP_LZMA
+        from dawproject import CompressionPolicy
+
+        with pytest.raises(ValueError):
+            CompressionPolicy(default_method=ZIP_LZMA)
+
+
+class TestArchiveWriter:
+    @pytest.fixture
+    def sources(self, tmp_path):
+        import os
+
+        wav = tmp_path / "noise.wav"
+        wav.write_bytes(b"RIFF\x00\x00\x00\x00WAVE" + os.urandom(100_000))
+        unnamed = tmp_path / "take"
+        unnamed.write_bytes(b"fLaC" + os.urandom(50_000))
+        return {
+            "audio/noise.wav": str(wav),
+            "audio/take": unnamed,
+            "plugins/a.state": b"state " * 20_000,
+            "plugins/b.state": b"\x00" * 300_000,
+        }
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_entries_written_in_order_with_policy(self, tmp_path, sources, workers):
+        from zipfile import ZipFile, ZIP_STORED, ZIP_DEFLATED
+        from dawproject import ArchiveWriter, MetaData
+
+        path = tmp_path / "out.dawproject"
+        with ArchiveWriter(path, workers=workers) as writer:
+            writer.add_xml("metadata.xml", MetaData(title="Song"))
+            for name, source in sources.items():
+                writer.add(name, source)
+
+        with ZipFile(path) as archive:
+            assert archive.testzip() is None
+            assert archive.namelist() == ["metadata.xml"] + list(sources)
+            methods = {info.filename: info.compress_type for info in archive.infolist()}
+            assert methods == {
+                "metadata.xml": ZIP_DEFLATED,
+                "audio/noise.wav": ZIP_STORED,
+                "audio/take": ZIP_STORED,
+                "plugins/a.state": ZIP_DEFLATED,
+                "plugins/b.state": ZIP_DEFLATED,
+            }
+            assert archive.read("plugins/a.state") == sources["plugins/a.state"]
+            assert archive.read("audio/take") == sources["audio/take"].read_bytes()
+            assert archive.getinfo("plugins/b.state").compress_size < 1000
+
+    def test_save_uses_policy(self, tmp_path, sources):
+        from zipfile import ZipFile, ZIP_STORED, ZIP_DEFLATED
+        from dawproject import DawProject, CompressionPolicy, MetaData, Project
+
+        compressed = tmp_path / "compressed.dawproject"
+        stored = tmp_path / "stored.dawproject"
+        embedded = {source: name for name, source in sources.items()}
+        DawProject.save(Project(), MetaData(), embedded, compressed, workers=2)
+        DawProject.save(Project(), MetaData(), embedded, stored, compression=CompressionPolicy.stored())
+
+        with ZipFile(compressed) as archive:
+            assert archive.getinfo("project.xml").compress_type == ZIP_DEFLATED
+            assert archive.getinfo("audio/noise.wav").compress_type == ZIP_STORED
+        with ZipFile(stored) as archive:
+            assert {info.compress_type for info in archive.infolist()} == {ZIP_STORED}
+        assert compressed.stat().st_size < stored.stat().st_size
+
+    def test_stored_entries_stay_zero_copy(self, tmp_path, sources):
+        from dawproject import DawProject, EmbeddedStream, MetaData, Project
+
+        path = tmp_path / "out.dawproject"
+        DawProject.save(Project(), MetaData(), {sources["audio/noise.wav"]: "audio/noise.wav"}, path)
+        with DawProject.stream_embedded(path, "audio/noise.wav") as stream:
+            assert isinstance(stream, EmbeddedStream)
+
+    @pytest.mark.parametrize("name", ["audio/0.wav", "plugins/0.state"])
+    def test_file_object_is_read_by_add(self, tmp_path, sources, name):
+        from zipfile import ZipFile
+        from dawproject import ArchiveWriter, MetaData
+
+        path = tmp_path / "out.dawproject"
+        with ArchiveWriter(path, workers=4) as writer:
+            writer.add_xml("metadata.xml", MetaData(title="Song"))
+            with open(sources["audio/noise.wav"], "rb") as stream:
+                writer.add(name, stream)
+            writer.add("plugins/a.state", sources["plugins/a.state"])
+
+        with ZipFile(path) as archive:
+            assert archive.namelist() == ["metadata.xml", name, "plugins/a.state"]
+            with open(sources["audio/noise.wav"], "rb") as stream:
+                assert archive.read(name) == stream.read()
+
+    def test_failing_source_propagates(self, tmp_path):
+        from dawproject import ArchiveWriter
+
+        class Broken:
+            def read(self, size=-1):
+                raise OSError("device unplugged")
+
+        with pytest.raises(OSError, match="unplugged"):
+            with ArchiveWriter(tmp_path / "out.dawproject", workers=2) as writer:
+                writer.add("plugins/state.bin", Broken())
+
+
+def _raw_entry_data(path, name):
+    """The raw (possibly compressed) bytes of an entry as stored in the file."""
+    from zipfile import ZipFile
+    from dawproject.embeddedStream import local_data_offset
+
+    with ZipFile(path) as archive:
+        info = archive.getinfo(name)
+    with open(path, "rb") as fp:
+        fp.seek(local_data_offset(fp, info))
+        return fp.read(info.compress_size)
+
+
+class TestIncrementalSave:
+    def _load(self, path):
+        Referenceable.reset_id()
+        return DawProject.load_project(path)
+
+    def test_untouched_entries_copied_raw(self, archive_path):
+        from zipfile import ZipFile
+
+        raw_audio = _raw_entry_data(archive_path, "audio/lead.wav")
+        raw_state = _raw_entry_data(archive_path, "plugins/synth.vstpreset")
+
+        project = self._load(archive_path)
+        project.structure[0].channel.volume.value = 0.25
+        DawProject.save_incremental(project, None, {}, archive_path)
+
+        with ZipFile(archive_path) as archive:
+            assert archive.testzip() is None
+            assert archive.namelist() == [
+                "metadata.xml", "project.xml", "audio/lead.wav", "plugins/synth.vstpreset",
+            ]
+        assert _raw_entry_data(archive_path, "audio/lead.wav") == raw_audio
+        assert _raw_entry_data(archive_path, "plugins/synth.vstpreset") == raw_state
+        assert self._load(archive_path).structure[0].channel.volume.value == 0.25
+        assert DawProject.load_metadata(archive_path).title == "Song"
+
+    def test_replace_add_and_remove_entries(self, archive_path):
+        from zipfile import ZipFile
+
+        project = self._load(archive_path)
+        DawProject.save_incremental(
+            project, MetaData(title="Song v2"),
+            {b"RIFF-new": "audio/lead.wav", b"extra": "audio/extra.wav"},
+            archive_path, remove=["plugins/synth.vstpreset"],
+        )
+
+        with ZipFile(archive_path) as archive:
+            assert sorted(archive.namelist()) == [
+                "audio/extra.wav", "audio/lead.wav", "metadata.xml", "project.xml",
+            ]
+            assert archive.read("audio/lead.wav") == b"RIFF-new"
+        assert DawProject.load_metadata(archive_path).title == "Song v2"
+
+    def test_failed_save_leaves_archive_intact(self, archive_path, tmp_path):
+        before = open(archive_path, "rb").read()
+
+        class Broken:
+            def read(self, size=-1):
+                raise OSError("device unplugged")
+
+        with pytest.raises(OSError):
+            DawProject.save_incremental(self._load(archive_path), None, {Broken(): "plugins/x.bin"}, archive_path)
+
+        assert open(archive_path, "rb").read() == before
+        assert [p.name for p in tmp_path.iterdir()] == ["archive.dawproject"]
+
+    def test_append_rewrites_only_central_directory(self, archive_path):
+        from zipfile import ZipFile
+
+        with ZipFile(archive_path) as archive:
+            offsets = {info.filename: info.header_offset for info in archive.infolist()}
+
+        project = self._load(archive_path)
+        project.structure[0].channel.pan.value = 0.1
+        DawProject.save_incremental(project, None, {b"RIFF-new": "audio/lead.wav"}, archive_path, append=True)
+
+        with ZipFile(archive_path) as archive:
+            assert archive.testzip() is None
+            infos = {info.filename: info for info in archive.infolist()}
+            assert sorted(infos) == ["audio/lead.wav", "metadata.xml", "plugins/synth.vstpreset", "project.xml"]
+            # Untouched entries were not moved
+            assert infos["metadata.xml"].header_offset == offsets["metadata.xml"]
+            assert infos["plugins/synth.vstpreset"].header_offset == offsets["plugins/synth.vstpreset"]
+            assert infos["project.xml"].header_offset > offsets["plugins/synth.vstpreset"]
+            assert archive.read("audio/lead.wav") == b"RIFF-new"
+        assert self._load(archive_path).structure[0].channel.pan.value == 0.1
+
+    def test_failed_append_keeps_original_entries(self, archive_path):
+        from zipfile import ZipFile
+        from dawproject import CompressionPolicy
+
+        with ZipFile(archive_path) as archive:
+            before = {info.filename: archive.read(info) for info in archive.infolist()}
+
+        class Broken(Project):
+            def write_xml(self, writer, tag=None):
+                raise RuntimeError("serialization failed")
+
+        with pytest.raises(RuntimeError):
+            DawProject.save_incremental(
+                Broken(), MetaData(title="Song v2"), {b"RIFF-new": "audio/lead.wav"}, archive_path,
+                compression=CompressionPolicy.stored(), append=True,
+            )
+
+        with ZipFile(archive_path) as archive:
+            assert archive.testzip() is None
+            assert {info.filename: archive.read(info) for info in archive.infolist()} == before
+        assert DawProject.load_metadata(archive_path).title == "Song"
+        assert self._load(archive_path).structure[0].name == "Lead"
+
+    def test_copies_zip64_entries(self, tmp_path):
+        from zipfile import ZipFile
+
+        class PipeLike:
+            def __init__(self, data):
+                self._data = data
+
+            def read(self, size=-1):
+                chunk, self._data = self._data[:size], self._data[size:]
+                return chunk
+
+        path = str(tmp_path / "zip64.dawproject")
+        DawProject.save(Project(), MetaData(), {PipeLike(b"x" * 1000): "audio/pipe.wav"}, path)
+        DawProject.save_incremental(Project(), None, {}, path)
+
+        with ZipFile(path) as archive:
+            assert archive.testzip() is None
+            assert archive.read("audio/pipe.wav") == b"x" * 1000
+
+
+class TestDeduplication:
+    @pytest.fixture
+    def project(self):
+        project = Project()
+        track = Utility.create_track("Drums", {ContentType.AUDIO}, MixerRole.REGULAR, 0.8, 0.5)
+        for name in ("a", "b"):
+            track.channel.devices.append(
+                Vst3Plugin(device_name=name, state=FileReference(f"plugins/{name}.vstpreset"))
+            )
+        project.structure.append(track)
+        clips = Utility.create_clips(*(
+            Utility.create_clip(Utility.create_audio(path, 44100, 2, 1.0), i, 1.0)
+            for i, path in enumerate(["audio/kick.wav", "audio/kick-copy.wav", "audio/snare.wav"])
+        ))
+        clips.track = track
+        project.arrangement = Arrangement(lanes=Lanes(lanes=[clips]))
+        return project
+
+    def _paths(self, project):
+        from dawproject.traversal import iter_file_references
+
+        return [reference.path for reference in iter_file_references(project)]
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_duplicates_stored_once(self, tmp_path, project, workers):
+        from zipfile import ZipFile
+
+        kick = tmp_path / "kick.wav"
+        kick.write_bytes(b"RIFF\x00\x00\x00\x00WAVE" + b"k" * 5000)
+        preset = b"<preset/>" * 1000
+        embedded = {
+            str(kick): "audio/kick.wav",
+            kick: "audio/kick-copy.wav",
+            b"RIFF\x00\x00\x00\x00WAVE" + b"s" * 5000: "audio/snare.wav",
+            preset: "plugins/a.vstpreset",
+            BytesIO(preset): "plugins/b.vstpreset",
+        }
+
+        path = tmp_path / "dedup.dawproject"
+        report = DawProject.save(project, MetaData(), embedded, path, workers=workers, deduplicate=True)
+
+        assert report.duplicates == {
+            "audio/kick-copy.wav": "audio/kick.wav",
+            "plugins/b.vstpreset": "plugins/a.vstpreset",
+        }
+        assert report.bytes_saved == kick.stat().st_size + len(preset)
+        with ZipFile(path) as archive:
+            assert archive.testzip() is None
+            assert sorted(archive.namelist()) == [
+                "audio/kick.wav", "audio/snare.wav", "metadata.xml",
+                "plugins/a.vstpreset", "project.xml",
+            ]
+
+        Referenceable.reset_id()
+        loaded = DawProject.load_project(path)
+        assert sorted(self._paths(loaded)) == [
+            "audio/kick.wav", "audio/kick.wav", "audio/snare.wav",
+            "plugins/a.vstpreset", "plugins/a.vstpreset",
+        ]
+        with DawProject.open(path) as archive:
+            assert all(info is not None for _, info in archive.file_references())
+
+    def test_stored_duplicate_is_truncated(self, tmp_path, project):
+        import os
+
+        payload = b"RIFF\x00\x00\x00\x00WAVE" + os.urandom(200_000)
+        single, double = tmp_path / "single.dawproject", tmp_path / "double.dawproject"
+        DawProject.save(Project(), MetaData(), {payload: "audio/kick.wav"}, single, deduplicate=True)
+        DawProject.save(
+            Project(), MetaData(),
+            {payload: "audio/kick.wav", BytesIO(payload): "audio/kick-copy.wav"},
+            double, deduplicate=True,
+        )
+        # Only the central directory and the (unchanged) project differ
+        assert double.stat().st_size < single.stat().st_size + 100
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_unseekable_sink(self, tmp_path, workers):
+        from zipfile import ZipFile
+        from dawproject import ArchiveWriter
+
+        class Sink:
+            """A write-only stream, like a pipe or a socket."""
+
+            def __init__(self):
+                self.data = bytearray()
+
+            def write(self, data):
+                self.data += data
+                return len(data)
+
+            def flush(self):
+                pass
+
+        kick = tmp_path / "kick.wav"
+        kick.write_bytes(b"RIFF\x00\x00\x00\x00WAVE" + b"k" * 5000)
+        sink = Sink()
+        with ArchiveWriter(sink, workers=workers, deduplicate=True) as writer:
+            writer.add("audio/kick.wav", kick)
+            writer.add("audio/kick-copy.wav", BytesIO(kick.read_bytes()))
+            writer.add("audio/snare.wav", BytesIO(b"RIFF\x00\x00\x00\x00WAVE" + b"s" * 5000))
+            writer.add("plugins/a.vstpreset", b"<preset/>")
+            writer.add("plugins/b.vstpreset", BytesIO(b"<preset/>"))
+
+        assert writer.report.duplicates == {
+            "audio/kick-copy.wav": "audio/kick.wav",
+            "plugins/b.vstpreset": "plugins/a.vstpreset",
+        }
+        with ZipFile(BytesIO(bytes(sink.data))) as archive:
+            assert archive.testzip() is None
+            assert archive.namelist() == ["audio/kick.wav", "audio/snare.wav", "plugins/a.vstpreset"]
+            assert archive.read("audio/kick.wav") == kick.read_bytes()
+
+    def test_lazy_loaded_references_are_redirected(self, tmp_path, project):
+        kick = b"RIFF\x00\x00\x00\x00WAVE" + b"k" * 5000
+
+        def embedded():
+            return {
+                kick: "audio/kick.wav", BytesIO(kick): "audio/kick-copy.wav", b"s": "audio/snare.wav",
+                b"<a/>": "plugins/a.vstpreset", b"<b/>": "plugins/b.vstpreset",
+            }
+
+        original = tmp_path / "original.dawproject"
+        DawProject.save(project, MetaData(), embedded(), original)
+
+        Referenceable.reset_id()
+        with DawProject.open(original, lazy=True) as archive:
+            # The clips are still unparsed, but their references are found
+            assert sorted(self._paths(archive.project)) == sorted(self._paths(project))
+            assert len(list(archive.file_references())) == 5
+        Referenceable.reset_id()
+        lazy = DawProject.load_project(original, lazy=True)
+        path = tmp_path / "dedup.dawproject"
+        report = DawProject.save(lazy, MetaData(), embedded(), path, deduplicate=True)
+        assert report.duplicates == {"audio/kick-copy.wav": "audio/kick.wav"}
+        # Every reference resolves (the fixture project itself is not schema valid)
+        assert DawProject.validate_archive(path).missing_files == []
+        Referenceable.reset_id()
+        assert "audio/kick-copy.wav" not in self._paths(DawProject.load_project(path))
+
+    def test_disabled_by_default(self, tmp_path, project):
+        embedded = {b"x": "audio/kick.wav", BytesIO(b"x"): "audio/kick-copy.wav"}
+        report = DawProject.save(project, MetaData(), embedded, tmp_path / "plain.dawproject")
+        assert report.duplicates == {}
+        assert "audio/kick-copy.wav" in self._paths(project)
+
+
+class TestValidateArchive:
+    @pytest.fixture(autouse=True)
+    def no_model_objects(self, monkeypatch):
+        """Archive validation must not build Project or MetaData objects."""
+        def fail(*args, **kwargs):
+            raise AssertionError("object model was built")
+
+        monkeypatch.setattr(Project, "from_xml", fail)
+        monkeypatch.setattr(MetaData, "from_xml", fail)
+
+    def test_valid_archive(self, tmp_path):
+        path = tmp_path / "valid.dawproject"
+        project = Project(application=Application(name="TestDAW", version="1.0"))
+        track = Utility.create_track("Lead", {ContentType.AUDIO}, MixerRole.REGULAR, 0.8, 0.5)
+        track.channel.devices.append(Vst3Plugin(
+            device_name="Synth", device_role=DeviceRole.INSTRUMENT, state=FileReference("plugins/a.vstpreset")
+        ))
+        project.structure.append(track)
+        DawProject.save(project, MetaData(title="Song"), {b"state": "plugins/a.vstpreset"}, path)
+
+        result = DawProject.validate_archive(path)
+        assert result
+        assert result.errors == [] and result.missing_files == []
+
+    def test_missing_internal_file(self, archive_path):
+        result = DawProject.validate_archive(archive_path)
+        assert not result
+        # The external reference is not expected in the archive
+        assert result.missing_files == ["audio/missing.wav"]
+        assert result.errors == []
+
+    def test_schema_errors_are_reported(self, tmp_path):
+        from zipfile import ZipFile
+
+        path = tmp_path / "invalid.dawproject"
+        with ZipFile(path, "w") as archive:
+            archive.writestr("project.xml", b'<Project version="1.0"><Bogus/></Project>')
+            archive.writestr("metadata.xml", b"<MetaData><Title>Song</Title></MetaData>")
+
+        result = DawProject.validate_archive(path)
+        assert not result.valid
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith("project.xml: ") and "Bogus" in result.errors[0]
+
+    def test_missing_project_and_bad_zip(self, tmp_path):
+        from zipfile import ZipFile
+
+        empty = tmp_path / "empty.dawproject"
+        with ZipFile(empty, "w") as archive:
+            archive.writestr("metadata.xml", b"<MetaData/>")
+        assert DawProject.validate_archive(empty).errors == ["project.xml: missing from the archive"]
+
+        garbage = tmp_path / "garbage.dawproject"
+        garbage.write_bytes(b"not a zip")
+        assert not DawProject.validate_archive(garbage)
@@ -0,0 +1,360 @@
+"""Tests for the NumPy-backed columnar storage of timeline data."""
+
+import pytest
+from lxml import etree as ET
+
+np = pytest.importorskip("numpy")
+
+from dawproject import (
+    ArrayReader, DawProject, DawProjectArchive, MetaData, Project, Notes, Note, NoteArray, NoteView,
+    Points, PointArray, RealPoint, BoolPoint, IntegerPoint, TimeSignaturePoint, Warps, Warp, Interpolation, TimeUnit, Referenceable,
+)
+from dawproject.fieldSpec import columnar_loading
+from dawproject.traversal import iter_objects
+
+
+@pytest.fixture(autouse=True)
+def reset_ids():
+    Referenceable.reset_id()
+    yield
+    Referenceable.reset_id()
+
+
+def _notes():
+    return [
+        Note(time=0.0, duration=1.0, key=60, vel=0.8, rel=0.5),
+        Note(time=2.0, duration=0.5, key=64, channel=1, vel=0.7),
+        Note(time=1.0, duration=1.0, key=67),
+    ]
+
+
+def _children(element):
+    return [ET.tostring(child, method="c14n") for child in element]
+
+
+PROJECT_XML = """
+<Project version="1.0">
+    <Application name="Test" version="1.0"/>
+    <Arrangement id="id0">
+        <Lanes id="id1" timeUnit="beats">
+            <Clips id="id2">
+                <Clip time="0.0" duration="4.0">
+                    <Notes id="id3">
+                        <Note time="0.0" duration="1.0" key="60" channel="0" vel="0.8" rel="0.5"/>
+                        <Note time="1.0" duration="1.0" key="64" channel="0" vel="0.7" custom="x">
+                            <Points id="id4">
+                                <Target expression="pitchBend"/>
+                                <RealPoint time="0.0" value="0.25"/>
+                            </Points>
+                        </Note>
+                        <Note time="2.0" duration="0.5" key="67" channel="2"/>
+                    </Notes>
+                </Clip>
+            </Clips>
+        </Lanes>
+    </Arrangement>
+</Project>
+"""
+
+
+def _project_root():
+    return ET.fromstring(PROJECT_XML, ET.XMLParser(remove_blank_text=True))
+
+
+def _clip_notes(project):
+    return project.arrangement.lanes.lanes[0].clips[0].content
+
+
+class TestNoteArray:
+    def test_columns_from_notes(self):
+        notes = NoteArray.from_notes(_notes())
+        assert len(notes) == 3
+        assert notes.time.tolist() == [0.0, 2.0, 1.0]
+        assert notes.key.dtype == np.int32
+        assert notes.channel.tolist() == [0, 1, 0]
+        assert np.isnan(notes.rel[1:]).all()
+
+    def test_note_views(self):
+        notes = NoteArray.from_notes(_notes())
+        views = list(notes)
+        assert all(isinstance(view, NoteView) for view in views)
+        assert views[0].key == 60 and views[0].vel == 0.8
+        assert views[2].vel is None
+        views[2].vel = 0.9
+        assert notes.vel[2] == 0.9
+        assert notes[-1].key == 67
+        with pytest.raises(IndexError):
+            notes[3]
+
+    def test_to_notes_round_trip(self):
+        original = _notes()
+        notes = NoteArray.from_notes(original).to_notes()
+        for a, b in zip(original, notes):
+            assert (a.time, a.duration, a.key, a.channel, a.vel, a.rel) == (b.time, b.duration, b.key, b.channel, b.vel, b.rel)
+
+    def test_column_assignment_is_vectorized(self):
+        notes = NoteArray.from_notes(_notes())
+        notes.time += 4.0
+        notes.key = notes.key + 12
+        assert notes.time.tolist() == [4.0, 6.0, 5.0]
+        assert notes.key.tolist() == [72, 76, 79]
+
+    def test_append_and_extend(self):
+        notes = NoteArray()
+        for i in range(100):
+            notes.append(Note(time=float(i), duration=0.25, key=60))
+        notes.extend(NoteArray.from_notes(_notes()))
+        notes.extend(_notes())
+        assert len(notes) == 106
+        assert notes.time[:3].tolist() == [0.0, 1.0, 2.0]
+        assert notes.key[-3:].tolist() == [60, 64, 67]
+
+    def test_slice_is_a_view_and_mask_a_copy(self):
+        notes = NoteArray.from_notes(_notes())
+        head = notes[:2]
+        head.vel[0] = 0.1
+        assert notes.vel[0] == 0.1
+        loud = notes[notes.key > 60]
+        loud.vel[:] = 1.0
+        assert len(loud) == 2
+        assert notes.vel[1] == 0.7
+        # Appending to a slice copies its columns first
+        head.append(Note(time=9.0, duration=1.0, key=50))
+        assert len(notes) == 3 and notes.key[2] == 67
+
+    def test_sort_keeps_sparse_content_with_its_note(self):
+        expression = Points()
+        notes = NoteArray.from_notes(_notes())
+        notes[1].content = expression
+        notes.sort()
+        assert notes.time.tolist() == [0.0, 1.0, 2.0]
+        assert notes.content == {2: expression}
+        notes.sort(("channel", "time"))
+        assert notes.channel.tolist() == [0, 0, 1]
+        assert notes[2].content is expression
+
+    def test_mismatched_columns_raise(self):
+        with pytest.raises(ValueError):
+            NoteArray(time=[0.0, 1.0], duration=[1.0])
+
+
+class TestNoteArraySerialization:
+    def test_columns_write_the_same_xml_as_notes(self):
+        expected = Notes(notes=_notes()).to_xml()
+        element = Notes(notes=NoteArray.from_notes(_notes())).to_xml()
+        assert _children(element) == _children(expected)
+
+    def test_streaming_write(self, tmp_path):
+        project = Project.from_xml(_project_root(), columnar=True)
+        path = tmp_path / "project.xml"
+        DawProject.save_xml(project, str(path))
+        written = ET.parse(str(path), ET.XMLParser(remove_blank_text=True)).getroot()
+        assert ET.tostring(written, method="c14n") == ET.tostring(_project_root(), method="c14n")
+
+    def test_columnar_load(self):
+        project = Project.from_xml(_project_root(), columnar=True)
+        notes = _clip_notes(project).notes
+        assert isinstance(notes, NoteArray)
+        assert notes.key.tolist() == [60, 64, 67]
+        assert notes.channel.tolist() == [0, 0, 2]
+        assert np.isnan(notes.vel[2])
+        assert isinstance(notes.content[1], Points)
+        assert notes.unknown[1].attrib == {"custom": "x"}
+
+    def test_columnar_round_trip(self):
+        project = Project.from_xml(_project_root(), columnar=True)
+        assert ET.tostring(project.to_xml(), method="c14n") == ET.tostring(_project_root(), method="c14n")
+
+    def test_lazy_columnar_load(self):
+        project = Project.from_xml(_project_root(), lazy=True, columnar=True)
+        assert isinstance(_clip_notes(project).notes, NoteArray)
+
+    def test_default_load_keeps_note_objects(self):
+        project = Project.from_xml(_project_root())
+        assert isinstance(_clip_notes(project).notes[0], Note)
+
+    def test_traversal_finds_note_content(self):
+        project = Project.from_xml(_project_root(), columnar=True)
+        expressions = [obj for obj in iter_objects(project) if isinstance(obj, Points)]
+        assert len(expressions) == 1
+        # The expression's points are columns too
+        assert isinstance(expressions[0].points, PointArray)
+
+    def test_columnar_cannot_use_workers(self, tmp_path):
+        path = tmp_path / "empty.dawproject"
+        DawProject.save(Project(), MetaData(), {}, str(path))
+        with pytest.raises(ValueError):
+            DawProjectArchive(str(path), workers=2, columnar=True)
+
+
+class TestArrayReader:
+    def test_note_columns(self):
+        columns = ArrayReader.read(Notes(notes=_notes()).to_xml())["Note"]
+        assert columns["time"].dtype == np.float64
+        assert columns["key"].dtype == np.int32
+        assert columns["key"].tolist() == [60, 64, 67]
+        assert columns["channel"].tolist() == [0, 1, 0]
+        assert np.isnan(columns["vel"][2])
+
+    def test_point_columns_by_kind(self):
+        points = Points(points=[
+            RealPoint(time=0.0, value=0.5, interpolation=Interpolation.LINEAR),
+            BoolPoint(time=0.5, value=True),
+            RealPoint(time=1.0, value=float("inf"), interpolation=Interpolation.HOLD),
+            RealPoint(time=2.0, value=0.25),
+        ])
+        columns = ArrayReader.read(points.to_xml())
+        assert set(columns) == {"RealPoint", "BoolPoint"}
+        assert columns["RealPoint"]["value"].tolist() == [0.5, float("inf"), 0.25]
+        assert columns["RealPoint"]["interpolation"].dtype == np.int8
+        assert columns["RealPoint"]["interpolation"].tolist() == [1, 0, -1]
+        assert columns["BoolPoint"]["value"].tolist() == [True]
+
+    def test_warp_columns(self):
+        warps = Warps(
+            events=[Warp(time=0.0, content_time=0.0), Warp(time=4.0, content_time=2.0)],
+            content_time_unit=TimeUnit.SECONDS,
+        )
+        columns = ArrayReader.read(warps.to_xml())["Warp"]
+        assert columns["contentTime"].tolist() == [0.0, 2.0]
+
+    def test_irregular_rows(self):
+        notes = list(_project_root().iter("Note"))
+        _, irregular = ArrayReader.read_columns(notes, "Note")
+        assert irregular == [1]
+        _, irregular = ArrayReader.read_columns(Notes(notes=_notes()).to_xml(), "Note")
+        assert irregular == []
+
+    def test_invalid_interpolation_raises(self):
+        element = ET.fromstring('<Points><RealPoint time="0.0" value="1.0" interpolation="cubic"/></Points>')
+        with pytest.raises(ValueError):
+            ArrayReader.read(element)
+
+    def test_iterparse_reads_dense_timelines(self, tmp_path):
+        path = tmp_path / "project.xml"
+        path.write_bytes(ET.tostring(_project_root()))
+        with open(path, "rb") as stream:
+            results = [(element.tag, element.get("id"), columns) for element, columns in ArrayReader.iterparse(stream)]
+        # The expression Points inside a note closes first
+        assert [(tag, id) for tag, id, _ in results] == [("Points", "id4"), ("Notes", "id3")]
+        assert results[0][2]["RealPoint"]["value"].tolist() == [0.25]
+        assert results[1][2]["Note"]["key"].tolist() == [60, 64, 67]
+
+
+    def test_iterparse_frees_parsed_elements(self, tmp_path):
+        notes = "".join(
+            f'<Notes id="n{i}"><Note time="{i}.0" duration="1.0" key="60"><Points id="e{i}">'
+            f'<RealPoint time="0.0" value="0.5"/></Points></Note></Notes>'
+            for i in range(3)
+        )
+        path = tmp_path / "project.xml"
+        path.write_text(
+            f'<Project><Structure><Track id="t0"/></Structure>'
+            f'<Arrangement><Lanes>{notes}</Lanes></Arrangement></Project>'
+        )
+        class Trickle:
+            """Hands the parser a few bytes at a time, so that it does not read ahead."""
+
+            def __init__(self, stream):
+                self.stream = stream
+
+            def read(self, size=-1):
+                return self.stream.read(16)
+
+        seen = []
+        with open(path, "rb") as stream:
+            for element, columns in ArrayReader.iterparse(Trickle(stream)):
+                root = element.getroottree().getroot()
+                seen.append((element.get("id"), {node.get("id") for node in root.iter()}, columns))
+        assert [id for id, _, _ in seen] == ["e0", "n0", "e1", "n1", "e2", "n2"]
+        # Nothing is freed after a nested expression Points, so its Notes is read in full
+        assert "t0" in seen[1][1]
+        assert seen[1][2]["Note"]["key"].tolist() == [60]
+        # Before each later timeline, everything parsed earlier is gone
+        for _, ids, _ in seen[2:]:
+            assert not ids & {"t0", "n0", "e0"}
+        assert not seen[4][1] & {"n1", "e1"}
+
+def _curve():
+    return [
+        RealPoint(time=0.0, value=0.0, interpolation=Interpolation.LINEAR),
+        RealPoint(time=2.0, value=1.0, interpolation=Interpolation.HOLD),
+        RealPoint(time=1.0, value=0.5),
+    ]
+
+
+class TestPointArray:
+    def test_typed_columns_in_time_order(self):
+        curve = PointArray.from_points(_curve())
+        assert curve.kind is RealPoint
+        assert curve.time.tolist() == [0.0, 1.0, 2.0]
+        assert curve.value.tolist() == [0.0, 0.5, 1.0]
+        assert curve.interpolation.dtype == np.int8
+        assert curve.interpolation.tolist() == [1, -1, 0]
+        assert curve[1].interpolation is None and curve[2].interpolation is Interpolation.HOLD
+
+    def test_columns_per_kind(self):
+        signatures = PointArray(TimeSignaturePoint, time=[0.0, 8.0], numerator=[4, 3], denominator=[4, 4])
+        assert signatures.numerator.dtype == np.int32
+        assert [(p.numerator, p.denominator) for p in signatures] == [(4, 4), (3, 4)]
+        switches = PointArray("BoolPoint", time=[1.0, 0.0], value=[False, True])
+        assert switches.value.tolist() == [True, False]
+        with pytest.raises(TypeError):
+            PointArray(IntegerPoint, time=[0.0], numerator=[1])
+        with pytest.raises(ValueError):
+            PointArray.from_points([RealPoint(time=0.0), BoolPoint(time=1.0)])
+
+    def test_sorted_append_and_insertion(self):
+        curve = PointArray(RealPoint)
+        for i in range(100):
+            assert curve.add(float(i), value=i / 100) == i
+        assert curve.add(10.5, value=-1.0, interpolation=Interpolation.LINEAR) == 11
+        # Equal times go after the existing points
+        assert curve.add(10.0, value=-2.0) == 11
+        curve.append(RealPoint(time=-1.0, value=0.0))
+        assert len(curve) == 103
+        assert np.all(np.diff(curve.time) >= 0)
+        assert curve.value[11:14].tolist() == [0.1, -2.0, -1.0]
+        assert curve.bisect(50.0) == 54 and curve.bisect(50.0, "left") == 53
+        with pytest.raises(TypeError):
+            curve.append(BoolPoint(time=0.0, value=True))
+
+    def test_insertion_moves_kept_xml_with_its_row(self):
+        project = Project.from_xml(_project_root(), columnar=True)
+        curve = _clip_notes(project).notes.content[1].points
+        curve.unknown[0] = "kept"
+        curve.add(-1.0, value=0.0)
+        assert curve.unknown == {1: "kept"}
+
+    def test_extend_merges_in_time_order(self):
+        curve = PointArray.from_points(_curve())
+        curve.extend([RealPoint(time=3.0, value=0.0), RealPoint(time=4.0, value=0.0)])
+        curve.extend(PointArray(RealPoint, time=[0.5, 2.0], value=[9.0, 8.0]))
+        assert curve.time.tolist() == [0.0, 0.5, 1.0, 2.0, 2.0, 3.0, 4.0]
+        assert curve.value[3:5].tolist() == [1.0, 8.0]
+
+    def test_time_range_is_a_view(self):
+        curve = PointArray(RealPoint, time=np.arange(10.0), value=np.zeros(10))
+        bar = curve.time_range(4.0, 8.0)
+        assert bar.time.tolist() == [4.0, 5.0, 6.0, 7.0]
+        assert np.shares_memory(bar.value, curve.value)
+        bar.value += 1.0
+        assert curve.value.sum() == 4.0
+        assert len(curve.time_range(end=2.0)) == 2 and len(curve.time_range(8.5)) == 1
+        assert len(curve.time_range(5.0, 3.0)) == 0
+
+    def test_writes_the_same_xml_as_points(self):
+        expected = Points(points=PointArray.from_points(_curve()).to_points()).to_xml()
+        element = Points(points=PointArray.from_points(_curve())).to_xml()
+        assert _children(element) == _children(expected)
+
+    def test_columnar_load_keeps_mixed_and_unsorted_points_as_lists(self):
+        mixed = Points(points=[RealPoint(time=0.0, value=1.0), BoolPoint(time=1.0, value=True)])
+        unsorted = Points(points=[RealPoint(time=1.0, value=1.0), RealPoint(time=0.0, value=0.0)])
+        sorted_ = Points(points=_curve()[:2])
+        for points, expected in ((mixed, list), (unsorted, list), (sorted_, PointArray), (Points(), list)):
+            element = points.to_xml()
+            with columnar_loading():
+                result = Points.from_xml(element)
+            assert type(result.points) is expected
+            assert ET.tostring(result.to_xml(), method="c14n") == ET.tostring(element, method="c14n")
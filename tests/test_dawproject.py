@@ -81,6 +81,67 @@ class TestSaveXML:
             os.unlink(path)
 
 
+    def test_save_xml_matches_tree_serialization(self, sample_project):
+        with tempfile.NamedTemporaryFile(suffix=".xml", delete=False) as f:
+            path = f.name
+
+        try:
+            DawProject.save_xml(sample_project, path)
+            with open(path, "rb") as f:
+                streamed = f.read()
+            expected = ET.tostring(
+                sample_project.to_xml(), pretty_print=True, xml_declaration=True, encoding="UTF-8"
+            )
+            assert streamed == expected
+        finally:
+            os.unlink(path)
+
+    def test_save_xml_compact(self, sample_project):
+        with tempfile.NamedTemporaryFile(suffix=".xml", delete=False) as f:
+            path = f.name
+
+        try:
+            DawProject.save_xml(sample_project, path, pretty_print=False)
+            with open(path, "rb") as f:
+                compact = f.read()
+            assert b"\n  <" not in compact
+            assert compact == ET.tostring(sample_project.to_xml(), xml_declaration=True, encoding="UTF-8")
+
+            parser = ET.XMLParser(remove_blank_text=True)
+            assert ET.tostring(ET.fromstring(compact, parser)) == ET.tostring(sample_project.to_xml())
+        finally:
+            os.unlink(path)
+
+
+    def test_save_xml_streams_every_container(self, sample_project):
+        from dawproject import Scene, Notes, Note, Markers, Marker, Points, RealPoint
+
+        audio = Utility.create_audio("loop.wav", 44100, 2, 4.0)
+        warps = Warps(content=audio, content_time_unit=TimeUnit.SECONDS,
+                      events=[Warp(0.0, 0.0), Warp(4.0, 2.0)])
+        notes = Notes(notes=[Note(time=0.0, duration=1.0, key=60, vel=0.8)])
+        sample_project.arrangement.lanes.lanes.append(Clips(clips=[Clip(time=1.0, content=warps)]))
+        sample_project.arrangement.markers = Markers(markers=[Marker(time=0.0, name="Intro")])
+        sample_project.arrangement.tempo_automation = Points(
+            unit=Unit.BPM, points=[RealPoint(time=0.0, value=120.0)]
+        )
+        sample_project.scenes = [Scene(content=Clips(clips=[Clip(content=notes)]), name="A")]
+
+        with tempfile.NamedTemporaryFile(suffix=".xml", delete=False) as f:
+            path = f.name
+
+        try:
+            DawProject.save_xml(sample_project, path)
+            with open(path, "rb") as f:
+                streamed = f.read()
+            expected = ET.tostring(
+                sample_project.to_xml(), pretty_print=True, xml_declaration=True, encoding="UTF-8"
+            )
+            assert streamed == expected
+        finally:
+            os.unlink(path)
+
+
 class TestSaveAndLoad:
     def test_save_and_load_dawproject(self, sample_project):
         metadata = MetaData(title="Test Song", artist="Test Artist")
@@ -128,6 +189,128 @@ class TestSaveAndLoad:
             os.unlink(path)
 
 
+class TestEmbeddedFiles:
+    def _save_and_read(self, sample_project, embedded_files):
+        from zipfile import ZipFile
+
+        with tempfile.NamedTemporaryFile(suffix=".dawproject", delete=False) as f:
+            path = f.name
+        try:
+            DawProject.save(sample_project, MetaData(), embedded_files, path)
+            with ZipFile(path) as archive:
+                return {name: archive.read(name) for name in archive.namelist()}
+        finally:
+            os.unlink(path)
+
+    def test_embed_bytes(self, sample_project):
+        entries = self._save_and_read(sample_project, {b"RIFF0000WAVE": "audio/a.wav"})
+        assert entries["audio/a.wav"] == b"RIFF0000WAVE"
+
+    def test_embed_from_path(self, sample_project, tmp_path):
+        source = tmp_path / "stem.wav"
+        source.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+
+        entries = self._save_and_read(sample_project, {str(source): "audio/stem.wav", source: "audio/copy.wav"})
+        assert entries["audio/stem.wav"] == source.read_bytes()
+        assert entries["audio/copy.wav"] == source.read_bytes()
+
+    def test_embed_from_stream_is_chunked(self, sample_project):
+        from io import BytesIO
+        from dawproject.dawProject import COPY_CHUNK_SIZE
+
+        class RecordingStream(BytesIO):
+            reads = []
+
+            def read(self, size=-1):
+                self.reads.append(size)
+                return super().read(size)
+
+        payload = os.urandom(2 * COPY_CHUNK_SIZE + 5)
+        stream = RecordingStream(payload)
+        entries = self._save_and_read(sample_project, {stream: "audio/streamed.wav"})
+
+        assert entries["audio/streamed.wav"] == payload
+        assert all(0 < size <= COPY_CHUNK_SIZE for size in RecordingStream.reads)
+
+    def test_embed_unsized_stream_uses_zip64(self, sample_project):
+        from zipfile import ZipFile
+
+        class PipeLike:
+            def __init__(self, data):
+                self._data = data
+
+            def read(self, size=-1):
+                chunk, self._data = self._data[:size], self._data[size:]
+                return chunk
+
+        with tempfile.NamedTemporaryFile(suffix=".dawproject", delete=False) as f:
+            path = f.name
+        try:
+            DawProject.save(sample_project, MetaData(), {PipeLike(b"x" * 1000): "audio/pipe.wav"}, path)
+            with ZipFile(path) as archive:
+                assert archive.read("audio/pipe.wav") == b"x" * 1000
+                assert archive.testzip() is None
+        finally:
+            os.unlink(path)
+
+
+class TestStreamEmbedded:
+    @pytest.fixture
+    def archive(self, sample_project, tmp_path):
+        from zipfile import ZIP_DEFLATED
+
+        self.payload = bytes(range(256)) * 4096
+        path = str(tmp_path / "embedded.dawproject")
+        DawProject.save(sample_project, MetaData(), {self.payload: "audio/test.wav"}, path)
+
+        # Add a compressed copy of the same payload next to the STORED one
+        from zipfile import ZipFile
+        with ZipFile(path, "a") as archive:
+            archive.writestr("audio/deflated.wav", self.payload, compress_type=ZIP_DEFLATED)
+        return path
+
+    def test_stored_entry_is_served_from_archive(self, archive):
+        from dawproject import EmbeddedStream
+
+        with DawProject.stream_embedded(archive, "audio/test.wav") as stream:
+            assert isinstance(stream, EmbeddedStream)
+            assert stream.size == len(self.payload)
+            assert stream.read() == self.payload
+
+    def test_random_access(self, archive):
+        with DawProject.stream_embedded(archive, "audio/test.wav") as stream:
+            stream.seek(500_000)
+            assert stream.read(1000) == self.payload[500_000:501_000]
+            assert stream.tell() == 501_000
+
+            stream.seek(-10, 2)
+            assert stream.read() == self.payload[-10:]
+            assert stream.read(5) == b""
+
+    def test_readinto_fills_caller_buffer(self, archive):
+        with DawProject.stream_embedded(archive, "audio/test.wav") as stream:
+            stream.seek(1024)
+            buffer = bytearray(4096)
+            assert stream.readinto(buffer) == 4096
+            assert bytes(buffer) == self.payload[1024:5120]
+
+    def test_getbuffer_maps_entry(self, archive):
+        with DawProject.stream_embedded(archive, "audio/test.wav") as stream:
+            view = stream.getbuffer()
+            assert len(view) == len(self.payload)
+            assert view[100:200] == self.payload[100:200]
+            view.release()
+
+    def test_compressed_entry_is_seekable(self, archive):
+        with DawProject.stream_embedded(archive, "audio/deflated.wav") as stream:
+            stream.seek(300_000)
+            assert stream.read(16) == self.payload[300_000:300_016]
+
+    def test_missing_entry_raises(self, archive):
+        with pytest.raises(KeyError):
+            DawProject.stream_embedded(archive, "audio/missing.wav")
+
+
 class TestValidate:
     def test_validate_project(self, sample_project):
         """Test that validate runs without error for a well-formed project."""
@@ -187,3 +370,405 @@ class TestValidate:
         # Validate against XSD -- this will raise IOError if the XML
         # does not conform to the schema (e.g. wrong child ordering).
         DawProject.validate(project)
+
+
+class TestSchemaValidator:
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        from dawproject import SchemaValidator
+
+        SchemaValidator.clear_cache()
+        yield
+        SchemaValidator.clear_cache()
+
+    def test_schema_compiled_once(self, sample_project, monkeypatch):
+        compiled = []
+        original = ET.XMLSchema
+
+        def counting_schema(*args, **kwargs):
+            compiled.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(ET, "XMLSchema", counting_schema)
+        for _ in range(3):
+            DawProject.validate(sample_project)
+            DawProject.validate_metadata(MetaData(title="Song"))
+        assert len(compiled) == 2
+
+    def test_validates_element_and_bytes(self, sample_project):
+        from dawproject import SchemaValidator
+
+        validator = SchemaValidator()
+        root = sample_project.to_xml()
+        validator.validate_project(root)
+        validator.validate_project(ET.tostring(root, xml_declaration=True, encoding="UTF-8"))
+        assert validator.project_errors(root) == []
+
+    def test_invalid_tree_reports_errors(self, sample_project):
+        from dawproject import SchemaValidator
+
+        root = sample_project.to_xml()
+        ET.SubElement(root, "Bogus")
+        validator = SchemaValidator()
+        errors = validator.project_errors(root)
+        assert errors and "Bogus" in errors[0]
+        with pytest.raises(IOError, match="Bogus"):
+            DawProject.validate(root)
+
+    def test_metadata_errors(self):
+        from dawproject import SchemaValidator
+
+        root = MetaData(title="Song").to_xml()
+        ET.SubElement(root, "Bogus")
+        assert SchemaValidator().metadata_errors(root)
+
+    def test_save_with_validation_serializes_once(self, sample_project, tmp_path, monkeypatch):
+        calls = []
+        original = Project.to_xml
+
+        def counting_to_xml(self):
+            calls.append(self)
+            return original(self)
+
+        monkeypatch.setattr(Project, "to_xml", counting_to_xml)
+        path = tmp_path / "validated.dawproject"
+        DawProject.save(sample_project, MetaData(title="Song"), {}, path, validate=True)
+        assert len(calls) == 1
+
+        Referenceable.reset_id()
+        loaded = DawProject.load_project(path)
+        assert [track.name for track in loaded.structure] == [track.name for track in sample_project.structure]
+
+    def test_save_with_invalid_project_raises(self, sample_project, tmp_path, monkeypatch):
+        original = Project.to_xml
+
+        def invalid_to_xml(self):
+            root = original(self)
+            ET.SubElement(root, "Bogus")
+            return root
+
+        monkeypatch.setattr(Project, "to_xml", invalid_to_xml)
+        path = tmp_path / "invalid.dawproject"
+        with pytest.raises(IOError):
+            DawProject.save(sample_project, MetaData(), {}, path, validate=True)
+        assert not path.exists()
+
+
+class TestStreamingLoad:
+    def _save(self, project):
+        with tempfile.NamedTemporaryFile(suffix=".dawproject", delete=False) as f:
+            path = f.name
+        DawProject.save(project, MetaData(), {}, path)
+        return path
+
+    def test_streaming_load_matches_full_load(self, sample_project):
+        path = self._save(sample_project)
+        try:
+            Referenceable.reset_id()
+            full = DawProject.load_project(path)
+            full_xml = ET.tostring(full.to_xml())
+
+            Referenceable.reset_id()
+            streamed = DawProject.load_project(path, streaming=True)
+            assert ET.tostring(streamed.to_xml()) == full_xml
+        finally:
+            os.unlink(path)
+
+    def test_streaming_load_resolves_track_references(self, sample_project):
+        path = self._save(sample_project)
+        try:
+            Referenceable.reset_id()
+            loaded = DawProject.load_project(path, streaming=True)
+
+            lead = loaded.structure[1]
+            clips = loaded.arrangement.lanes.lanes[0]
+            assert clips.track is lead
+            assert lead.channel.destination is loaded.structure[0].channel
+            assert loaded.arrangement.lanes.time_unit == TimeUnit.SECONDS
+        finally:
+            os.unlink(path)
+
+    def test_streaming_loader_from_bytes_stream(self):
+        from io import BytesIO
+        from dawproject import StreamingLoader
+
+        xml = b"""\xef\xbb\xbf<?xml version="1.0" encoding="UTF-8"?>
+        <Project version="1.0">
+            <Application name="Test" version="2.0"/>
+            <Structure>
+                <Track name="A" id="id0"><Channel id="id1" role="master"/></Track>
+                <Channel id="id2" role="effect"/>
+            </Structure>
+            <Scenes><Scene id="id3" name="Intro"/></Scenes>
+        </Project>
+        """
+        project = StreamingLoader().load(BytesIO(xml))
+
+        assert project.application.version == "2.0"
+        assert [type(lane).__name__ for lane in project.structure] == ["Track", "Channel"]
+        assert project.arrangement is None
+        assert project.scenes[0].name == "Intro"
+
+
+class TestParallelLoad:
+    @pytest.fixture
+    def path(self, sample_project, tmp_path):
+        from dawproject import Send, SendType, Notes, Note, Points, RealPoint, AutomationTarget
+
+        master, lead = sample_project.structure
+        for i in range(6):
+            track = Utility.create_track(f"Synth {i}", {ContentType.NOTES}, MixerRole.REGULAR, 0.7, 0.5)
+            track.channel.destination = master.channel
+            track.channel.sends.append(Send(volume=RealParameter(value=0.5), destination=lead.channel,
+                                            type=SendType.POST))
+            sample_project.structure.append(track)
+            clips = Utility.create_clips(Clip(time=float(i), duration=4.0, content=Notes(notes=[
+                Note(time=n * 0.5, duration=0.5, key=60 + n, vel=0.8) for n in range(20)
+            ])))
+            automation = Points(
+                target=AutomationTarget(parameter=track.channel.volume),
+                points=[RealPoint(time=float(n), value=n / 10) for n in range(10)],
+            )
+            sample_project.arrangement.lanes.lanes.append(Lanes(track=track, lanes=[clips, automation]))
+
+        path = str(tmp_path / "parallel.dawproject")
+        DawProject.save(sample_project, MetaData(), {}, path)
+        Referenceable.reset_id()
+        return path
+
+    def _with_unknown_elements(self, path, tmp_path):
+        """Copy the archive with foreign elements and attributes in project.xml."""
+        from zipfile import ZipFile
+
+        with ZipFile(path) as archive:
+            entries = {name: archive.read(name) for name in archive.namelist()}
+        root = ET.fromstring(entries["project.xml"])
+        root.find("Structure").insert(1, ET.fromstring('<Mystery id="id900" vendor="x"><Inner/></Mystery>'))
+        lanes = root.find("Arrangement/Lanes")
+        lanes.insert(1, ET.fromstring('<VendorLane vendor="x"><Data value="1"/></VendorLane>'))
+        lanes[2].set("vendor", "y")
+        lanes[2].append(ET.fromstring("<VendorData/>"))
+        entries["project.xml"] = ET.tostring(root)
+        foreign = str(tmp_path / "foreign.dawproject")
+        with ZipFile(foreign, "w") as archive:
+            for name, data in entries.items():
+                archive.writestr(name, data)
+        return foreign
+
+    @pytest.mark.parametrize("unknown", [False, True])
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_same_graph_as_sequential(self, path, tmp_path, workers, unknown, monkeypatch):
+        from dawproject import parallelLoader
+
+        # Force one task per piece so that references cross process boundaries
+        monkeypatch.setattr(parallelLoader, "_MIN_TASK_BYTES", 1)
+        if unknown:
+            path = self._with_unknown_elements(path, tmp_path)
+        sequential = DawProject.load_project(path)
+        expected = ET.tostring(sequential.to_xml())
+        Referenceable.reset_id()
+
+        loaded = DawProject.load_project(path, parallel=True, workers=workers)
+        assert ET.tostring(loaded.to_xml()) == expected
+
+        structure = [lane for lane in loaded.structure if type(lane).__name__ != "Lane"]
+        master, lead = structure[:2]
+        lanes = loaded.arrangement.lanes.lanes
+        assert lanes[0].track is lead
+        for track, lane in zip(structure[2:], lanes[1:]):
+            assert lane.track is track
+            assert track.channel.destination is master.channel
+            assert track.channel.sends[0].destination is lead.channel
+            assert lane.lanes[1].target.parameter is track.channel.volume
+            assert Referenceable.get_by_id(track.id) is track
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_unknown_elements_kept_as_in_sequential(self, path, tmp_path, workers, monkeypatch):
+        from dawproject import parallelLoader
+
+        monkeypatch.setattr(parallelLoader, "_MIN_TASK_BYTES", 1)
+        loaded = DawProject.load_project(self._with_unknown_elements(path, tmp_path), parallel=True, workers=workers)
+        written = loaded.to_xml()
+        assert ET.tostring(written.find("Arrangement/Lanes/VendorLane")) == (
+            b'<VendorLane vendor="x"><Data value="1"/></VendorLane>'
+        )
+        # The Structure child is read by the Lane fallback, as in a sequential load
+        assert written.find("Structure")[1].get("vendor") == "x"
+        assert written.find("Structure")[1][0].tag == "Inner"
+
+    def test_new_ids_do_not_collide(self, path):
+        loaded = DawProject.load_project(path, parallel=True, workers=1)
+        ids = {track.id for track in loaded.structure}
+        fresh = Utility.create_track("New", set(), MixerRole.REGULAR, 1.0, 0.5)
+        assert fresh.id not in ids
+
+
+class TestPartialLoad:
+    @pytest.fixture
+    def path(self, tmp_path):
+        from dawproject import Notes, Note, Points, RealPoint, AutomationTarget, Markers, Marker
+
+        project = Project(application=Application(name="TestDAW", version="1.0"))
+        master = Utility.create_track("Master", set(), MixerRole.MASTER, 1.0, 0.5)
+        vocals = Utility.create_track("Vocal Bus", {ContentType.AUDIO}, MixerRole.SUB_MIX, 0.8, 0.5)
+        drums = Utility.create_track("Drums", {ContentType.NOTES}, MixerRole.REGULAR, 0.8, 0.5)
+        folder = Utility.create_track("Keys Folder", {ContentType.TRACKS}, MixerRole.SUB_MIX, 1.0, 0.5)
+        piano = Utility.create_track("Piano", {ContentType.NOTES}, MixerRole.REGULAR, 1.0, 0.5)
+        organ = Utility.create_track("Organ", {ContentType.NOTES}, MixerRole.REGULAR, 1.0, 0.5)
+        folder.tracks = [piano, organ]
+        for track in (vocals, drums, folder):
+            track.channel.destination = master.channel
+        project.structure = [master, vocals, drums, folder]
+
+        project.arrangement = Arrangement(lanes=Lanes(time_unit=TimeUnit.BEATS))
+        for track in (vocals, drums, piano, organ):
+            if track is vocals:
+                content = Utility.create_audio("vocals.wav", 44100, 2, 8.0)
+            else:
+                content = Notes(notes=[Note(time=0, duration=1, key=60, vel=0.8)])
+            clips = Utility.create_clips(Clip(time=0.0, duration=8.0, content=content))
+            automation = Points(
+                target=AutomationTarget(parameter=track.channel.volume),
+                points=[RealPoint(time=0.0, value=0.5)],
+            )
+            project.arrangement.lanes.lanes.append(Lanes(track=track, lanes=[clips, automation]))
+        project.arrangement.markers = Markers(markers=[Marker(time=0.0, name="Intro")])
+
+        path = str(tmp_path / "partial.dawproject")
+        DawProject.save(project, MetaData(), {}, path)
+        Referenceable.reset_id()
+        return path
+
+    def _lanes_by_track(self, project):
+        return {lane.track.name: lane for lane in project.arrangement.lanes.lanes}
+
+    def test_filter_by_name(self, path):
+        from dawproject import LoadFilter
+
+        project = DawProject.load_project(path, load_filter=LoadFilter(track_names={"Vocal Bus"}))
+
+        assert [track.name for track in project.structure] == ["Vocal Bus"]
+        lanes = self._lanes_by_track(project)
+        assert list(lanes) == ["Vocal Bus"]
+        vocal_lane = lanes["Vocal Bus"]
+        assert vocal_lane.track is project.structure[0]
+        assert [type(lane).__name__ for lane in vocal_lane.lanes] == ["Clips", "Points"]
+        assert vocal_lane.lanes[1].target.parameter is project.structure[0].channel.volume
+        # The master track was not selected, so its channel does not resolve
+        assert project.structure[0].channel.destination is None
+        assert project.arrangement.markers.markers[0].name == "Intro"
+
+    def test_nested_track_keeps_folder(self, path):
+        from dawproject import LoadFilter
+
+        project = DawProject.load_project(path, load_filter=LoadFilter(track_names={"Organ"}))
+
+        assert [track.name for track in project.structure] == ["Keys Folder"]
+        assert [track.name for track in project.structure[0].tracks] == ["Organ"]
+        assert sorted(self._lanes_by_track(project)) == ["Organ"]
+        assert self._lanes_by_track(project)["Organ"].track is project.structure[0].tracks[0]
+
+    def test_filter_by_id_and_content_type(self, path):
+        from dawproject import LoadFilter
+
+        full = DawProject.load_project(path)
+        drums_id = full.structure[2].id
+        Referenceable.reset_id()
+
+        project = DawProject.load_project(
+            path, load_filter=LoadFilter(track_ids={drums_id}, content_types={ContentType.AUDIO})
+        )
+        assert [track.name for track in project.structure] == ["Vocal Bus", "Drums"]
+
+    def test_selected_folder_keeps_children(self, path):
+        from dawproject import LoadFilter
+
+        project = DawProject.load_project(path, load_filter=LoadFilter(track_names={"Keys Folder"}))
+        assert [track.name for track in project.structure[0].tracks] == ["Piano", "Organ"]
+        assert sorted(self._lanes_by_track(project)) == ["Organ", "Piano"]
+
+    def test_skip_timeline_kinds(self, path, monkeypatch):
+        from dawproject import LoadFilter, Notes, Points, RealPoint
+
+        def fail(*args, **kwargs):
+            raise AssertionError("skipped timeline was deserialized")
+
+        monkeypatch.setattr(Notes, "from_xml", fail)
+        monkeypatch.setattr(RealPoint, "from_xml", fail)
+
+        project = DawProject.load_project(path, load_filter=LoadFilter(skip_timelines={Notes, Points}))
+        assert len(project.structure) == 4
+        lanes = self._lanes_by_track(project)
+        assert sorted(lanes) == ["Drums", "Organ", "Piano", "Vocal Bus"]
+        assert all(type(lane).__name__ == "Clips" for lane in lanes["Drums"].lanes)
+        assert lanes["Drums"].lanes[0].clips[0].content is None
+        assert lanes["Vocal Bus"].lanes[0].clips[0].content.file.path == "vocals.wav"
+
+
+class TestSummarize:
+    def _save(self, project, tmp_path):
+        path = str(tmp_path / "summary.dawproject")
+        DawProject.save(project, MetaData(), {}, path)
+        return path
+
+    def test_summary_of_sample_project(self, sample_project, tmp_path):
+        summary = DawProject.summarize(self._save(sample_project, tmp_path))
+
+        assert summary.version == "1.0"
+        assert summary.application == "TestDAW"
+        assert summary.application_version == "1.0"
+        assert summary.tempo == 120.0
+        assert summary.track_names == ["Master", "Lead"]
+        assert summary.track_count == 2
+        assert summary.clip_count == 1
+        assert summary.arrangement_length == 10.0
+        assert summary.arrangement_time_unit == "seconds"
+        assert summary.plugins == []
+
+    def test_summary_counts_nested_and_plugins(self, sample_project, tmp_path):
+        from dawproject import (
+            Vst3Plugin, ClapPlugin, TimeSignatureParameter, Notes, Note, DeviceRole, Equalizer,
+        )
+
+        sample_project.transport.time_signature = TimeSignatureParameter(numerator=6, denominator=8)
+        lead = sample_project.structure[1]
+        lead.channel.devices.append(Vst3Plugin(
+            device_name="Synth", device_vendor="Acme", device_id="ABC", plugin_version="2.1",
+            device_role=DeviceRole.INSTRUMENT,
+        ))
+        lead.channel.devices.append(Equalizer(device_name="EQ"))
+        folder = Utility.create_track("Folder", {ContentType.TRACKS}, MixerRole.SUB_MIX, 1.0, 0.5)
+        child = Utility.create_track("Child", {ContentType.NOTES}, MixerRole.REGULAR, 1.0, 0.5)
+        child.channel.devices.append(ClapPlugin(device_name="Keys", device_role=DeviceRole.INSTRUMENT))
+        folder.tracks.append(child)
+        sample_project.structure.append(folder)
+
+        # A clip containing clips counts once; its inner clips do not extend the arrangement
+        inner = Utility.create_clips(
+            Clip(time=0.0, duration=4.0, content=Notes(notes=[Note(time=0, duration=1, key=60, vel=0.8)])),
+            Clip(time=100.0, duration=4.0),
+        )
+        outer = Utility.create_clips(Clip(time=20.0, duration=8.0, content=inner))
+        outer.track = child
+        sample_project.arrangement.lanes.lanes.append(outer)
+
+        summary = DawProject.summarize(self._save(sample_project, tmp_path))
+
+        assert summary.time_signature == (6, 8)
+        assert summary.track_names == ["Master", "Lead", "Folder", "Child"]
+        assert summary.clip_count == 2
+        assert summary.arrangement_length == 28.0
+        assert summary.plugins == [
+            {"format": "Vst3Plugin", "name": "Synth", "vendor": "Acme", "id": "ABC", "version": "2.1"},
+            {"format": "ClapPlugin", "name": "Keys", "vendor": None, "id": None, "version": None},
+        ]
+
+    def test_summary_builds_no_model_objects(self, sample_project, tmp_path, monkeypatch):
+        path = self._save(sample_project, tmp_path)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("object model was built")
+
+        for cls in (Project, Track, Clip, Audio):
+            monkeypatch.setattr(cls, "from_xml", fail)
+        assert DawProject.summarize(path).clip_count == 1
@@ -10,7 +10,7 @@ from dawproject import (
     Equalizer, Compressor, EqBand, MetaData,
     ContentType, MixerRole, TimeUnit, Unit, DeviceRole,
     EqBandType, Interpolation, SendType,
-    Referenceable, FileReference,
+    Referenceable, FileReference, IdScope, ReferenceTable,
 )
 
 
@@ -428,12 +428,12 @@ class TestReferenceableIdCounter:
         """Creating new objects must not overwrite deserialized instances."""
         xml = '<Track name="Master" id="id0"/>'
         elem = ET.fromstring(xml)
-        Track.from_xml(elem)
+        loaded = Track.from_xml(elem)
 
         new_track = Track(name="NewTrack")
         master = Referenceable.get_by_id("id0")
 
-        assert master is not None
+        assert master is loaded
         assert master.name == "Master"
         assert new_track.id != "id0"
 
@@ -447,3 +447,422 @@ class TestReferenceableIdCounter:
         assert Referenceable.ID >= 6
         new_track = Track(name="C")
         assert new_track.id == "id6"
+
+
+class TestIdScope:
+    TWO_TRACKS = """
+    <Project version="1.0">
+        <Application name="Test" version="1.0"/>
+        <Structure>
+            <Track name="{master}" id="id0">
+                <Channel id="id1" role="master" audioChannels="2"/>
+            </Track>
+            <Track name="Bass" id="id2">
+                <Channel id="id3" role="regular" audioChannels="2" destination="id1"/>
+            </Track>
+        </Structure>
+    </Project>
+    """
+
+    def test_scope_isolates_ids_and_lookups(self):
+        outer = Track(name="Outer")
+        assert outer.id == "id0"
+        with IdScope() as scope:
+            inner = Track(name="Inner")
+            assert inner.id == "id0"
+            assert Referenceable.get_by_id("id0") is inner
+            assert IdScope.current() is scope
+        assert IdScope.current() is not scope
+        assert Referenceable.get_by_id("id0") is outer
+        assert Track(name="Next").id == "id1"
+
+    def test_registry_does_not_keep_objects_alive(self):
+        import gc
+
+        track = Track(name="Dropped")
+        track_id = track.id
+        del track
+        gc.collect()
+        assert Referenceable.get_by_id(track_id) is None
+
+    def test_concurrent_loads_in_threads(self):
+        import threading
+
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def load(name):
+            with IdScope():
+                root = ET.fromstring(self.TWO_TRACKS.format(master=name))
+                barrier.wait()
+                project = Project.from_xml(root)
+                results[name] = project
+
+        threads = [threading.Thread(target=load, args=(name,)) for name in ("A", "B")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for name, project in results.items():
+            master, bass = project.structure
+            assert master.name == name
+            assert bass.channel.destination is master.channel
+
+    def test_load_project_merges_into_caller_scope(self, tmp_path):
+        from dawproject import DawProject
+
+        project = Project.from_xml(ET.fromstring(self.TWO_TRACKS.format(master="Master")))
+        path = str(tmp_path / "scoped.dawproject")
+        DawProject.save(project, MetaData(), {}, path)
+        Referenceable.reset_id()
+
+        loaded = DawProject.load_project(path)
+        master = loaded.structure[0]
+        assert Referenceable.get_by_id("id0") is master
+        assert Referenceable.ID >= 4
+        assert Track(name="New").id not in {"id0", "id1", "id2", "id3"}
+
+
+class TestLazyIdAllocation:
+    SPARSE = """
+    <Project version="1.0">
+        <Application name="Test" version="1.0"/>
+        <Structure>
+            <Track name="Master" id="id10">
+                <Channel id="id20" role="master" audioChannels="2"/>
+            </Track>
+            <Track name="Bass" id="id30">
+                <Channel id="id40" role="regular" audioChannels="2" destination="id20">
+                    <Volume id="id50" value="0.5" unit="linear"/>
+                </Channel>
+            </Track>
+        </Structure>
+        <Arrangement id="id60">
+            <Lanes id="id70" timeUnit="beats">
+                <Points id="id80" track="id30">
+                    <Target parameter="id50"/>
+                </Points>
+            </Lanes>
+        </Arrangement>
+    </Project>
+    """
+
+    def test_id_allocated_on_first_access(self):
+        track = Track(name="A")
+        assert "id" not in vars(track)
+        assert Referenceable.ID == 0
+        assert track.id == "id0"
+        assert Referenceable.get_by_id("id0") is track
+        assert track.id == "id0"
+        assert Referenceable.ID == 1
+
+    def test_unused_objects_allocate_nothing(self):
+        for _ in range(10):
+            RealParameter(value=0.5)
+        assert Referenceable.ID == 0
+        assert len(IdScope.current()) == 0
+
+    def test_serialization_numbers_in_document_order(self):
+        later = Track(name="Later")
+        first = Track(name="First")
+        project = Project(structure=[first, later])
+        project.to_xml()
+        assert (first.id, later.id) == ("id0", "id1")
+
+    def test_missing_xml_id_allocated_lazily(self):
+        track = Track.from_xml(ET.fromstring('<Track name="NoId"/>'))
+        assert "id" not in vars(track)
+        assert track.id == "id0"
+
+    def test_renumber_ids_dense_with_references(self, tmp_path):
+        from dawproject import DawProject
+
+        project = Project.from_xml(ET.fromstring(self.SPARSE))
+        path = tmp_path / "project.xml"
+        DawProject.save_xml(project, str(path), renumber_ids=True)
+        saved = ET.parse(str(path)).getroot()
+        ids = [element.get("id") for element in saved.iter() if element.get("id")]
+        assert sorted(ids, key=lambda id: int(id[2:])) == [f"id{n}" for n in range(len(ids))]
+        master, bass = project.structure
+        assert saved.find("Structure/Track[2]/Channel").get("destination") == master.channel.id
+        points = saved.find("Arrangement/Lanes/Points")
+        assert points.get("track") == bass.id
+        assert points.find("Target").get("parameter") == bass.channel.volume.id
+        assert Referenceable.get_by_id(bass.id) is bass
+        assert Track(name="New").id not in ids
+
+    def test_renumber_ids_parses_lazy_subtrees(self, tmp_path):
+        from dawproject import DawProject
+
+        project = Project.from_xml(ET.fromstring(self.SPARSE), lazy=True)
+        path = tmp_path / "project.xml"
+        DawProject.save_xml(project, str(path), renumber_ids=True)
+        points = ET.parse(str(path)).getroot().find("Arrangement/Lanes/Points")
+        assert points.get("track") == project.structure[1].id
+        assert int(points.get("id")[2:]) < 10
+
+    def test_threaded_save_allocates_in_caller_scope(self, tmp_path):
+        from dawproject import DawProject
+
+        with IdScope(100) as scope:
+            project = Project(structure=[Track(name="A")])
+            DawProject.save(project, MetaData(), {}, str(tmp_path / "a.dawproject"), workers=2)
+            assert project.structure[0].id == "id100"
+            assert scope.get("id100") is project.structure[0]
+
+
+class TestDeferredReferences:
+    FORWARD = """
+    <Project version="1.0">
+        <Application name="Test" version="1.0"/>
+        <Structure>
+            <Track name="Bass" id="id0">
+                <Channel id="id1" role="regular" audioChannels="2" destination="id3">
+                    <Volume id="id4" value="0.5" unit="linear"/>
+                    <Sends>
+                        <Send id="id5" destination="id3"><Volume id="id6" value="0.2" unit="linear"/></Send>
+                    </Sends>
+                </Channel>
+            </Track>
+            <Track name="Master" id="id2">
+                <Channel id="id3" role="master" audioChannels="2" destination="id99"/>
+            </Track>
+        </Structure>
+        <Arrangement id="id7">
+            <Lanes id="id8" timeUnit="beats">
+                <Points id="id9" track="id0">
+                    <Target parameter="id4"/>
+                </Points>
+                <Points id="id10">
+                    <Target parameter="id98"/>
+                </Points>
+            </Lanes>
+        </Arrangement>
+    </Project>
+    """
+
+    def test_forward_references_resolved_by_project_loader(self):
+        project = Project.from_xml(ET.fromstring(self.FORWARD))
+        bass, master = project.structure
+        assert bass.channel.destination is master.channel
+        assert bass.channel.sends[0].destination is master.channel
+
+    def test_counts_resolved_and_dangling(self):
+        with ReferenceTable.collect() as references:
+            project = Project.from_xml(ET.fromstring(self.FORWARD))
+
+        bass, master = project.structure
+        points, unknown = project.arrangement.lanes.lanes
+        assert points.track is bass
+        assert points.target.parameter is bass.channel.volume
+        # Dangling references keep what the deserializer gave them
+        assert master.channel.destination is None
+        assert unknown.target.parameter == "id98"
+
+        assert references.resolved == 4
+        assert references.dangling_count == 2
+        assert {id for _, _, id in references.dangling} == {"id98", "id99"}
+        assert references.pending == []
+        assert IdScope.current().fixups is None
+
+    def test_streaming_loader_resolves_forward_references(self):
+        from io import BytesIO
+        from dawproject import StreamingLoader
+
+        loader = StreamingLoader()
+        project = loader.load(BytesIO(self.FORWARD.encode()))
+        bass, master = project.structure
+        assert bass.channel.destination is master.channel
+        assert loader.references.resolved == 4
+        assert loader.references.dangling_count == 2
+
+    def test_archive_exposes_reference_counts(self, tmp_path):
+        from dawproject import DawProject
+
+        project = Project.from_xml(ET.fromstring(self.FORWARD))
+        path = str(tmp_path / "forward.dawproject")
+        DawProject.save(project, MetaData(), {}, path)
+        Referenceable.reset_id()
+
+        with DawProject.open(path) as archive:
+            bass, master = archive.project.structure
+            assert bass.channel.destination is master.channel
+            # The None destination is not written back; the automation
+            # target keeps its id string and still dangles
+            assert archive.references.resolved == 4
+            assert archive.references.dangling_count == 1
+
+
+class TestChildDispatch:
+    def test_dispatcher_is_compiled_once_per_class(self):
+        from dawproject.fieldSpec import child_dispatcher
+
+        assert child_dispatcher(Channel) is child_dispatcher(Channel)
+        # Specs are merged along the MRO: Device children plus Compressor's own
+        handlers = child_dispatcher(Compressor).handlers
+        assert {"Enabled", "State", "Parameters", "Threshold", "AutoMakeup"} <= set(handlers)
+
+    def test_children_in_any_order(self):
+        xml = """
+        <Channel id="id0" role="regular">
+            <Volume id="id1" value="0.8" unit="linear"/>
+            <Sends><Send id="id2" type="pre"><Volume id="id3" value="0.1" unit="linear"/></Send></Sends>
+            <Mute id="id4" value="true"/>
+            <Unknown/>
+            <Pan id="id5" value="0.25" unit="normalized"/>
+            <Volume id="id6" value="0.1" unit="linear"/>
+        </Channel>
+        """
+        channel = Channel.from_xml(ET.fromstring(xml))
+        assert channel.volume.value == 0.8  # the first match wins, like find()
+        assert channel.pan.value == 0.25
+        assert channel.mute.value is True
+        assert [send.type for send in channel.sends] == [SendType.PRE]
+        assert channel.devices == []
+
+    def test_unknown_device_falls_back_to_device(self):
+        from dawproject import Device
+
+        xml = '<Channel id="id0"><Devices><FancyDevice id="id1" deviceName="X"/></Devices></Channel>'
+        channel = Channel.from_xml(ET.fromstring(xml))
+        assert type(channel.devices[0]) is Device
+        assert channel.devices[0].device_name == "X"
+
+    def test_structure_comments_are_skipped(self):
+        xml = """
+        <Project version="1.0">
+            <Structure><!-- master --><Track id="id0" name="Master"/></Structure>
+        </Project>
+        """
+        project = Project.from_xml(ET.fromstring(xml))
+        assert [track.name for track in project.structure] == ["Master"]
+
+    def test_registry_kind_maps(self):
+        from dawproject import registry
+
+        classes = registry.classes_for(registry.POINT_TAGS)
+        assert classes is registry.classes_for(registry.POINT_TAGS)
+        assert classes["RealPoint"] is RealPoint
+        assert set(classes) == set(registry.POINT_TAGS)
+
+
+class TestLazyLoading:
+    XML = """
+    <Project version="1.0">
+        <Application name="Test" version="1.0"/>
+        <Structure>
+            <Track name="Synth" id="id0" contentType="notes">
+                <Channel id="id1" role="regular" audioChannels="2">
+                    <Volume id="id2" value="0.5" unit="linear"/>
+                </Channel>
+            </Track>
+        </Structure>
+        <Arrangement id="id3">
+            <Lanes id="id4" timeUnit="beats">
+                <Lanes id="id5" track="id0">
+                    <Clips id="id6">
+                        <Clip time="0.0" duration="4.0">
+                            <Notes id="id7">
+                                <Note time="0.0" duration="1.0" key="60" channel="0" vel="0.8"/>
+                                <Note time="1.0" duration="1.0" key="64" channel="0" vel="0.7"/>
+                            </Notes>
+                        </Clip>
+                    </Clips>
+                </Lanes>
+                <Points id="id42" track="id0">
+                    <Target parameter="id2"/>
+                    <RealPoint time="0.0" value="0.25"/>
+                </Points>
+            </Lanes>
+        </Arrangement>
+    </Project>
+    """
+
+    def _root(self):
+        return ET.fromstring(self.XML, ET.XMLParser(remove_blank_text=True))
+
+    def _load(self, lazy=True):
+        return Project.from_xml(self._root(), lazy=lazy)
+
+    def test_lanes_parsed_on_first_access(self):
+        project = self._load()
+        arrangement_lanes = project.arrangement.lanes
+        assert "lanes" not in vars(arrangement_lanes)
+
+        track_lanes, points = arrangement_lanes.lanes
+        assert "lanes" in vars(arrangement_lanes)
+        assert isinstance(points, Points)
+        assert "lanes" not in vars(track_lanes)
+        clip = track_lanes.lanes[0].clips[0]
+        assert "content" not in vars(clip)
+        assert [note.key for note in clip.content.notes] == [60, 64]
+
+    def test_materialized_subtree_matches_eager_load(self):
+        lazy = self._load()
+        lazy.arrangement.lanes.lanes[0].lanes[0].clips[0].content.notes
+        Referenceable.reset_id()
+        eager = self._load(lazy=False)
+        assert ET.tostring(lazy.to_xml(), method="c14n") == ET.tostring(eager.to_xml(), method="c14n")
+
+    @pytest.mark.parametrize("pretty_print", [False, True])
+    def test_untouched_subtree_laid_out_like_eager_load(self, tmp_path, pretty_print):
+        from dawproject import DawProject
+
+        # Parsed with the indentation, which the copies must not keep
+        lazy = Project.from_xml(ET.fromstring(self.XML), lazy=True)
+        Referenceable.reset_id()
+        eager = Project.from_xml(ET.fromstring(self.XML))
+        assert ET.tostring(lazy.to_xml(), pretty_print=pretty_print) == ET.tostring(
+            eager.to_xml(), pretty_print=pretty_print
+        )
+        DawProject.save_xml(lazy, str(tmp_path / "lazy.xml"), pretty_print)
+        DawProject.save_xml(eager, str(tmp_path / "eager.xml"), pretty_print)
+        assert (tmp_path / "lazy.xml").read_bytes() == (tmp_path / "eager.xml").read_bytes()
+        assert "lanes" not in vars(lazy.arrangement.lanes)
+
+    def test_references_resolved_on_access(self):
+        project = self._load()
+        track = project.structure[0]
+        points = project.arrangement.lanes.lanes[1]
+        assert points.track is track
+        assert points.target.parameter is track.channel.volume
+
+    def test_untouched_subtree_saved_as_original_xml(self):
+        project = self._load()
+        saved = project.to_xml().find("Arrangement")
+        assert "lanes" not in vars(project.arrangement.lanes)
+        original = self._root().find("Arrangement")
+        assert ET.tostring(saved, method="c14n") == ET.tostring(original, method="c14n")
+
+    def test_streamed_save_copies_untouched_subtree(self, tmp_path):
+        from dawproject import DawProject
+
+        project = self._load()
+        path = tmp_path / "project.xml"
+        DawProject.save_xml(project, str(path))
+        assert "lanes" not in vars(project.arrangement.lanes)
+        saved = ET.parse(str(path)).getroot()
+        assert [note.get("key") for note in saved.iter("Note")] == ["60", "64"]
+        # The loaded tree itself is left intact
+        assert project.arrangement.lanes.lanes[0].lanes[0].clips[0].content.notes[1].key == 64
+
+    def test_assignment_replaces_pending_subtree(self):
+        project = self._load()
+        project.arrangement.lanes.lanes = []
+        saved = project.to_xml()
+        assert saved.find("Arrangement/Lanes").findall("*") == []
+
+    def test_new_ids_skip_ids_of_pending_subtrees(self):
+        self._load()
+        assert Track().id == "id43"
+
+    def test_eager_load_by_default(self):
+        project = Project.from_xml(ET.fromstring(self.XML))
+        assert "lanes" in vars(project.arrangement.lanes)
+
+    def test_lazy_cannot_be_combined_with_streaming(self, tmp_path):
+        from dawproject import DawProjectArchive
+
+        with pytest.raises(ValueError):
+            DawProjectArchive(str(tmp_path / "missing.dawproject"), streaming=True, lazy=True)
@@ -293,3 +293,97 @@ class TestWarps:
     def test_create_warps_with_invalid_content_time_unit_raises(self):
         with pytest.raises(TypeError, match="content_time_unit must be a TimeUnit"):
             Warps(content_time_unit="seconds")
+
+
+class TestSlottedLeafClasses:
+    LEAVES = [
+        lambda: Note(time=1.0, duration=0.5, key=60, vel=0.8),
+        lambda: RealPoint(time=1.0, value=0.5, interpolation=Interpolation.LINEAR),
+        lambda: Warp(time=1.0, content_time=2.0),
+        lambda: Marker(time=1.0, name="Verse"),
+        lambda: FileReference(path="audio/a.wav"),
+    ]
+
+    @pytest.mark.parametrize("create", LEAVES)
+    def test_no_instance_dict(self, create):
+        obj = create()
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.undeclared = 1
+
+    @pytest.mark.parametrize("create", LEAVES)
+    def test_from_xml_and_copies(self, create):
+        import copy
+        import pickle
+        from lxml import etree as ET
+
+        obj = create()
+        xml = ET.tostring(obj.to_xml())
+        loaded = type(obj).from_xml(obj.to_xml())
+        assert ET.tostring(loaded.to_xml()) == xml
+        assert ET.tostring(copy.deepcopy(obj).to_xml()) == xml
+        assert ET.tostring(pickle.loads(pickle.dumps(obj)).to_xml()) == xml
+
+    def test_attributes_stay_writable(self):
+        note = Note(time=0.0, duration=1.0, key=60)
+        note.key = 62
+        note.content = Notes()
+        assert note.key == 62
+        assert isinstance(note.content, Notes)
+
+    def test_unknown_content_kept_in_slot(self):
+        from lxml import etree as ET
+
+        note = Note.from_xml(ET.fromstring('<Note time="0" duration="1" key="60" custom="x"/>'))
+        assert note._xml_unknown.attrib == {"custom": "x"}
+        assert note.to_xml().get("custom") == "x"
+
+    def test_traversal_reads_slots(self):
+        from dawproject.traversal import iter_objects
+
+        marker = Marker(time=1.0, name="Verse")
+        notes = Notes(notes=[Note(time=0.0, duration=1.0, key=60, content=Notes())])
+        objects = list(iter_objects(Clips(clips=[Clip(content=notes)])))
+        assert sum(isinstance(obj, Notes) for obj in objects) == 2
+        assert list(iter_objects(marker)) == [marker]
+
+
+class TestOnDemandParameters:
+    def test_absent_parameters_not_allocated(self):
+        eq = Equalizer(device_name="EQ")
+        comp = Compressor(threshold=-20.0)
+        assert "input_gain" not in vars(eq)
+        assert "output_gain" not in vars(eq)
+        assert set(vars(comp)) & {"ratio", "attack", "release", "auto_makeup"} == set()
+        assert comp.threshold.value == -20.0
+
+    def test_placeholder_created_on_access(self):
+        eq = Equalizer()
+        assert eq.input_gain.value is None
+        assert eq.input_gain is eq.input_gain
+        eq.output_gain.value = 3.0
+        element = eq.to_xml()
+        assert element.find("InputGain") is None
+        assert element.find("OutputGain").get("value") == "3.0"
+
+    def test_serialization_does_not_allocate(self):
+        comp = Compressor(ratio=4.0)
+        comp.to_xml()
+        assert set(vars(comp)) & {"threshold", "attack", "release", "input_gain", "output_gain", "auto_makeup"} == set()
+
+    def test_missing_elements_not_allocated_on_load(self):
+        from lxml import etree as ET
+
+        comp = Compressor.from_xml(ET.fromstring('<Compressor id="id0"><Ratio id="id1" value="4.0"/></Compressor>'))
+        assert comp.ratio.value == 4.0
+        assert "threshold" not in vars(comp)
+        assert comp.threshold.value is None
+        assert Referenceable.ID == 2
+
+    def test_eq_band_optional_parameters(self):
+        band = EqBand(freq=1000.0, band_type=EqBandType.BELL)
+        assert set(vars(band)) & {"gain", "q", "enabled"} == set()
+        assert band.gain.value is None
+        element = band.to_xml()
+        assert element.find("Freq") is not None
+        assert element.find("Gain") is None
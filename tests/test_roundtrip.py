@@ -292,3 +292,76 @@ class TestWarpsRoundTrip:
         assert children[0].tag == "Audio"
         assert children[1].tag == "Warp"
         assert children[2].tag == "Warp"
+
+
+class TestUnknownContentRoundTrip:
+    XML = """
+    <Project version="1.0" xmlns:x="urn:example">
+        <Application name="Test" version="1.0"/>
+        <Structure>
+            <Track id="id0" name="Synth" x:color="blue">
+                <Channel id="id1" role="regular" audioChannels="2">
+                    <x:Extension id="id77">data<x:Item/></x:Extension>
+                </Channel>
+            </Track>
+        </Structure>
+        <Arrangement id="id2">
+            <Lanes id="id3" timeUnit="beats">
+                <FutureLane id="id4" mode="new"/>
+                <Notes id="id5">
+                    <Note time="0.0" duration="1.0" key="60" vel="0.5" x:fx="3"><Extra/></Note>
+                </Notes>
+            </Lanes>
+        </Arrangement>
+    </Project>
+    """
+
+    def _load(self):
+        return Project.from_xml(ET.fromstring(self.XML, ET.XMLParser(remove_blank_text=True)))
+
+    def test_unknown_attributes_and_elements_kept(self):
+        project = self._load()
+        track = project.structure[0]
+        assert track._xml_unknown.attrib == {"{urn:example}color": "blue"}
+        assert [e.tag for e in track.channel._xml_unknown.elements] == ["{urn:example}Extension"]
+        lanes = project.arrangement.lanes
+        assert [e.tag for e in lanes._xml_unknown.elements] == ["FutureLane"]
+        assert len(lanes.lanes) == 1
+
+    def test_unknown_content_written_back(self):
+        saved = self._load().to_xml()
+        assert saved.find("Structure/Track").get("{urn:example}color") == "blue"
+        extension = saved.find("Structure/Track/Channel/{urn:example}Extension")
+        assert extension.get("id") == "id77" and extension.text == "data"
+        assert saved.find("Arrangement/Lanes/FutureLane").get("mode") == "new"
+        note = saved.find("Arrangement/Lanes/Notes/Note")
+        assert note.get("{urn:example}fx") == "3"
+        assert note.find("Extra") is not None
+
+    def test_unknown_content_streamed(self, tmp_path):
+        from dawproject import DawProject
+
+        path = tmp_path / "project.xml"
+        DawProject.save_xml(self._load(), str(path))
+        saved = ET.parse(str(path)).getroot()
+        assert saved.find("Structure/Track/Channel/{urn:example}Extension") is not None
+        assert saved.find("Arrangement/Lanes/FutureLane") is not None
+        assert saved.find("Arrangement/Lanes/Notes/Note/Extra") is not None
+
+    def test_declared_values_take_precedence(self):
+        project = self._load()
+        track = project.structure[0]
+        track._xml_unknown.attrib["name"] = "stale"
+        assert track.to_xml().get("name") == "Synth"
+
+    def test_ids_in_unknown_elements_are_reserved(self):
+        self._load()
+        assert Track().id == "id78"
+
+    def test_known_content_has_no_unknown(self):
+        project = Project()
+        project.structure.append(Utility.create_track("Bass", {ContentType.AUDIO}, MixerRole.REGULAR, 1.0, 0.5))
+        loaded = roundtrip_project(project)
+        assert loaded._xml_unknown is None
+        assert loaded.structure[0]._xml_unknown is None
+        assert loaded.structure[0].channel.volume._xml_unknown is None
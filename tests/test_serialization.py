@@ -1,5 +1,7 @@
 """Tests for XML serialization (to_xml) of DAWproject models."""
 
+import os
+
 import pytest
 from lxml import etree as ET
 from dawproject import (
@@ -301,3 +303,95 @@ class TestRealPointSerialization:
         assert elem.get("time") == "1.0"
         assert elem.get("value") == "0.5"
         assert elem.get("interpolation") == "linear"
+
+
+XS = "{http://www.w3.org/2001/XMLSchema}"
+
+
+def _xsd_types(*names):
+    """Map each complexType name to (sequence positions by tag, attribute names), bases included."""
+    own = {}
+    for name in names:
+        path = os.path.join(os.path.dirname(__file__), "..", name)
+        for complex_type in ET.parse(path).getroot().iter(XS + "complexType"):
+            if complex_type.get("name") is None:
+                continue
+            extension = complex_type.find(f"{XS}complexContent/{XS}extension")
+            body = extension if extension is not None else complex_type
+            tags = []
+            # The content is a sequence, or a single choice (scene)
+            sequence = body.find(XS + "sequence")
+            particles = sequence if sequence is not None else body.findall(XS + "choice")
+            for particle in particles:
+                if particle.tag == XS + "choice":
+                    tags.append([e.get("name") or e.get("ref") for e in particle.iter(XS + "element")])
+                elif particle.tag == XS + "element":
+                    tags.append([particle.get("name") or particle.get("ref")])
+            attributes = {a.get("name") for a in body.findall(XS + "attribute")}
+            base = extension.get("base") if extension is not None else None
+            own[complex_type.get("name")] = (base, tags, attributes)
+
+    def resolve(name):
+        base, tags, attributes = own[name]
+        if base is None:
+            return list(tags), set(attributes)
+        base_tags, base_attributes = resolve(base)
+        return base_tags + tags, base_attributes | attributes
+
+    types = {}
+    for name in own:
+        sequence, attributes = resolve(name)
+        positions = {tag: i for i, group in enumerate(sequence) for tag in group}
+        types[name] = (positions, attributes)
+    return types
+
+
+class TestGeneratedSerializers:
+    def test_fields_match_xsd_order(self):
+        import dawproject
+        from dawproject.fieldSpec import XmlModel, model_codec
+
+        types = _xsd_types("Project.xsd", "MetaData.xsd")
+        checked = 0
+        for cls in vars(dawproject).values():
+            if not (isinstance(cls, type) and issubclass(cls, XmlModel)):
+                continue
+            type_name = cls.__name__[0].lower() + cls.__name__[1:]
+            if type_name not in types:
+                continue
+            positions, attributes = types[type_name]
+            codec = model_codec(cls)
+            assert {spec.name for spec in codec.attributes} <= attributes, cls.__name__
+            order = []
+            for spec in codec.children:
+                known = [positions[tag] for tag in spec.tags if tag in positions]
+                assert known, f"{cls.__name__}: {spec.tags} not in the {type_name} sequence"
+                order.append(min(known))
+            assert order == sorted(order), f"{cls.__name__} children are not in XSD order"
+            checked += 1
+        assert checked >= 40
+
+    def test_child_written_with_final_tag(self):
+        compressor = Compressor(attack=0.01, ratio=None)
+        elem = compressor.to_xml()
+
+        assert [child.tag for child in elem] == ["Attack"]
+        assert elem.find("Attack").get("unit") == "seconds"
+        assert RealParameter(value=1.0).to_xml("Volume").tag == "Volume"
+
+    def test_codec_generated_once_per_class(self):
+        from dawproject.fieldSpec import model_codec
+
+        codec = model_codec(Note)
+        assert codec is model_codec(Note)
+        assert "def to_xml" in codec.source and "def from_xml" in codec.source
+        # Each attribute is converted inline, without DoubleAdapter calls
+        assert "a['time'] = str(float(v))" in codec.source
+
+    def test_subclass_field_replaces_base_field(self):
+        elem = ET.fromstring('<Audio id="id0" duration="1.0"><File path="a.wav"/></Audio>')
+        audio = Audio.from_xml(elem)
+
+        assert audio.time_unit == TimeUnit.SECONDS
+        assert audio.sample_rate == 44100
+        assert audio.file.path == "a.wav"